@@ -8,10 +8,15 @@ Orquesta todo el pipeline: download → transcribe → generate clips → resize
 """
 
 import sys
+import argparse
+import mmap
+import re
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
+from types import MappingProxyType
 from dotenv import load_dotenv
+import orjson
 
 # Cargar variables de entorno desde .env
 load_dotenv()
@@ -45,28 +50,37 @@ sys.stderr = io.StringIO()
 # ============================================================================
 
 # Rich para interfaz profesional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
-from rich.prompt import Prompt, Confirm
+from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.text import Text
 from rich import box
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TaskProgressColumn
-from rich.layout import Layout
+from rich.live import Live
 import time
+import threading
+import atexit
+import gc
+from functools import lru_cache
+from operator import itemgetter
+from itertools import islice
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Mis módulos
+# NOTA: Transcriber (WhisperX/torch), ClipsGenerator (ClipsAI/transformers),
+# VideoExporter (OpenCV/MediaPipe), YoutubeDownloader (yt-dlp) y el generador de
+# copies (LangGraph/LangChain) se importan dentro de las funciones que los usan:
+# importarlos aquí cuesta varios segundos de arranque aunque solo se abra el menú
 try:
-    from src.downloader import YoutubeDownloader
-    from src.transcriber import Transcriber
-    from src.clips_generator import ClipsGenerator
-    from src.video_exporter import VideoExporter
-    from src.copys_generator import generate_copys_for_video
     from src.cleanup_manager import CleanupManager
     from src.local_importer import LocalVideoImporter
+    from src.subtitle_generator import SubtitleGenerator
     from src.utils import get_state_manager
     from src.utils.logger import setup_logger
-    from config.content_presets import get_preset, list_presets, get_preset_description
+    from config.content_presets import get_preset, list_presets, get_preset_descriptions
 except ImportError as e:
     print(f"Error importando módulos: {e}")
     print("Ejecuta desde la raíz del proyecto: uv run cliper.py")
@@ -84,23 +98,315 @@ console = Console()
 # Logger global (será inicializado en main())
 logger = None
 
+# Cache de modelos Whisper por tamaño
+# DECISIÓN: cargar pesos de WhisperX tarda segundos, así que reutilizo la instancia
+# El cache guarda Futures (ver _cargar_cacheado): un preload en curso queda
+# registrado y nadie carga el mismo modelo dos veces
+_TRANSCRIBERS: "OrderedDict[str, Future]" = OrderedDict()
+_TRANSCRIBERS_LOCK = threading.Lock()
 
-def mostrar_banner():
+# Máximo de modelos Whisper en memoria a la vez (LRU)
+# medium son ~1.5 GB en GPU/RAM: no quiero los 4 tamaños cargados juntos
+MAX_CACHED_TRANSCRIBERS = 2
+
+
+def _cargar_cacheado(cache: dict, lock: threading.Lock, key, factory, max_items: Optional[int] = None):
     """
-    Banner principal profesional de CLIPER
+    Retorno la instancia cacheada para key, creándola con factory() si falta
+
+    DECISIÓN: El cache guarda un Future por key y la carga corre FUERA del lock
+    - El lock solo protege el dict: nunca se tiene durante una carga de pesos
+      (que puede incluir una descarga de minutos)
+    - Si ya hay una carga en curso para la key (ej. un preload), espero su
+      Future en lugar de cargar dos veces
+    - _liberar_modelos (atexit / inactividad) no queda esperando cargas en curso
+    - Si la carga de otro thread falla, reintento yo (como antes del preload)
+
+    Args:
+        max_items: Tope del cache (LRU, cache tiene que ser OrderedDict)
     """
-    console.clear()
+    while True:
+        with lock:
+            future = cache.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                cache[key] = future
+
+                # Saco el modelo usado hace más tiempo
+                while max_items is not None and len(cache) > max_items:
+                    evicted, _ = cache.popitem(last=False)
+                    if logger:
+                        logger.info(f"Model released (LRU): {evicted}")
+            elif max_items is not None:
+                cache.move_to_end(key)
+
+        if owner:
+            break
+
+        try:
+            return future.result()
+        except Exception:
+            continue  # La carga de otro thread falló: vuelvo a intentar
+
+    try:
+        instance = factory()
+    except BaseException as e:
+        with lock:
+            if cache.get(key) is future:
+                del cache[key]
+        future.set_exception(e)
+        raise
+
+    future.set_result(instance)
+    return instance
+
+
+def _get_transcriber(model_size: str) -> "Transcriber":
+    """
+    Retorno el Transcriber cacheado para model_size (lo creo si no existe)
+
+    Si hay un preload en background para el mismo modelo, espero a que termine
+    en lugar de cargar los pesos otra vez. Funciona como un lru_cache(maxsize=2)
+    pero sin cargas duplicadas en paralelo y vaciable desde _liberar_modelos.
+    """
+    def _crear():
+        from src.transcriber import Transcriber
+        return Transcriber(model_size=model_size)
+
+    return _cargar_cacheado(
+        _TRANSCRIBERS, _TRANSCRIBERS_LOCK, model_size, _crear,
+        max_items=MAX_CACHED_TRANSCRIBERS
+    )
+
+
+# Cache de ClipsGenerator por rango de duración (min, max)
+# ClipFinder carga modelos de embeddings: reutilizo la instancia entre videos
+_CLIPS_GENS: Dict[tuple, Future] = {}
+_CLIPS_GENS_LOCK = threading.Lock()
+
+
+def _get_clips_generator(min_duration: int, max_duration: int) -> "ClipsGenerator":
+    """
+    Retorno el ClipsGenerator cacheado para el rango (lo creo si no existe)
+
+    Igual que _get_transcriber: si hay un preload en curso, espero a que termine
+    """
+    def _crear():
+        from src.clips_generator import ClipsGenerator
+        return ClipsGenerator(
+            min_clip_duration=min_duration,
+            max_clip_duration=max_duration
+        )
+
+    return _cargar_cacheado(_CLIPS_GENS, _CLIPS_GENS_LOCK, (min_duration, max_duration), _crear)
+
+
+@lru_cache(maxsize=1)
+def _get_downloader() -> "YoutubeDownloader":
+    """
+    Retorno el YoutubeDownloader (lo creo e importo yt-dlp la primera vez)
+    """
+    from src.downloader import YoutubeDownloader
+    return YoutubeDownloader()
+
+
+def _liberar_modelos():
+    """
+    Libero los modelos cacheados y la memoria de GPU/MPS
+
+    Se registra con atexit y también corre cuando el usuario queda inactivo
+    en un "Press ENTER" (ver _esperar_enter). Solo toco torch si ya fue
+    importado (no tiene sentido importarlo solo para liberar memoria).
+
+    Los modelos que todavía se están cargando (preload en curso) quedan:
+    no espero a que terminen (salir o quedar inactivo no se bloquea)
+    """
+    for cache, lock in ((_TRANSCRIBERS, _TRANSCRIBERS_LOCK), (_CLIPS_GENS, _CLIPS_GENS_LOCK)):
+        with lock:
+            for key in [key for key, future in cache.items() if future.done()]:
+                del cache[key]
+    gc.collect()
+
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return
+    try:
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        if hasattr(torch, "mps") and torch.backends.mps.is_available():
+            torch.mps.empty_cache()
+    except Exception:
+        pass  # Best effort: si falla, la memoria se libera al salir
+
+
+atexit.register(_liberar_modelos)
 
-    # Banner superior con gradiente visual
-    console.print()
 
+# Segundos de inactividad en un "Press ENTER" antes de liberar los modelos
+MODEL_IDLE_TIMEOUT = 60
+
+
+def _esperar_enter(message: str = "[dim]Press ENTER to return to menu[/dim]"):
+    """
+    Espero ENTER del usuario liberando los modelos si tarda demasiado
+
+    DECISIÓN: Timer en vez de dejar Whisper/ClipsAI ocupando VRAM indefinidamente
+    - Si vuelve rápido, el modelo sigue cacheado (sin recarga)
+    - Si pasan MODEL_IDLE_TIMEOUT segundos, libero caches y memoria GPU/MPS
+
+    En modo --yes retorno al instante
+    """
+    if _ACEPTAR_DEFAULTS:
+        return  # Modo --yes: no hay nadie que presione ENTER
+
+    timer = threading.Timer(MODEL_IDLE_TIMEOUT, _liberar_modelos)
+    timer.daemon = True
+    timer.start()
+    try:
+        Prompt.ask(message, default="")
+    finally:
+        timer.cancel()
+
+
+# Modo --yes: la configuración del export usa los defaults sin preguntar
+# (vertical 9:16, subtítulos abajo con keywords automáticas, todos los clips)
+# y los "Press ENTER" no esperan. El menú y la elección de video siguen
+# pidiendo input: no es un modo headless
+_ACEPTAR_DEFAULTS = False
+
+
+def _preguntar(prompt_cls, message: str, **kwargs):
+    """
+    Pregunto con Prompt/Confirm/IntPrompt, o devuelvo el default en modo --yes
+
+    En modo --yes no se renderiza nada ni se espera input (se acepta el
+    default). Toda pregunta que pase por acá tiene que tener default
+    """
+    if _ACEPTAR_DEFAULTS:
+        return kwargs["default"]
+    return prompt_cls.ask(message, **kwargs)
+
+
+def _parsear_argumentos(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parseo los flags de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        prog="cliper",
+        description="CLIPER - Video Clipper Tool"
+    )
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        help=(
+            "Exportar con la configuración por defecto sin preguntar "
+            "(el menú y la elección de video siguen siendo interactivos)"
+        )
+    )
+    return parser.parse_args(argv)
+
+
+def _preload_transcriber(model_size: str) -> threading.Thread:
+    """
+    Cargo el modelo Whisper en un thread de fondo
+
+    Se usa mientras la descarga (limitada por red) está en curso, para que
+    el modelo ya esté en memoria cuando el usuario elija transcribir.
+    """
+    def _load():
+        try:
+            _get_transcriber(model_size)
+            if logger:
+                logger.info(f"Whisper model preloaded: {model_size}")
+        except Exception as e:
+            # No es crítico: opcion_transcribir_video lo reintenta
+            if logger:
+                logger.warning(f"Whisper preload failed ({model_size}): {e}")
+
+    thread = threading.Thread(target=_load, name=f"preload-whisper-{model_size}", daemon=True)
+    thread.start()
+    return thread
+
+
+def _preload_clips_generator(min_duration: int, max_duration: int) -> threading.Thread:
+    """
+    Cargo ClipsAI (ClipFinder + embeddings) en un thread de fondo
+
+    Se usa mientras Whisper transcribe: el siguiente paso del pipeline
+    (generar clips) encuentra el modelo ya cargado.
+    """
+    def _load():
+        try:
+            _get_clips_generator(min_duration, max_duration)
+            if logger:
+                logger.info(f"ClipsAI preloaded: {min_duration}-{max_duration}s")
+        except Exception as e:
+            # No es crítico: opcion_generar_clips lo reintenta
+            if logger:
+                logger.warning(f"ClipsAI preload failed: {e}")
+
+    thread = threading.Thread(target=_load, name="preload-clipsai", daemon=True)
+    thread.start()
+    return thread
+
+
+# Tamaño de bloque para calentar el page cache leyendo la transcripción
+_PREFETCH_CHUNK = 1024 * 1024
+
+
+def _prefetch_siguiente_video(video_id: str, state_manager) -> Optional[threading.Thread]:
+    """
+    Precargo en background los archivos del video siguiente al actual
+
+    Flujo típico: exporto clips del video A y después proceso el B.
+    Mientras ffmpeg exporta A, le pido al SO que traiga el mp4 de B
+    (posix_fadvise WILLNEED, solo Linux) y leo su transcripción para que
+    quede en el page cache. Best effort: cualquier error se ignora.
+    """
+    videos = escanear_videos()
+    video_ids = [v.video_id for v in videos]
+    if video_id not in video_ids:
+        return None
+
+    next_idx = video_ids.index(video_id) + 1
+    if next_idx >= len(videos):
+        return None
+
+    next_video = videos[next_idx]
+    next_state = state_manager.get_video_state(next_video.video_id) or {}
+    transcript_path = next_state.get('transcript_path') or next_state.get('transcription_path')
+
+    def _prefetch():
+        try:
+            if hasattr(os, "posix_fadvise"):
+                fd = os.open(next_video.path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+
+            if transcript_path and os.path.exists(transcript_path):
+                with open(transcript_path, 'rb') as f:
+                    while f.read(_PREFETCH_CHUNK):
+                        pass
+        except OSError as e:
+            if logger:
+                logger.debug(f"Prefetch of {next_video.filename} skipped: {e}")
+
+    thread = threading.Thread(target=_prefetch, name="prefetch-next-video", daemon=True)
+    thread.start()
+    return thread
+
+
+def _crear_banner() -> Group:
+    """
+    Armo el banner principal profesional de CLIPER (una sola vez)
+    """
     # Título principal con estilo
     title = Text()
     title.append("╔", style="bold cyan")
     title.append("════════════════════════════════════════════════════════════", style="cyan")
     title.append("╗", style="bold cyan")
     title.justify = "center"
-    console.print(title)
 
     logo = Text()
     logo.append("║  ", style="cyan")
@@ -108,14 +414,12 @@ def mostrar_banner():
     logo.append(" | Video Clipper  ", style="bold white")
     logo.append("║", style="cyan")
     logo.justify = "center"
-    console.print(logo)
 
     subtitle = Text()
     subtitle.append("║  ", style="cyan")
     subtitle.append("Transform long videos into viral clips", style="bold yellow")
     subtitle.append("  ║", style="cyan")
     subtitle.justify = "center"
-    console.print(subtitle)
 
     # Línea de separación
     separator = Text()
@@ -123,7 +427,6 @@ def mostrar_banner():
     separator.append("════════════════════════════════════════════════════════════", style="cyan")
     separator.append("╣", style="bold cyan")
     separator.justify = "center"
-    console.print(separator)
 
     # Información
     info = Text()
@@ -137,15 +440,44 @@ def mostrar_banner():
     info.append("CDMX", style="bold yellow")
     info.append("  ║", style="cyan")
     info.justify = "center"
-    console.print(info)
 
     footer_line = Text()
     footer_line.append("╚", style="bold cyan")
     footer_line.append("════════════════════════════════════════════════════════════", style="cyan")
     footer_line.append("╝", style="bold cyan")
     footer_line.justify = "center"
-    console.print(footer_line)
-    console.print()
+
+    return Group(Text(), title, logo, subtitle, separator, info, footer_line, Text())
+
+
+# DECISIÓN: El banner es estático, lo construyo al cargar el módulo
+# mostrar_banner() se llama en cada pantalla; así solo limpia e imprime
+BANNER = _crear_banner()
+
+
+def mostrar_banner():
+    """
+    Banner principal profesional de CLIPER
+    """
+    console.clear()
+    console.print(BANNER)
+
+
+def _crear_goodbye_panel() -> Panel:
+    """Panel de despedida al salir de CLIPER"""
+    goodbye = Text()
+    goodbye.append("\nThank you for using CLIPER!\n", style="bold green")
+    goodbye.append("Keep creating amazing content\n", style="dim")
+    goodbye.justify = "center"
+
+    return Panel(
+        goodbye,
+        title="[bold]Goodbye![/bold]",
+        border_style="cyan"
+    )
+
+
+GOODBYE_PANEL = _crear_goodbye_panel()
 
 
 class OperationProgress:
@@ -165,6 +497,9 @@ class OperationProgress:
         self.max_logs = 12
         self.current_step = 0
         self.start_time = time.time()
+        self._live = None
+        self._finished = False
+        self._dirty = False
 
     def add_log(self, message: str, level: str = "INFO"):
         """Agregar log con timestamp"""
@@ -185,6 +520,7 @@ class OperationProgress:
         self.logs.append(log_text)
         if len(self.logs) > self.max_logs:
             self.logs.pop(0)
+        self._dirty = True
 
     def render_progress_panel(self, current_detail: str = "", time_remaining: str = ""):
         """Renderiza el panel de progress (lado izquierdo)"""
@@ -230,67 +566,445 @@ class OperationProgress:
             padding=(1, 1)
         )
 
-    def show(self, current_detail: str = "", time_remaining: str = ""):
-        """Mostrar layout actual (progress + logs lado a lado)"""
-        console.clear()
-        mostrar_banner()
-
-        # Crear layout de dos columnas
-        layout = Layout()
-        layout.split_row(
-            Layout(name="left", ratio=60),
-            Layout(name="right", ratio=40)
+    def render_layout(self, current_detail: str = "", time_remaining: str = ""):
+        """Combina progress (60%) y logs (40%) en una grilla de dos columnas"""
+        # Table.grid en vez de Layout: Layout ocupa toda la altura de la
+        # terminal y Live lo recortaría debajo del banner
+        grid = Table.grid(expand=True)
+        grid.add_column(ratio=60)
+        grid.add_column(ratio=40)
+        grid.add_row(
+            self.render_progress_panel(current_detail, time_remaining),
+            self.render_logs_panel()
         )
+        return grid
 
-        # Left: Progress
-        layout["left"].update(self.render_progress_panel(current_detail, time_remaining))
+    def show(self, current_detail: str = "", time_remaining: str = ""):
+        """
+        Mostrar layout actual (progress + logs lado a lado)
+
+        DECISIÓN: Live en vez de console.clear() + redibujar todo
+        - El banner se pinta una sola vez al arrancar la operación
+        - Cada update repinta solo la región de progress + logs
+        - Al llegar al 100% detengo Live: el último frame queda en pantalla
+          y los Prompt/Confirm posteriores no compiten con el refresh
+        """
+        if self._live is None:
+            # Operación terminada y sin logs nuevos → el frame final ya está en pantalla
+            if self._finished and not self._dirty:
+                return
+            mostrar_banner()
+            self._live = Live(console=console, auto_refresh=False)
+            self._live.start()
 
-        # Right: Logs
-        layout["right"].update(self.render_logs_panel())
+        self._live.update(self.render_layout(current_detail, time_remaining), refresh=True)
+        self._dirty = False
 
-        console.print(layout)
+        if self.current_step >= self.total_steps:
+            self._live.stop()
+            self._live = None
+            self._finished = True
 
     def update(self, step: int, detail: str = "", time_remaining: str = ""):
         """Actualizar progreso y mostrar"""
         self.current_step = min(step, self.total_steps)
+        self._dirty = True
         self.show(detail, time_remaining)
 
 
-def escanear_videos() -> List[Dict[str, str]]:
+@dataclass(frozen=True, slots=True)
+class VideoRecord:
+    """
+    Un video de downloads/ (lo que necesitan los menús para procesarlo)
+
+    DECISIÓN: dataclass con slots en vez de dict
+    - Sin __dict__ por instancia: mucha menos memoria con bibliotecas grandes
+    - Atributos fijos: un typo (video.flename) falla en vez de dar KeyError tarde
+    - frozen: el cache de escaneo puede compartir las instancias sin copiarlas
+    """
+    filename: str  # "video.mp4"
+    path: str  # "downloads/video.mp4"
+    video_id: str  # ID único basado en nombre: "video_abc123"
+    display_name: str = ""  # Nombre truncado para la tabla (se calcula si no viene)
+
+    def __post_init__(self):
+        if not self.display_name:
+            object.__setattr__(self, "display_name", _truncar(self.filename, 40))
+
+
+# Cache del último escaneo de downloads/
+# Se invalida con el mtime del directorio (cambia al agregar/borrar/renombrar archivos)
+_scan_cache = {"mtime": None, "videos": []}
+
+# Índice en disco del último escaneo (sobrevive entre ejecuciones)
+DOWNLOADS_INDEX_FILE = "temp/downloads_index.json"
+
+
+def _leer_indice_descargas(mtime: int) -> Optional[List[VideoRecord]]:
+    """
+    Leo el índice guardado de downloads/ si corresponde al mtime actual
+
+    Retorno None si no existe, está corrupto o es de otro mtime
+    """
+    try:
+        with open(DOWNLOADS_INDEX_FILE, 'rb') as f:
+            index = orjson.loads(f.read())
+        if index.get("mtime") != mtime:
+            return None
+        return [
+            VideoRecord(filename=v["filename"], path=v["path"], video_id=v["video_id"])
+            for v in index["videos"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Índice faltante o con otra forma: re-escaneo (orjson.JSONDecodeError es ValueError)
+        return None
+
+
+def _guardar_indice_descargas(mtime: int, videos: List[VideoRecord]):
+    """
+    Guardo el escaneo de downloads/ para la próxima ejecución
+
+    DECISIÓN: Escritura atómica (.tmp + os.replace) como el StateManager
+    - Un índice a medio escribir nunca se lee (y si se lee, se re-escanea)
+    - Si falla la escritura no es crítico: la próxima vez escaneo de nuevo
+    """
+    tmp_file = DOWNLOADS_INDEX_FILE + ".tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps({
+                "mtime": mtime,
+                "videos": [
+                    {"filename": v.filename, "path": v.path, "video_id": v.video_id}
+                    for v in videos
+                ]
+            }))
+        os.replace(tmp_file, DOWNLOADS_INDEX_FILE)
+    except OSError:
+        pass
+
+
+def escanear_videos() -> List[VideoRecord]:
     """
     Escaneo la carpeta downloads/ para encontrar videos MP4
 
-    Retorno lista de dicts con info de cada video:
-    [
-        {
-            "filename": "video.mp4",
-            "path": "downloads/video.mp4",
-            "video_id": "video_abc123"  # ID único basado en nombre
-        }
-    ]
+    Retorno una lista de VideoRecord (filename, path, video_id, display_name)
     """
-    downloads_dir = Path("downloads")
+    downloads_dir = "downloads"
 
-    if not downloads_dir.exists():
-        downloads_dir.mkdir(parents=True, exist_ok=True)
+    # Un solo stat: me dice si existe y me da el mtime para el cache
+    try:
+        mtime = os.stat(downloads_dir).st_mtime_ns
+    except FileNotFoundError:
+        os.makedirs(downloads_dir, exist_ok=True)
         return []
 
+    # Si el directorio no cambió desde el último escaneo, reutilizo el resultado
+    if _scan_cache["mtime"] == mtime:
+        return list(_scan_cache["videos"])
+
+    # Al arrancar, el índice en disco me ahorra listar el directorio
+    # (y un stat por archivo en filesystems sin d_type, ej. algunos NFS/SMB)
+    videos = _leer_indice_descargas(mtime)
+    if videos is not None:
+        _scan_cache["mtime"] = mtime
+        _scan_cache["videos"] = videos
+        return list(videos)
+
     # Busco todos los archivos .mp4
-    videos = []
-    for video_file in downloads_dir.glob("*.mp4"):
-        # Genero un ID único para el video (el nombre sin extensión)
-        video_id = video_file.stem  # "AI CDMX Live Stream_gjPVlCHU9OM"
+    # os.scandir en vez de Path.glob: un solo listado del directorio y sin
+    # construir un Path por archivo solo para leer .name/.stem
+    # El video_id es el nombre sin extensión: "AI CDMX Live Stream_gjPVlCHU9OM"
+    with os.scandir(downloads_dir) as entries:
+        videos = [
+            VideoRecord(
+                filename=entry.name,
+                path=entry.path,
+                video_id=entry.name[:-4]
+            )
+            for entry in entries
+            # is_file() usa el tipo que ya trae el DirEntry (sin stat extra)
+            if entry.name.endswith(".mp4") and entry.is_file()
+        ]
 
-        videos.append({
-            "filename": video_file.name,
-            "path": str(video_file),
-            "video_id": video_id
-        })
+    _scan_cache["mtime"] = mtime
+    _scan_cache["videos"] = videos
+    _guardar_indice_descargas(mtime, videos)
 
-    return videos
+    return list(videos)
 
 
-def mostrar_videos_disponibles(videos: List[Dict], state_manager) -> Optional[Table]:
+def _invalidar_escaneo():
+    """
+    Fuerzo el re-escaneo de downloads/ en la próxima llamada a escanear_videos
+
+    Lo llamo cuando sé que agregué/borré un video: en filesystems con mtime
+    de baja resolución (HFS+, FAT: 1-2s) el directorio puede cambiar sin que
+    cambie el mtime y el cache quedaría viejo (en memoria y en disco)
+    """
+    _scan_cache["mtime"] = None
+    try:
+        os.remove(DOWNLOADS_INDEX_FILE)
+    except FileNotFoundError:
+        pass
+
+
+# Token del "end" a nivel segmento en el JSON que escribe Transcriber (indent=2):
+# las keys de cada segmento van con 6 espacios, las de words con 10
+_SEGMENT_END_TOKEN = b'\n      "end": '
+_NUMBER_RE = re.compile(rb'-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?')
+
+
+def _leer_duracion_transcript(transcript_path: str) -> Optional[float]:
+    """
+    Obtengo la duración del video (segments[-1]['end']) sin cargar todo el JSON
+
+    DECISIÓN: mmap + búsqueda inversa del último "end" de segmento
+    - Una transcripción de 2h son varios MB de dicts solo para leer un float
+    - Busco antes de "word_segments" para no confundir ends de palabras
+    - Si el formato no coincide, fallback a parsear todo (orjson)
+    """
+    try:
+        with open(transcript_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                limit = mm.rfind(b'"word_segments"')
+                if limit == -1:
+                    limit = len(mm)
+
+                idx = mm.rfind(_SEGMENT_END_TOKEN, 0, limit)
+                if idx != -1:
+                    start = idx + len(_SEGMENT_END_TOKEN)
+                    match = _NUMBER_RE.match(mm[start:start + 64])
+                    if match:
+                        return float(match.group())
+    except (OSError, ValueError):
+        pass  # Archivo vacío o ilegible: intento el camino lento
+
+    with open(transcript_path, 'rb') as f:
+        segments = orjson.loads(f.read()).get('segments', [])
+
+    return segments[-1].get('end', 0) if segments else None
+
+
+# Markup de status precomputado (evita rearmar strings en cada redraw)
+STATUS_DOWNLOADED = "[yellow]Downloaded[/yellow]"
+STATUS_TRANSCRIBED = "[green]Transcribed ✓[/green]"
+
+
+def _truncar(text: str, max_len: int) -> str:
+    """Trunco text a max_len caracteres (con "..." al final si se corta)"""
+    return text if len(text) <= max_len else text[:max_len - 3] + "..."
+
+
+def _formatear_rango(start: float, end: float) -> str:
+    """Formateo un rango de tiempo como MM:SS - MM:SS"""
+    start_min, start_sec = divmod(int(start), 60)
+    end_min, end_sec = divmod(int(end), 60)
+    return f"{start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}"
+
+
+def _status_video(state: Optional[Dict]) -> str:
+    """
+    Retorno el markup de status de un video según su progreso
+    """
+    if not state:
+        return STATUS_DOWNLOADED
+
+    num_clips = len(state['clips']) if state['clips_generated'] else None
+    return _status_markup(state['transcribed'], num_clips)
+
+
+@lru_cache(maxsize=256)
+def _status_markup(transcribed: bool, num_clips: Optional[int]) -> str:
+    """
+    Markup de status para (transcrito, número de clips o None si no hay)
+
+    Cacheado: en cada redraw del menú la mayoría de los videos repiten
+    la misma combinación, así que el f-string se arma una vez por combinación
+    """
+    if num_clips is not None:
+        clips_status = f"[green]{num_clips} clips[/green]"
+        return f"{STATUS_TRANSCRIBED} | {clips_status}" if transcribed else clips_status
+
+    return STATUS_TRANSCRIBED if transcribed else STATUS_DOWNLOADED
+
+
+# Tablas de opciones estáticas de los menús (se arman una sola vez al cargar)
+# DECISIÓN: Rich puede re-renderizar la misma Table cuantas veces quiera,
+# no hace falta reconstruirla en cada visita al menú
+def _tabla_opciones(rows, number_width: Optional[int] = None) -> Table:
+    """Armo una tabla de opciones (número, nombre, descripción) sin bordes"""
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column(style="cyan", width=number_width)
+    table.add_column(style="white")
+    table.add_column(style="dim")
+
+    for row in rows:
+        table.add_row(*row)
+
+    return table
+
+
+_MODEL_OPTIONS_TABLE = _tabla_opciones((
+    ("1", "tiny", "Fastest - ~1min for 1hr video"),
+    ("2", "base", "Balanced - ~5min for 1hr video"),
+    ("3", "small", "Accurate - ~10min for 1hr video"),
+    ("4", "medium", "Very accurate - ~20min for 1hr video"),
+    ("5", "Volver al menú anterior", ""),
+))
+
+_DURATION_OPTIONS_ROWS = (
+    ("1", "Short clips", "30-60s (TikTok/Shorts)"),
+    ("2", "Medium clips", "30-90s (Reels/Stories)"),
+    ("3", "Long clips", "60-180s (YouTube)"),
+)
+
+_ASPECT_OPTIONS_TABLE = _tabla_opciones((
+    ("1", "Original", "Mantener relación original (usualmente 16:9)"),
+    ("2", "Vertical (9:16)", "Para TikTok, Reels, Shorts"),
+    ("3", "Cuadrado (1:1)", "Para posts de Instagram"),
+    ("4", "Volver al menú anterior", ""),
+))
+
+_STYLE_OPTIONS_TABLE = _tabla_opciones((
+    ("1", "Bottom", "Waist level (default)"),
+    ("2", "Middle", "Center of frame"),
+    ("3", "Very High", "Top of frame"),
+    ("4", "Volver al menú anterior", ""),
+))
+
+
+# Presets de contenido: CONTENT_PRESETS es estático, así que las keys (en orden
+# de menú) y la tabla de selección se arman una vez al cargar el módulo
+PRESET_KEYS = tuple(list_presets())
+PRESET_VOLVER_OPTION = len(PRESET_KEYS) + 1
+_PRESET_DESCRIPTIONS = get_preset_descriptions()
+
+_PRESETS_TABLE = _tabla_opciones(
+    tuple(
+        (str(idx), name, _PRESET_DESCRIPTIONS[key])
+        for idx, (key, name) in enumerate(list_presets().items(), 1)
+    ) + ((str(PRESET_VOLVER_OPTION), "Volver al menú anterior", ""),),
+    number_width=6
+)
+
+
+# Mapeo de nombres comunes a códigos ISO (WhisperX espera códigos ISO)
+# MappingProxyType: de solo lectura, nadie lo modifica por accidente
+LANGUAGE_MAP = MappingProxyType({
+    "spanish": "es",
+    "español": "es",
+    "english": "en",
+    "inglés": "en",
+    "portuguese": "pt",
+    "português": "pt",
+    "french": "fr",
+    "francés": "fr",
+    "german": "de",
+    "alemán": "de",
+    "italian": "it",
+    "italiano": "it",
+    "auto": None
+})
+
+
+# Modelos para copies: opción del menú → nombre del modelo
+GEMINI_MODEL_MAP = MappingProxyType({
+    "1": "gemini-2.5-flash",
+    "2": "gemini-1.5-pro",
+})
+CLAUDE_DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
+
+_LLM_OPTIONS_TABLE = _tabla_opciones((
+    ("1", "Gemini", "Default - requires GOOGLE_API_KEY"),
+    ("2", "Claude", "Alternative - requires ANTHROPIC_API_KEY"),
+    ("3", "Volver al menú anterior", ""),
+))
+
+_GEMINI_OPTIONS_TABLE = _tabla_opciones((
+    ("1", "Gemini 2.5 Flash", "Faster (recommended)"),
+    ("2", "Gemini 1.5 Pro", "More capable"),
+    ("3", "Volver al menú anterior", ""),
+))
+
+# Estilos en los que el clasificador agrupa los clips (orden de la distribución)
+COPY_STYLES = ("viral", "educational", "storytelling")
+
+
+# Opciones del export: opción del menú → valor que espera VideoExporter
+ASPECT_MAP = MappingProxyType({
+    "1": None,      # Original
+    "2": "9:16",    # Vertical
+    "3": "1:1"      # Square
+})
+SUBTITLE_STYLE_MAP = MappingProxyType({
+    "1": "bottom",
+    "2": "middle",
+    "3": "very_high"
+})
+LOGO_POSITION_MAP = MappingProxyType({
+    "1": "top-left",
+    "2": "top-right",
+    "3": "bottom-left",
+    "4": "bottom-right"
+})
+LOGO_SCALE_MAP = MappingProxyType({
+    "1": 0.07,
+    "2": 0.10
+})
+
+_LOGO_POSITION_TABLE = _tabla_opciones((
+    ("1", "Top Left (default)", "Adjusted for TikTok"),
+    ("2", "Top Right", "Classic corner"),
+    ("3", "Bottom Left", "Footer position"),
+    ("4", "Bottom Right", "Footer corner"),
+    ("5", "Volver al menú anterior", ""),
+))
+
+_LOGO_SIZE_TABLE = _tabla_opciones((
+    ("1", "Medium", "7% of frame height (default)"),
+    ("2", "Large", "10% of frame height"),
+))
+
+# Variantes del menú de edición de la configuración (sin opción "Volver")
+_ASPECT_EDIT_TABLE = _tabla_opciones((
+    ("1", "Original", "16:9 o según fuente"),
+    ("2", "Vertical", "9:16 (TikTok, Reels, Shorts)"),
+    ("3", "Cuadrado", "1:1 (Instagram)"),
+))
+
+_LOGO_POSITION_EDIT_TABLE = _tabla_opciones((
+    ("1", "Top Left (default, TikTok adjusted)"),
+    ("2", "Top Right"),
+    ("3", "Bottom Left"),
+    ("4", "Bottom Right"),
+))
+
+_LOGO_SIZE_EDIT_TABLE = _tabla_opciones((
+    ("1", "Medium (7%)"),
+    ("2", "Large (10%)"),
+))
+
+_STYLE_EDIT_TABLE = _tabla_opciones((
+    ("1", "Bottom - 8px yellow, waist level"),
+    ("2", "Middle - 8px yellow, center frame"),
+    ("3", "Very High - 8px yellow, top frame"),
+))
+
+
+def _duration_options_table(suggested_min: int, suggested_max: int) -> Table:
+    """
+    Tabla de duración de clips
+
+    La fila "Custom" depende del preset, así que esta sí se arma por llamada
+    (las filas fijas vienen de _DURATION_OPTIONS_ROWS)
+    """
+    return _tabla_opciones(_DURATION_OPTIONS_ROWS + (
+        ("4", "Custom", f"Use preset: {suggested_min}-{suggested_max}s"),
+        ("5", "Volver al menú anterior", ""),
+    ))
+
+
+def mostrar_videos_disponibles(videos: List[VideoRecord], state_manager) -> Optional[Table]:
     """
     Muestro una tabla con los videos disponibles y su estado
 
@@ -311,51 +1025,33 @@ def mostrar_videos_disponibles(videos: List[Dict], state_manager) -> Optional[Ta
     table.add_column("Video Name", style="white")
     table.add_column("Status", style="green")
 
-    # Agrego cada video a la tabla
-    for idx, video in enumerate(videos, 1):
-        video_id = video['video_id']
-
-        # Obtengo el estado del video
-        state = state_manager.get_video_state(video_id)
-
-        if state:
-            # Construyo el status basado en el progreso
-            status_parts = []
-            if state['transcribed']:
-                status_parts.append("[green]Transcribed ✓[/green]")
-            if state['clips_generated']:
-                status_parts.append(f"[green]{len(state['clips'])} clips[/green]")
-
-            if not status_parts:
-                status = "[yellow]Downloaded[/yellow]"
-            else:
-                status = " | ".join(status_parts)
-        else:
-            status = "[yellow]Downloaded[/yellow]"
-
-        # Nombre corto (trunco si es muy largo)
-        display_name = video['filename']
-        if len(display_name) > 40:
-            display_name = display_name[:37] + "..."
-
-        table.add_row(str(idx), display_name, status)
+    # Obtengo el estado de todos los videos de una vez
+    # get_all_videos retorna el dict en memoria (sin leer disco ni copiar):
+    # indexarlo directo evita armar la lista de IDs y un sub-dict por render
+    states = state_manager.get_all_videos()
+
+    # Construyo todas las filas de una vez y luego las agrego
+    rows = [
+        (
+            str(idx),
+            video.display_name,
+            _status_video(states.get(video.video_id))
+        )
+        for idx, video in enumerate(videos, 1)
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     return table
 
 
-def menu_principal(videos: List[Dict], state_manager) -> str:
-    """
-    Muestro el menú principal y retorno la opción elegida
+def _crear_menu_principal(rows) -> tuple:
     """
-    # Si hay videos, muestro la tabla
-    if videos:
-        console.print("[bold]Available Videos:[/bold]\n")
-        table = mostrar_videos_disponibles(videos, state_manager)
-        if table:
-            console.print(table)
-            console.print()
+    Armo el panel del menú principal y sus opciones válidas
 
-    # Creo el menú mejorado
+    Returns:
+        (Panel, lista de opciones para Prompt.ask)
+    """
     menu_table = Table(
         show_header=False,
         box=box.ROUNDED,
@@ -367,28 +1063,53 @@ def menu_principal(videos: List[Dict], state_manager) -> str:
     menu_table.add_column("Opción", style="bold white", width=25)
     menu_table.add_column("Descripción", style="dim")
 
-    if videos:
-        menu_table.add_row("[bold cyan][1][/bold cyan]", "Procesar un video", "Transcribir, clips, copys, exportar")
-        menu_table.add_row("[bold cyan][2][/bold cyan]", "Agregar video", "YouTube o descargar desde ~/Downloads")
-        menu_table.add_row("[bold cyan][3][/bold cyan]", "Limpiar proyecto", "Liberar espacio y limpiar cache")
-        menu_table.add_row("[bold cyan][4][/bold cyan]", "Pipeline completo", "Automatizar todo el flujo")
-        menu_table.add_row("[bold red][5][/bold red]", "Salir", "Cerrar CLIPER")
-        opciones = ["1", "2", "3", "4", "5"]
-    else:
-        menu_table.add_row("[bold cyan][1][/bold cyan]", "Agregar video", "YouTube o descargar desde ~/Downloads")
-        menu_table.add_row("[bold cyan][2][/bold cyan]", "Limpiar proyecto", "Liberar espacio y limpiar cache")
-        menu_table.add_row("[bold red][3][/bold red]", "Salir", "Cerrar CLIPER")
-        opciones = ["1", "2", "3"]
-
-    # Nota: El último número siempre es "Salir" en menú principal
-    # Esta es la única excepción (no es "Volver" porque es el nivel más alto)
+    # La última fila es "Salir" (en rojo)
+    for idx, (nombre, descripcion) in enumerate(rows, 1):
+        color = "red" if idx == len(rows) else "cyan"
+        menu_table.add_row(f"[bold {color}][{idx}][/bold {color}]", nombre, descripcion)
 
-    console.print(Panel(
+    panel = Panel(
         menu_table,
         title="[bold cyan]━━ MENÚ PRINCIPAL ━━[/bold cyan]",
         border_style="cyan",
         padding=(1, 1)
-    ))
+    )
+    return panel, [str(idx) for idx in range(1, len(rows) + 1)]
+
+
+# Los dos menús principales posibles (con y sin videos) son estáticos
+_MENU_CON_VIDEOS = _crear_menu_principal((
+    ("Procesar un video", "Transcribir, clips, copys, exportar"),
+    ("Agregar video", "YouTube o descargar desde ~/Downloads"),
+    ("Limpiar proyecto", "Liberar espacio y limpiar cache"),
+    ("Pipeline completo", "Automatizar todo el flujo"),
+    ("Salir", "Cerrar CLIPER"),
+))
+
+_MENU_SIN_VIDEOS = _crear_menu_principal((
+    ("Agregar video", "YouTube o descargar desde ~/Downloads"),
+    ("Limpiar proyecto", "Liberar espacio y limpiar cache"),
+    ("Salir", "Cerrar CLIPER"),
+))
+
+
+def menu_principal(videos: List[VideoRecord], state_manager) -> str:
+    """
+    Muestro el menú principal y retorno la opción elegida
+    """
+    # Si hay videos, muestro la tabla
+    if videos:
+        console.print("[bold]Available Videos:[/bold]\n")
+        table = mostrar_videos_disponibles(videos, state_manager)
+        if table:
+            console.print(table)
+            console.print()
+
+    # Nota: El último número siempre es "Salir" en menú principal
+    # Esta es la única excepción (no es "Volver" porque es el nivel más alto)
+    menu_panel, opciones = _MENU_CON_VIDEOS if videos else _MENU_SIN_VIDEOS
+
+    console.print(menu_panel)
     console.print()
 
     opcion = Prompt.ask(
@@ -400,11 +1121,10 @@ def menu_principal(videos: List[Dict], state_manager) -> str:
     return opcion
 
 
-def opcion_agregar_video(downloader, state_manager):
+def opcion_agregar_video(state_manager):
     """
     Agrega un video al proyecto desde YouTube o carpeta local (~/Downloads/)
     """
-    console.clear()
     mostrar_banner()
 
     console.print(Panel(
@@ -432,27 +1152,137 @@ def opcion_agregar_video(downloader, state_manager):
     )
 
     if opcion == "1":
+        try:
+            downloader = _get_downloader()
+        except ImportError as e:
+            console.print(Panel(
+                f"[red]YouTube downloader no disponible: {e}[/red]\n\n"
+                "Instala las dependencias con: uv sync",
+                border_style="red"
+            ))
+            Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
+            return
         _agregar_video_youtube(downloader, state_manager)
     elif opcion == "2":
         _agregar_video_local(state_manager)
     # opcion == "3": volver (solo return)
 
 
+def _parsear_urls(url_input: str) -> List[str]:
+    """
+    Convierto el input del usuario en una lista de URLs
+
+    Acepta URLs separadas por espacios, comas o saltos de línea, y tokens
+    "@archivo.txt" (una URL por línea, "#" para comentarios, como el
+    batch file de yt-dlp). Elimino duplicados conservando el orden.
+    """
+    urls = []
+    for token in re.split(r'[\s,]+', url_input.strip()):
+        if not token:
+            continue
+
+        if token.startswith("@"):
+            batch_file = Path(token[1:]).expanduser()
+            with open(batch_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        urls.append(line)
+        else:
+            urls.append(token)
+
+    return list(dict.fromkeys(urls))
+
+
+def _descargar_videos_en_paralelo(downloader, state_manager, urls: List[str], content_type: str, preset: Dict):
+    """
+    Descargo varias URLs en paralelo y registro cada video al terminar
+
+    El registro en el state manager ocurre en el thread principal
+    (download_many hace yield a medida que cada descarga termina).
+    """
+    # src.downloader ya está cargado (el downloader se creó antes de llegar acá)
+    from src.downloader import MAX_CONCURRENT_DOWNLOADS
+
+    console.print()
+    max_workers = max(1, IntPrompt.ask(
+        "[cyan]Descargas simultáneas[/cyan]",
+        default=MAX_CONCURRENT_DOWNLOADS
+    ))
+
+    console.print()
+
+    downloaded = []
+    failed = []
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        tasks = {
+            url: progress.add_task(f"[cyan]{url}[/cyan]", total=1)
+            for url in urls
+        }
+
+        # Un solo guardado del state para todo el lote de descargas
+        with state_manager.batch():
+            for url, path in downloader.download_many(urls, quality="best", max_workers=max_workers):
+                if path:
+                    video_file = Path(path)
+                    state_manager.register_video(
+                        video_file.stem,
+                        video_file.name,
+                        content_type=content_type,
+                        preset=preset
+                    )
+                    _invalidar_escaneo()
+                    downloaded.append(video_file.name)
+                    progress.update(tasks[url], completed=1, description=f"[green]✓ {video_file.name}[/green]")
+                else:
+                    failed.append(url)
+                    progress.update(tasks[url], completed=1, description=f"[red]✗ {url}[/red]")
+
+    console.print()
+    summary = f"[green]✓ Descargados: {len(downloaded)}/{len(urls)}[/green]"
+    if failed:
+        summary += "\n\n[red]Fallaron:[/red]\n" + "\n".join(f"  • {url}" for url in failed)
+
+    console.print(Panel(
+        summary,
+        title="[bold green]Descarga múltiple[/bold green]" if not failed else "[bold yellow]Descarga múltiple[/bold yellow]",
+        border_style="green" if not failed else "yellow"
+    ))
+
+    if logger:
+        logger.info(f"Batch download finished: {len(downloaded)} ok, {len(failed)} failed")
+
+
 def _agregar_video_youtube(downloader, state_manager):
     """
-    Descargo un nuevo video de YouTube
+    Descargo uno o varios videos de YouTube
+
+    Con varias URLs (o un archivo @lista.txt) las descargas corren en paralelo.
     """
     console.print()
 
     console.print(Panel(
-        "[bold]Descargar de YouTube[/bold]\nProporciona la URL del video",
+        "[bold]Descargar de YouTube[/bold]\nProporciona la URL del video\n"
+        "[dim]Varias URLs separadas por coma/espacio, o @archivo.txt con una por línea[/dim]",
         border_style="cyan"
     ))
     console.print()
 
-    url = Prompt.ask("[cyan]URL de YouTube[/cyan]").strip()
+    url_input = Prompt.ask("[cyan]URL de YouTube[/cyan]").strip()
 
-    if not url:
+    try:
+        urls = _parsear_urls(url_input)
+    except OSError as e:
+        console.print(f"[red]Error leyendo archivo de URLs: {e}[/red]")
+        Prompt.ask("\n[dim]Press ENTER to continue[/dim]", default="")
+        return
+
+    if not urls:
         console.print("[red]Error: No URL provided[/red]")
         Prompt.ask("\n[dim]Press ENTER to continue[/dim]", default="")
         return
@@ -462,40 +1292,34 @@ def _agregar_video_youtube(downloader, state_manager):
     console.print("[bold]Content Type[/bold]")
     console.print("[dim]This helps optimize transcription and clip generation[/dim]\n")
 
-    presets = list_presets()
-    presets_table = Table(show_header=False, box=None, padding=(0, 2))
-    presets_table.add_column(style="cyan", width=6)
-    presets_table.add_column(style="white")
-    presets_table.add_column(style="dim")
-
-    preset_keys = list(presets.keys())
-    for idx, (key, name) in enumerate(presets.items(), 1):
-        description = get_preset_description(key)
-        presets_table.add_row(str(idx), name, description)
-
-    # Agregar opción de volver
-    volver_option = len(presets) + 1
-    presets_table.add_row(str(volver_option), "Volver al menú anterior", "")
-
-    console.print(presets_table)
+    console.print(_PRESETS_TABLE)
     console.print()
 
     content_choice = Prompt.ask(
         "[cyan]Selecciona tipo de contenido[/cyan]",
-        choices=[str(i) for i in range(1, volver_option + 1)],
+        choices=[str(i) for i in range(1, PRESET_VOLVER_OPTION + 1)],
         default="3"  # Livestream es común
     )
 
     # Si elige volver
-    if int(content_choice) == volver_option:
+    if int(content_choice) == PRESET_VOLVER_OPTION:
         return
 
-    content_type = preset_keys[int(content_choice) - 1]
+    content_type = PRESET_KEYS[int(content_choice) - 1]
     preset = get_preset(content_type)
 
-    console.print(f"\n[green]✓ Seleccionado:[/green] {presets[content_type]}")
+    console.print(f"\n[green]✓ Seleccionado:[/green] {list_presets()[content_type]}")
     console.print(f"[dim]{preset['use_case']}[/dim]")
 
+    # Varias URLs: descarga en paralelo (sin ofrecer transcripción individual)
+    if len(urls) > 1:
+        _descargar_videos_en_paralelo(downloader, state_manager, urls, content_type, preset)
+        console.print()
+        Prompt.ask("[dim]Presiona ENTER para volver[/dim]", default="")
+        return
+
+    url = urls[0]
+
     console.print()
 
     try:
@@ -513,6 +1337,11 @@ def _agregar_video_youtube(downloader, state_manager):
         progress.add_log("Starting download", "PROGRESS")
         progress.update(35, "Downloading...")
 
+        # Mientras descarga, cargo el modelo Whisper sugerido por el preset
+        suggested_model = preset.get('transcription', {}).get('model_size', 'base')
+        _preload_transcriber(suggested_model)
+        progress.add_log(f"Preloading Whisper model ({suggested_model}) in background", "INFO")
+
         path = downloader.download(url, quality="best")
 
         if path:
@@ -520,18 +1349,22 @@ def _agregar_video_youtube(downloader, state_manager):
             progress.update(90, "Processing metadata...")
 
             # Registro el video en el state manager con metadata de contenido
+            # Leo name/stem una sola vez y armo el dict del video acá mismo
             video_file = Path(path)
+            filename = video_file.name
             video_id = video_file.stem
+            video_dict = VideoRecord(filename=filename, path=path, video_id=video_id)
 
-            progress.add_log(f"Registering video: {video_file.name}", "PROGRESS")
+            progress.add_log(f"Registering video: {filename}", "PROGRESS")
             progress.update(95, "Registering in state...")
 
             state_manager.register_video(
                 video_id,
-                video_file.name,
+                filename,
                 content_type=content_type,  # Guardamos el tipo de contenido
                 preset=preset  # Y el preset completo
             )
+            _invalidar_escaneo()
 
             progress.add_log("Video registered successfully", "SUCCESS")
             progress.update(100, "Complete! ✓")
@@ -540,7 +1373,7 @@ def _agregar_video_youtube(downloader, state_manager):
             console.print()
             console.print(Panel(
                 f"[green]✓ Video descargado exitosamente[/green]\n\n"
-                f"Archivo: {video_file.name}\n"
+                f"Archivo: {filename}\n"
                 f"Ubicación: {path}",
                 title="[bold green]Éxito[/bold green]",
                 border_style="green"
@@ -549,12 +1382,6 @@ def _agregar_video_youtube(downloader, state_manager):
             # Pregunto si quiere continuar con transcripción
             console.print()
             if Confirm.ask("[cyan]¿Deseas transcribir este video ahora?[/cyan]"):
-                # Creo el dict de video para pasarlo a la función
-                video_dict = {
-                    'filename': video_file.name,
-                    'path': path,
-                    'video_id': video_id
-                }
                 opcion_transcribir_video(video_dict, state_manager)
                 return  # Retorno para que no pida ENTER dos veces
         else:
@@ -655,6 +1482,7 @@ def _agregar_video_local(state_manager):
         result = importer.import_video(selected_video['path'], state_manager)
 
     if result:
+        _invalidar_escaneo()
         video_file = Path(result)
         video_id = video_file.stem
 
@@ -669,11 +1497,7 @@ def _agregar_video_local(state_manager):
         # Pregunto si quiere transcribir
         console.print()
         if Confirm.ask("[cyan]¿Deseas transcribir este video ahora?[/cyan]"):
-            video_dict = {
-                'filename': video_file.name,
-                'path': result,
-                'video_id': video_id
-            }
+            video_dict = VideoRecord(filename=video_file.name, path=result, video_id=video_id)
             opcion_transcribir_video(video_dict, state_manager)
             return
     else:
@@ -687,18 +1511,17 @@ def _agregar_video_local(state_manager):
     Prompt.ask("[dim]Presiona ENTER para volver[/dim]", default="")
 
 
-def opcion_procesar_video(videos: List[Dict], state_manager):
+def opcion_procesar_video(videos: List[VideoRecord], state_manager):
     """
     Proceso un video existente (transcribir, generar clips, etc.)
     """
-    console.clear()
     mostrar_banner()
 
     console.print("[bold]Selecciona un video para procesar:[/bold]\n")
 
     # Muestro los videos numerados
     for idx, video in enumerate(videos, 1):
-        console.print(f"  {idx}. {video['filename']}")
+        console.print(f"  {idx}. {video.filename}")
 
     console.print()
 
@@ -719,23 +1542,16 @@ def opcion_procesar_video(videos: List[Dict], state_manager):
         return
 
     video_seleccionado = videos[int(seleccion) - 1]
-    video_id = video_seleccionado['video_id']
+    video_id = video_seleccionado.video_id
 
     # Loop infinito para refrescar el menu después de cada acción
     while True:
         # Obtengo el estado del video (refrescado en cada iteración)
         state = state_manager.get_video_state(video_id)
 
-        # Limpio la pantalla y muestro banner
-        console.clear()
-        mostrar_banner()
-
-        # Muestro opciones según el estado
-        console.print(f"\n[bold]Procesando: {video_seleccionado['filename']}[/bold]\n")
-
         # Muestro el estado actual
+        status_parts = []
         if state:
-            status_parts = []
             if state['transcribed']:
                 status_parts.append("[green]✓ Transcrito[/green]")
             if state['clips_generated']:
@@ -746,81 +1562,53 @@ def opcion_procesar_video(videos: List[Dict], state_manager):
                 aspect = state.get('export_aspect_ratio', 'original')
                 status_parts.append(f"[green]✓ {num_exported} clips exportados ({aspect})[/green]")
 
-            if status_parts:
-                console.print("Estado: " + " | ".join(status_parts))
-                console.print()
-
-        # Creo menú de acciones disponibles
-        actions_table = Table(show_header=False, box=box.ROUNDED, border_style="cyan", padding=(0, 2))
-        actions_table.add_column("Opción", style="bold cyan", width=8)
-        actions_table.add_column("Descripción", style="white")
-
-        actions = []
-
-        if state and state['transcribed']:
-            actions.append(("1", "Re-transcribir video"))
-            actions.append(("2", "Generar/Regenerar clips"))
-
-            # Si ya tengo clips, ofrezco más opciones
-            if state.get('clips_generated', False):
-                actions.append(("3", "Generar copys IA (clasificación + subtítulos)"))
-                actions.append(("4", "Exportar clips a archivos de video"))
-
+        # Elijo la tabla de acciones según la etapa del video (ver _ACCIONES_*)
+        if not state or not state['transcribed']:
+            actions = _ACCIONES_SIN_TRANSCRIBIR
+        elif state.get('clips_generated', False):
+            actions = _ACCIONES_CON_CLIPS
         else:
-            actions.append(("1", "Transcribir video"))
+            actions = _ACCIONES_TRANSCRITO
 
-        # PATRÓN: Último número siempre es "Volver al menú anterior"
-        next_option_num = len(actions) + 1
-        actions.append((str(next_option_num), "Volver al menú anterior"))
-
-        for option, desc in actions:
-            actions_table.add_row(option, desc)
+        # DECISIÓN: Sin Live aquí. El loop termina en un Prompt.ask y cada acción
+        # pinta su propia pantalla, así que al volver siempre hay que redibujar.
+        # Lo que sí evito es reconstruir la tabla (estática) y escribir la
+        # pantalla en varios pedazos: encabezado + estado + menú van en un solo print
+        header = [Text.from_markup(f"\n[bold]Procesando: {video_seleccionado.filename}[/bold]\n")]
+        if status_parts:
+            header += [Text.from_markup("Estado: " + " | ".join(status_parts)), Text()]
 
-        console.print(actions_table)
-        console.print()
+        # Limpio la pantalla y muestro banner
+        mostrar_banner()
+        console.print(Group(*header, _TABLAS_ACCIONES[actions], Text()))
 
-        choices = [opt for opt, _ in actions]
+        # PATRÓN: Último número siempre es "Volver al menú anterior"
+        volver_option = actions[-1][0]
         action = Prompt.ask(
             "[bold cyan]Elige una acción[/bold cyan]",
-            choices=choices,
-            default=str(next_option_num)  # Default = volver
+            choices=_OPCIONES_ACCIONES[actions],
+            default=volver_option  # Default = volver
         )
 
         # Validar si es "Volver"
-        if action == str(next_option_num):
+        if action == volver_option:
             break  # Salir del loop y volver al menú anterior
 
-        # Ejecuto la acción elegida
-        if state and state['transcribed']:
-            if action == "1":
-                opcion_transcribir_video(video_seleccionado, state_manager)
-            elif action == "2":
-                opcion_generar_clips(video_seleccionado, state_manager)
-            elif action == "3":
-                if state['clips_generated']:
-                    opcion_generar_copies(video_seleccionado, state_manager)
-            elif action == "4":
-                if state['clips_generated']:
-                    opcion_exportar_clips(video_seleccionado, state_manager)
-            # El loop continúa para refrescar el menú
-        else:
-            if action == "1":
-                opcion_transcribir_video(video_seleccionado, state_manager)
-            # El loop continúa para refrescar el menú
+        # Ejecuto la acción elegida y el loop continúa para refrescar el menú
+        _DISPATCH_ACCIONES[actions][action](video_seleccionado, state_manager)
 
 
-def opcion_transcribir_video(video: Dict, state_manager):
+def opcion_transcribir_video(video: VideoRecord, state_manager):
     """
     Transcribo un video usando WhisperX
 
     Este es el paso clave que convierte el audio en texto con timestamps.
     Estos timestamps me permiten después detectar dónde cortar los clips.
     """
-    console.clear()
     mostrar_banner()
 
-    video_path = video['path']
-    video_id = video['video_id']
+    video_path = video.path
+    video_id = video.video_id
 
     # Obtengo el preset si existe
     state = state_manager.get_video_state(video_id)
@@ -836,7 +1624,7 @@ def opcion_transcribir_video(video: Dict, state_manager):
 
     console.print(Panel(
         f"[bold]Transcribe Video[/bold]\n\n"
-        f"Video: {video['filename']}\n"
+        f"Video: {video.filename}\n"
         f"Content Type: {content_type.title()}\n"
         f"Using: WhisperX (optimized for Apple Silicon)",
         border_style="cyan"
@@ -847,104 +1635,89 @@ def opcion_transcribir_video(video: Dict, state_manager):
     console.print("[bold]Transcription Settings:[/bold]")
     console.print(f"[dim]Suggested for {content_type}: {suggested_model}[/dim]\n")
 
-    # Selección de modelo
-    model_options = Table(show_header=False, box=None, padding=(0, 2))
-    model_options.add_column(style="cyan")
-    model_options.add_column(style="white")
-    model_options.add_column(style="dim")
-
-    model_options.add_row("1", "tiny", "Fastest - ~1min for 1hr video")
-    model_options.add_row("2", "base", "Balanced - ~5min for 1hr video")
-    model_options.add_row("3", "small", "Accurate - ~10min for 1hr video")
-    model_options.add_row("4", "medium", "Very accurate - ~20min for 1hr video")
-    model_options.add_row("5", "Volver al menú anterior", "")
-
-    console.print(model_options)
-    console.print()
-
-    # Mapeo de modelo a opción numérica (para el default)
-    model_to_option = {
-        "tiny": "1",
-        "base": "2",
-        "small": "3",
-        "medium": "4"
-    }
-    default_option = model_to_option.get(suggested_model, "2")  # Default a "base" (opción 2)
-
-    model_choice = Prompt.ask(
-        "[cyan]Tamaño del modelo[/cyan]",
-        choices=["1", "2", "3", "4", "5"],
-        default=default_option
-    )
-
-    # Si elige volver
-    if model_choice == "5":
-        return
-
-    # Mapeo de opción numérica a modelo
+    # Mapeo de opción numérica a modelo (y al revés, para el default)
     option_to_model = {
         "1": "tiny",
         "2": "base",
         "3": "small",
         "4": "medium"
     }
-    model_size = option_to_model[model_choice]
-
-    # Idioma
-    console.print()
-    language = Prompt.ask(
-        "[cyan]Language (or 'auto' to detect)[/cyan]",
-        default="auto"
-    )
+    model_to_option = {model: option for option, model in option_to_model.items()}
+    default_option = model_to_option.get(suggested_model, "2")  # Default a "base" (opción 2)
 
-    # Mapeo de nombres comunes a códigos ISO (WhisperX espera códigos ISO)
-    LANGUAGE_MAP = {
-        "spanish": "es",
-        "español": "es",
-        "english": "en",
-        "inglés": "en",
-        "portuguese": "pt",
-        "português": "pt",
-        "french": "fr",
-        "francés": "fr",
-        "german": "de",
-        "alemán": "de",
-        "italian": "it",
-        "italiano": "it",
-        "auto": None
-    }
+    console.print("[yellow]⚠️  Transcription will take several minutes depending on video length[/yellow]")
+    console.print("[dim]You can see the progress in the terminal[/dim]\n")
 
-    # Normalizar idioma
-    lang_lower = language.lower().strip()
-    if lang_lower in LANGUAGE_MAP:
-        language = LANGUAGE_MAP[lang_lower]
-    elif lang_lower == "auto":
+    # DECISIÓN: Modo rápido - casi siempre acepto lo sugerido por el preset,
+    # así que un solo Enter arranca con el modelo sugerido + idioma auto
+    # (en vez de modelo → idioma → confirmar). Si digo que no, pregunto todo
+    if Confirm.ask(
+        f"[cyan]Start now with suggested settings ({option_to_model[default_option]}, auto language)?[/cyan]",
+        default=True
+    ):
+        model_size = option_to_model[default_option]
         language = None  # WhisperX auto-detecta
+    else:
+        # Selección de modelo
+        console.print()
+        console.print(_MODEL_OPTIONS_TABLE)
+        console.print()
 
-    console.print()
-    console.print("[yellow]⚠️  Transcription will take several minutes depending on video length[/yellow]")
-    console.print("[dim]You can see the progress in the terminal[/dim]\n")
+        model_choice = Prompt.ask(
+            "[cyan]Tamaño del modelo[/cyan]",
+            choices=["1", "2", "3", "4", "5"],
+            default=default_option
+        )
 
-    if not Confirm.ask("[cyan]Start transcription?[/cyan]", default=True):
-        console.print("[yellow]Cancelled[/yellow]")
-        Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
-        return
+        # Si elige volver
+        if model_choice == "5":
+            return
+
+        model_size = option_to_model[model_choice]
+
+        # Idioma
+        console.print()
+        language = Prompt.ask(
+            "[cyan]Language (or 'auto' to detect)[/cyan]",
+            default="auto"
+        )
+
+        # Normalizar idioma ("auto" → None: WhisperX auto-detecta)
+        lang_lower = language.lower().strip()
+        if lang_lower in LANGUAGE_MAP:
+            language = LANGUAGE_MAP[lang_lower]
+
+        console.print()
+        if not Confirm.ask("[cyan]Start transcription?[/cyan]", default=True):
+            console.print("[yellow]Cancelled[/yellow]")
+            Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
+            return
 
     try:
         # Progress tracker para transcripción
         progress = OperationProgress("Transcribing with WhisperX", total_steps=100)
-        progress.add_log(f"Video: {video['filename']}", "INFO")
+        progress.add_log(f"Video: {video.filename}", "INFO")
         progress.add_log(f"Model size: {model_size}", "INFO")
         progress.update(5, "Loading model...")
 
         # Creo el transcriber
         progress.add_log("Initializing Whisper model...", "PROGRESS")
         progress.update(10, "Loading Whisper model...")
-        transcriber = Transcriber(model_size=model_size)
+        transcriber = _get_transcriber(model_size)
 
         progress.add_log(f"Model loaded: {model_size}", "SUCCESS")
         progress.update(20, "Model loaded")
 
+        # DECISIÓN: ClipsAI necesita la transcripción completa (TextTiling sobre
+        # todo el texto), así que no puedo alimentarlo segmento a segmento.
+        # Lo que sí solapo es su carga: mientras Whisper usa GPU/CPU, cargo
+        # ClipsAI con la duración sugerida por el preset (la opción default)
+        clips_config = preset.get('clips', {})
+        _preload_clips_generator(
+            clips_config.get('min_duration', 30),
+            clips_config.get('max_duration', 90)
+        )
+
         # Transcribo
         progress.add_log("Starting transcription...", "PROGRESS")
         progress.update(25, "Transcribing audio...")
@@ -959,16 +1732,21 @@ def opcion_transcribir_video(video: Dict, state_manager):
             progress.add_log("Transcription complete", "SUCCESS")
             progress.update(80, "Processing results...")
 
-            # Actualizo el estado
-            progress.add_log("Updating state manager...", "PROGRESS")
-            progress.update(85, "Saving state...")
-            state_manager.mark_transcribed(video_id, transcript_path)
-
             # Obtengo resumen de la transcripción
+            # (ya trae la duración: no vuelvo a leer el JSON para eso)
             progress.add_log("Generating summary...", "PROGRESS")
-            progress.update(90, "Generating summary...")
+            progress.update(85, "Generating summary...")
             summary = transcriber.get_transcript_summary(transcript_path)
 
+            # Actualizo el estado
+            progress.add_log("Updating state manager...", "PROGRESS")
+            progress.update(90, "Saving state...")
+            state_manager.mark_transcribed(
+                video_id,
+                transcript_path,
+                duration=summary['total_duration'] if summary else None
+            )
+
             progress.add_log(f"Summary: {summary['num_segments']} segments, {summary['total_words']} words", "SUCCESS")
             progress.update(100, "Complete! ✓")
             progress.show()
@@ -1012,21 +1790,85 @@ def opcion_transcribir_video(video: Dict, state_manager):
         console.print(f"\n[red]Error: {e}[/red]")
 
     console.print()
-    Prompt.ask("[dim]Press ENTER to return to menu[/dim]", default="")
+    _esperar_enter()
+
+
+# Máximo de clips por default (alto para videos largos: livestreams, conferencias)
+DEFAULT_MAX_CLIPS = 100
+
+
+def _mostrar_estimado_clips(state: Dict, transcript_path: Optional[str], max_duration: int):
+    """
+    Muestro la duración del video y cuántos clips de max_duration salen aprox.
+
+    La duración queda guardada en el state al transcribir; solo leo el JSON
+    para transcripciones viejas que no la tienen
+    """
+    try:
+        total_duration = state.get('transcript_duration') or _leer_duracion_transcript(transcript_path)
+        if total_duration:
+            estimated_clips = int(total_duration / max_duration)
+
+            console.print()
+            console.print(f"[dim]Video duration: {total_duration/60:.1f} minutes[/dim]")
+            console.print(f"[dim]Estimated clips with {max_duration}s duration: ~{estimated_clips}[/dim]")
+    except (OSError, ValueError, TypeError, AttributeError):
+        # Si falla, no es crítico: transcripción faltante (OSError, o TypeError si
+        # no hay ruta), JSON inválido (orjson.JSONDecodeError es ValueError) o
+        # con otra forma. Ctrl-C ya no queda tragado por un except pelado
+        pass
+
+
+# Filas del preview de clips que muestro después de generarlos
+CLIPS_PREVIEW_ROWS = 10
+
+
+def _preview_clips(clips: List[Dict]) -> Group:
+    """
+    Armo el preview de los clips generados (encabezado + tabla + "... and N more")
+
+    DECISIÓN: Un solo renderable en vez de Live con add_row incremental
+    - generate_clips devuelve la lista completa (ClipsAI no produce clips de a uno)
+    - La tabla tiene como máximo CLIPS_PREVIEW_ROWS filas: armarla es instantáneo
+    - Un único console.print pinta todo de una vez, sin parpadeo ni refresh
+    """
+    clips_table = Table(
+        show_header=True,
+        header_style="bold cyan",
+        box=box.ROUNDED,
+        border_style="cyan"
+    )
+
+    clips_table.add_column("#", style="cyan", width=4)
+    clips_table.add_column("Duration", style="white", width=10)
+    clips_table.add_column("Time Range", style="dim", width=15)
+    clips_table.add_column("Preview", style="white")
+
+    for clip in clips[:CLIPS_PREVIEW_ROWS]:
+        clips_table.add_row(
+            str(clip['clip_id']),
+            f"{clip['duration']:.1f}s",
+            _formatear_rango(clip['start_time'], clip['end_time']),
+            _truncar(clip['text_preview'], 50)  # Preview (trunco si es muy largo)
+        )
+
+    partes = [Text("Generated Clips:", style="bold"), Text(), clips_table]
+    if len(clips) > CLIPS_PREVIEW_ROWS:
+        partes += [Text(), Text(f"... and {len(clips) - CLIPS_PREVIEW_ROWS} more clips", style="dim")]
+    return Group(*partes)
 
 
-def opcion_generar_clips(video: Dict, state_manager):
+def opcion_generar_clips(video: VideoRecord, state_manager):
     """
     Genero clips automáticamente detectando cambios de tema
 
     Este es el paso donde ClipsAI analiza la transcripción y detecta
     los mejores puntos de corte para crear clips virales.
     """
-    console.clear()
     mostrar_banner()
 
-    video_path = video['path']
-    video_id = video['video_id']
+    video_path = video.path
+    video_id = video.video_id
 
     # Verifico que tenga transcripción
     state = state_manager.get_video_state(video_id)
@@ -1055,7 +1897,7 @@ def opcion_generar_clips(video: Dict, state_manager):
 
     console.print(Panel(
         f"[bold]Generate Clips[/bold]\n\n"
-        f"Video: {video['filename']}\n"
+        f"Video: {video.filename}\n"
         f"Content Type: {content_type.title()}\n"
         f"Using: ClipsAI (AI-powered clip detection)",
         border_style="cyan"
@@ -1074,83 +1916,70 @@ def opcion_generar_clips(video: Dict, state_manager):
     else:
         suggested_choice = "3"
 
-    # Duración de clips
-    duration_options = Table(show_header=False, box=None, padding=(0, 2))
-    duration_options.add_column(style="cyan")
-    duration_options.add_column(style="white")
-    duration_options.add_column(style="dim")
-
-    duration_options.add_row("1", "Short clips", "30-60s (TikTok/Shorts)")
-    duration_options.add_row("2", "Medium clips", "30-90s (Reels/Stories)")
-    duration_options.add_row("3", "Long clips", "60-180s (YouTube)")
-    duration_options.add_row("4", "Custom", f"Use preset: {suggested_min}-{suggested_max}s")
-    duration_options.add_row("5", "Volver al menú anterior", "")
+    # Estimado con la duración sugerida (para decidir el modo rápido)
+    _mostrar_estimado_clips(state, transcript_path, suggested_max)
 
-    console.print(duration_options)
     console.print()
+    console.print("[yellow]⚠️  Clip generation uses AI and may take 1-2 minutes[/yellow]")
+    console.print("[dim]ClipsAI will analyze the transcript and detect topic changes[/dim]\n")
 
-    duration_choice = Prompt.ask(
-        "[cyan]Preset de duración de clips[/cyan]",
-        choices=["1", "2", "3", "4", "5"],
-        default="4"  # Default usa el preset del content type
-    )
-
-    # Si elige volver
-    if duration_choice == "5":
-        return
-
-    # Mapeo de presets
-    duration_presets = {
-        "1": (30, 60),   # Short
-        "2": (30, 90),   # Medium
-        "3": (60, 180),  # Long
-        "4": (suggested_min, suggested_max)  # Del content type
-        # "5": Volver (manejado arriba)
-    }
+    # Modo rápido (igual que en transcribir): un Enter acepta la duración del
+    # preset y el máximo de clips default; si no, pregunto cada opción
+    if Confirm.ask(
+        f"[cyan]Start now with suggested settings "
+        f"({suggested_min}-{suggested_max}s clips, up to {DEFAULT_MAX_CLIPS})?[/cyan]",
+        default=True
+    ):
+        min_duration, max_duration = suggested_min, suggested_max
+        max_clips = DEFAULT_MAX_CLIPS
+    else:
+        # Duración de clips
+        console.print()
+        console.print(_duration_options_table(suggested_min, suggested_max))
+        console.print()
 
-    min_duration, max_duration = duration_presets[duration_choice]
+        duration_choice = Prompt.ask(
+            "[cyan]Preset de duración de clips[/cyan]",
+            choices=["1", "2", "3", "4", "5"],
+            default="4"  # Default usa el preset del content type
+        )
 
-    # Calculo estimado de clips (basado en la transcripción)
-    try:
-        import json
-        with open(transcript_path, 'r') as f:
-            transcript_data = json.load(f)
-            segments = transcript_data.get('segments', [])
-            if segments:
-                total_duration = segments[-1].get('end', 0)
-                estimated_clips = int(total_duration / max_duration)
+        # Si elige volver
+        if duration_choice == "5":
+            return
 
-                console.print()
-                console.print(f"[dim]Video duration: {total_duration/60:.1f} minutes[/dim]")
-                console.print(f"[dim]Estimated clips with {max_duration}s duration: ~{estimated_clips}[/dim]")
-    except:
-        pass  # Si falla, no es crítico
+        # Mapeo de presets
+        duration_presets = {
+            "1": (30, 60),   # Short
+            "2": (30, 90),   # Medium
+            "3": (60, 180),  # Long
+            "4": (suggested_min, suggested_max)  # Del content type
+            # "5": Volver (manejado arriba)
+        }
 
-    # Número de clips
-    console.print()
-    num_clips = Prompt.ask(
-        "[cyan]Maximum number of clips to generate[/cyan]",
-        default="100"  # Aumentado para videos largos (livestreams, conferencias)
-    )
+        min_duration, max_duration = duration_presets[duration_choice]
 
-    try:
-        max_clips = int(num_clips)
-    except ValueError:
-        max_clips = 10
+        if max_duration != suggested_max:
+            _mostrar_estimado_clips(state, transcript_path, max_duration)
 
-    console.print()
-    console.print("[yellow]⚠️  Clip generation uses AI and may take 1-2 minutes[/yellow]")
-    console.print("[dim]ClipsAI will analyze the transcript and detect topic changes[/dim]\n")
+        # Número de clips
+        console.print()
+        # IntPrompt valida y vuelve a preguntar si no es un número
+        max_clips = IntPrompt.ask(
+            "[cyan]Maximum number of clips to generate[/cyan]",
+            default=DEFAULT_MAX_CLIPS
+        )
 
-    if not Confirm.ask("[cyan]Start clip generation?[/cyan]", default=True):
-        console.print("[yellow]Cancelled[/yellow]")
-        Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
-        return
+        console.print()
+        if not Confirm.ask("[cyan]Start clip generation?[/cyan]", default=True):
+            console.print("[yellow]Cancelled[/yellow]")
+            Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
+            return
 
     try:
         # Progress tracker para clip generation
         progress = OperationProgress("Generating clips with ClipsAI", total_steps=100)
-        progress.add_log(f"Video: {video['filename']}", "INFO")
+        progress.add_log(f"Video: {video.filename}", "INFO")
         progress.add_log(f"Duration range: {min_duration}-{max_duration}s", "INFO")
         progress.add_log(f"Max clips: {max_clips}", "INFO")
         progress.update(5, "Initializing...")
@@ -1159,10 +1988,7 @@ def opcion_generar_clips(video: Dict, state_manager):
         progress.add_log("Initializing ClipsAI engine...", "PROGRESS")
         progress.update(10, "Loading ClipsAI...")
 
-        clips_gen = ClipsGenerator(
-            min_clip_duration=min_duration,
-            max_clip_duration=max_duration
-        )
+        clips_gen = _get_clips_generator(min_duration, max_duration)
 
         progress.add_log("ClipsAI loaded successfully", "SUCCESS")
         progress.update(15, "ClipsAI ready")
@@ -1202,56 +2028,21 @@ def opcion_generar_clips(video: Dict, state_manager):
             progress.update(100, "Complete! ✓")
             progress.show()
 
+            # Panel de éxito + preview de los clips en un solo print
             console.print()
-            console.print(Panel(
-                f"[green]✓ Clips generated successfully![/green]\n\n"
-                f"Number of clips: {len(clips)}\n"
-                f"Duration range: {min_duration}s - {max_duration}s\n\n"
-                f"Metadata saved to: {clips_metadata_path}",
-                title="[bold green]Success[/bold green]",
-                border_style="green"
+            console.print(Group(
+                Panel(
+                    f"[green]✓ Clips generated successfully![/green]\n\n"
+                    f"Number of clips: {len(clips)}\n"
+                    f"Duration range: {min_duration}s - {max_duration}s\n\n"
+                    f"Metadata saved to: {clips_metadata_path}",
+                    title="[bold green]Success[/bold green]",
+                    border_style="green"
+                ),
+                Text(),
+                _preview_clips(clips)
             ))
 
-            # Muestro preview de los clips
-            console.print()
-            console.print("[bold]Generated Clips:[/bold]\n")
-
-            clips_table = Table(
-                show_header=True,
-                header_style="bold cyan",
-                box=box.ROUNDED,
-                border_style="cyan"
-            )
-
-            clips_table.add_column("#", style="cyan", width=4)
-            clips_table.add_column("Duration", style="white", width=10)
-            clips_table.add_column("Time Range", style="dim", width=15)
-            clips_table.add_column("Preview", style="white")
-
-            for clip in clips[:10]:  # Muestro máximo 10 en la tabla
-                clip_id = clip['clip_id']
-                duration = f"{clip['duration']:.1f}s"
-                start = clip['start_time']
-                end = clip['end_time']
-                time_range = f"{int(start//60):02d}:{int(start%60):02d} - {int(end//60):02d}:{int(end%60):02d}"
-
-                # Preview (trunco si es muy largo)
-                preview = clip['text_preview']
-                if len(preview) > 50:
-                    preview = preview[:47] + "..."
-
-                clips_table.add_row(
-                    str(clip_id),
-                    duration,
-                    time_range,
-                    preview
-                )
-
-            console.print(clips_table)
-
-            if len(clips) > 10:
-                console.print(f"\n[dim]... and {len(clips) - 10} more clips[/dim]")
-
         else:
             progress.add_log("Clip generation failed - no clips detected", "ERROR")
             progress.update(100, "Failed ✗")
@@ -1280,20 +2071,43 @@ def opcion_generar_clips(video: Dict, state_manager):
         console.print("[dim]Check the logs for more details[/dim]")
 
     console.print()
-    Prompt.ask("[dim]Press ENTER to return to menu[/dim]", default="")
+    _esperar_enter()
+
+
+# Marcas en los logs del generador de copies → nivel en el panel de logs
+# El orden es la prioridad: si un log trae varias marcas gana la primera
+_LOG_LEVEL_MARKS = (
+    ("❌", "ERROR"),
+    ("Error", "ERROR"),
+    ("⚠️", "WARNING"),
+    ("✅", "SUCCESS"),
+)
+_LOG_MARK_RE = re.compile("|".join(re.escape(mark) for mark, _ in _LOG_LEVEL_MARKS))
+
+
+def _nivel_log_copies(log_msg: str) -> str:
+    """
+    Determino el nivel de un log del generador de copies según su contenido
+
+    Una sola pasada de regex por log en vez de hasta 4 búsquedas con `in`
+    """
+    found = set(_LOG_MARK_RE.findall(log_msg))
+    for mark, level in _LOG_LEVEL_MARKS:
+        if mark in found:
+            return level
+    return "PROGRESS"
 
 
-def opcion_generar_copies(video: Dict, state_manager):
+def opcion_generar_copies(video: VideoRecord, state_manager):
     """
     Genero copies automáticamente usando LangGraph + Gemini
 
     Este paso clasifica cada clip automáticamente (viral/educational/storytelling)
     y genera el caption optimizado para cada uno usando AI.
     """
-    console.clear()
     mostrar_banner()
 
-    video_id = video['video_id']
+    video_id = video.video_id
 
     # Verifico que tenga clips generados
     state = state_manager.get_video_state(video_id)
@@ -1307,11 +2121,23 @@ def opcion_generar_copies(video: Dict, state_manager):
         Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
         return
 
+    # Import diferido: LangGraph + LangChain solo se cargan si genero copies
+    try:
+        from src.copys_generator import generate_copys_for_video
+    except ImportError as e:
+        console.print(Panel(
+            f"[red]Generador de copies no disponible: {e}[/red]\n\n"
+            "Instala las dependencias con: uv sync",
+            border_style="red"
+        ))
+        Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
+        return
+
     clips = state.get('clips', [])
 
     console.print(Panel(
         f"[bold]Generate AI Copies[/bold]\n\n"
-        f"Video: {video['filename']}\n"
+        f"Video: {video.filename}\n"
         f"Clips: {len(clips)}\n\n"
         f"This will:\n"
         f"  1. Auto-classify each clip (viral/educational/storytelling)\n"
@@ -1324,16 +2150,7 @@ def opcion_generar_copies(video: Dict, state_manager):
     # ========== CHOOSE LLM PROVIDER (Gemini vs Claude) FIRST ==========
     console.print()
     console.print("[bold]Select LLM Provider:[/bold]\n")
-    llm_options = Table(show_header=False, box=None, padding=(0, 2))
-    llm_options.add_column(style="cyan")
-    llm_options.add_column(style="white")
-    llm_options.add_column(style="dim")
-
-    llm_options.add_row("1", "Gemini", "Default - requires GOOGLE_API_KEY")
-    llm_options.add_row("2", "Claude", "Alternative - requires ANTHROPIC_API_KEY")
-    llm_options.add_row("3", "Volver al menú anterior", "")
-
-    console.print(llm_options)
+    console.print(_LLM_OPTIONS_TABLE)
     console.print()
 
     llm_choice = Prompt.ask(
@@ -1352,16 +2169,7 @@ def opcion_generar_copies(video: Dict, state_manager):
     if llm_provider == "gemini":
         console.print()
         console.print("[bold]Select Gemini Model:[/bold]\n")
-        gemini_options = Table(show_header=False, box=None, padding=(0, 2))
-        gemini_options.add_column(style="cyan")
-        gemini_options.add_column(style="white")
-        gemini_options.add_column(style="dim")
-
-        gemini_options.add_row("1", "Gemini 2.5 Flash", "Faster (recommended)")
-        gemini_options.add_row("2", "Gemini 1.5 Pro", "More capable")
-        gemini_options.add_row("3", "Volver al menú anterior", "")
-
-        console.print(gemini_options)
+        console.print(_GEMINI_OPTIONS_TABLE)
         console.print()
 
         model_choice = Prompt.ask(
@@ -1374,14 +2182,10 @@ def opcion_generar_copies(video: Dict, state_manager):
         if model_choice == "3":
             return
 
-        model_map = {
-            "1": "gemini-2.5-flash",
-            "2": "gemini-1.5-pro"
-        }
-        model = model_map[model_choice]
+        model = GEMINI_MODEL_MAP[model_choice]
     else:
         # Claude: usa el modelo default
-        model = "claude-3-5-sonnet-20241022"
+        model = CLAUDE_DEFAULT_MODEL
 
     console.print()
     api_key_warning = "GOOGLE_API_KEY" if llm_provider == "gemini" else "ANTHROPIC_API_KEY"
@@ -1397,7 +2201,7 @@ def opcion_generar_copies(video: Dict, state_manager):
         # Progress tracker para copy generation
         llm_display_name = llm_provider.capitalize()
         progress = OperationProgress(f"Generating AI copies with LangGraph + {llm_display_name}", total_steps=100)
-        progress.add_log(f"Video: {video['filename']}", "INFO")
+        progress.add_log(f"Video: {video.filename}", "INFO")
         progress.add_log(f"Model: {model}", "INFO")
         progress.add_log(f"LLM Provider: {llm_display_name}", "INFO")
         progress.update(5, "Initializing LangGraph pipeline...")
@@ -1419,17 +2223,8 @@ def opcion_generar_copies(video: Dict, state_manager):
         )
 
         # Integrar logs del resultado en el progress
-        if result.get('logs'):
-            for log_msg in result['logs']:
-                # Determinar el nivel basado en el contenido del log
-                if '❌' in log_msg or 'Error' in log_msg:
-                    progress.add_log(log_msg, "ERROR")
-                elif '⚠️' in log_msg:
-                    progress.add_log(log_msg, "WARNING")
-                elif '✅' in log_msg:
-                    progress.add_log(log_msg, "SUCCESS")
-                else:
-                    progress.add_log(log_msg, "PROGRESS")
+        for log_msg in result.get('logs') or ():
+            progress.add_log(log_msg, _nivel_log_copies(log_msg))
 
         console.print()
 
@@ -1446,26 +2241,34 @@ def opcion_generar_copies(video: Dict, state_manager):
                 progress.add_log("Partial success - some copies failed validation", "WARNING")
                 title_text = "[bold yellow]Partial Success[/bold yellow]"
                 border_color = "yellow"
-                status_line = f"[yellow]⚠️  Generación parcial: {total_generated}/{total_classified} copies[/yellow]"
+                status_line = Text(f"⚠️  Generación parcial: {total_generated}/{total_classified} copies", style="yellow")
             else:
                 title_text = "[bold green]Success[/bold green]"
                 border_color = "green"
-                status_line = f"[green]✓ AI copies generated successfully![/green]"
+                status_line = Text("✓ AI copies generated successfully!", style="green")
 
             progress.update(100, "Complete! ✓")
             progress.show()
 
+            # DECISIÓN: Text.assemble en vez de f-string con markup
+            # - Rich no re-parsea markup del cuerpo del panel
+            # - Rutas con "[...]" (ej. títulos de YouTube) se muestran tal cual
+            metrics = result['metrics']
+            distribution = "\n".join(
+                f"  • {style.capitalize()}: {count} clips"
+                for style, count in metrics['distribution'].items()
+            )
+
             console.print()
             console.print(Panel(
-                f"{status_line}\n\n"
-                f"Total copies: {total_generated}\n"
-                f"Engagement score: {result['metrics']['average_engagement']}/10\n"
-                f"Viral potential: {result['metrics']['average_viral_potential']}/10\n\n"
-                f"Distribution:\n"
-                f"  • Viral: {result['metrics']['distribution']['viral']} clips\n"
-                f"  • Educational: {result['metrics']['distribution']['educational']} clips\n"
-                f"  • Storytelling: {result['metrics']['distribution']['storytelling']} clips\n\n"
-                f"Saved to: {result['output_file']}",
+                Text.assemble(
+                    status_line, "\n\n",
+                    f"Total copies: {total_generated}\n",
+                    f"Engagement score: {metrics['average_engagement']}/10\n",
+                    f"Viral potential: {metrics['average_viral_potential']}/10\n\n",
+                    "Distribution:\n", distribution, "\n\n",
+                    f"Saved to: {result['output_file']}"
+                ),
                 title=title_text,
                 border_style=border_color
             ))
@@ -1477,15 +2280,20 @@ def opcion_generar_copies(video: Dict, state_manager):
 
             console.print()
             api_key_name = "GOOGLE_API_KEY" if llm_provider == "gemini" else "ANTHROPIC_API_KEY"
+            possible_causes = (
+                f"{api_key_name} not set",
+                "Model not available with your API key",
+                "API quota exceeded",
+                "Network issues",
+            )
             console.print(Panel(
-                f"[red]Copy generation failed[/red]\n\n"
-                f"Error: {result.get('error', 'Unknown error')}\n\n"
-                f"Check the logs above for details.\n\n"
-                f"Possible causes:\n"
-                f"• {api_key_name} not set\n"
-                f"• Model not available with your API key\n"
-                f"• API quota exceeded\n"
-                f"• Network issues",
+                Text.assemble(
+                    ("Copy generation failed", "red"), "\n\n",
+                    f"Error: {result.get('error', 'Unknown error')}\n\n",
+                    "Check the logs above for details.\n\n",
+                    "Possible causes:\n",
+                    "\n".join(f"• {cause}" for cause in possible_causes)
+                ),
                 border_style="red"
             ))
 
@@ -1507,10 +2315,10 @@ def opcion_generar_copies(video: Dict, state_manager):
             logger.exception(f"Exception during copy generation: {e}")
 
     console.print()
-    Prompt.ask("[dim]Press ENTER to return to menu[/dim]", default="")
+    _esperar_enter()
 
 
-def opcion_exportar_clips(video: Dict, state_manager):
+def opcion_exportar_clips(video: VideoRecord, state_manager):
     """
     Exporto los clips a archivos de video físicos usando ffmpeg
 
@@ -1519,11 +2327,10 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
     Si existen clasificaciones (clips_copys.json), pregunta si organizar por estilo.
     """
-    console.clear()
     mostrar_banner()
 
-    video_path = video['path']
-    video_id = video['video_id']
+    video_path = video.path
+    video_id = video.video_id
 
     # Verifico que tenga clips generados
     state = state_manager.get_video_state(video_id)
@@ -1534,7 +2341,7 @@ def opcion_exportar_clips(video: Dict, state_manager):
             "You need to generate clips first before exporting.",
             border_style="red"
         ))
-        Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
+        _esperar_enter("\n[dim]Press ENTER to return[/dim]")
         return
 
     clips = state.get('clips', [])
@@ -1544,50 +2351,53 @@ def opcion_exportar_clips(video: Dict, state_manager):
             "[red]Error: No clips found[/red]",
             border_style="red"
         ))
-        Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
+        _esperar_enter("\n[dim]Press ENTER to return[/dim]")
         return
 
     # Verificar si existen clasificaciones
-    copys_file = Path("output") / video_id / "copys" / "clips_copys.json"
-    has_classifications = copys_file.exists()
+    # open() directo en vez de exists() + open(): un solo acceso al filesystem
+    # y sin carrera si el archivo desaparece entre los dos
+    copys_file = os.path.join("output", video_id, "copys", "clips_copys.json")
     clip_styles = None
     organize_by_style = False
 
-    if has_classifications:
-        # Cargar clasificaciones
-        try:
-            import json
-            with open(copys_file, 'r', encoding='utf-8') as f:
-                copys_data = json.load(f)
-
-            # Extraer clasificaciones de clips
-            classifications = copys_data.get('classification_metadata', {}).get('classifications', [])
-
-            if classifications:
-                clip_styles = {c['clip_id']: c['style'] for c in classifications}
-
-                # Mostrar distribución
-                distribution = copys_data.get('classification_metadata', {}).get('distribution', {})
-                viral_count = distribution.get('viral', 0)
-                educational_count = distribution.get('educational', 0)
-                storytelling_count = distribution.get('storytelling', 0)
-
-                console.print(Panel(
-                    f"[green]✓ Clips already classified![/green]\n\n"
-                    f"Distribution:\n"
-                    f"  • Viral: {viral_count} clips\n"
-                    f"  • Educational: {educational_count} clips\n"
-                    f"  • Storytelling: {storytelling_count} clips",
-                    title="[bold green]Auto-Classification Detected[/bold green]",
-                    border_style="green"
-                ))
-                console.print()
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not load classifications: {e}[/yellow]\n")
+    # Cargar clasificaciones (si ya se generaron copies)
+    try:
+        # Solo necesito classification_metadata: me quedo con ese sub-dict y
+        # suelto el resto (los textos de los copies) antes del export con FFmpeg
+        with open(copys_file, 'rb') as f:
+            classification_metadata = orjson.loads(f.read()).get('classification_metadata', {})
+
+        # Extraer clasificaciones de clips
+        classifications = classification_metadata.get('classifications', [])
+
+        if classifications:
+            # itemgetter extrae (clip_id, style) en C por cada clasificación
+            clip_styles = dict(map(itemgetter('clip_id', 'style'), classifications))
+
+            # Mostrar distribución (una línea por estilo, 0 si no hay clips)
+            distribution = classification_metadata.get('distribution', {})
+            distribution_lines = "\n".join(
+                f"  • {style.capitalize()}: {distribution.get(style, 0)} clips"
+                for style in COPY_STYLES
+            )
+
+            console.print(Panel(
+                f"[green]✓ Clips already classified![/green]\n\n"
+                f"Distribution:\n"
+                f"{distribution_lines}",
+                title="[bold green]Auto-Classification Detected[/bold green]",
+                border_style="green"
+            ))
+            console.print()
+    except FileNotFoundError:
+        pass  # Sin copies todavía: exporto sin organizar por estilo
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not load classifications: {e}[/yellow]\n")
 
     console.print(Panel(
         f"[bold]Export Clips to Video Files[/bold]\n\n"
-        f"Video: {video['filename']}\n"
+        f"Video: {video.filename}\n"
         f"Clips to export: {len(clips)}\n"
         f"Using: ffmpeg (optimized cutting)",
         border_style="cyan"
@@ -1597,20 +2407,11 @@ def opcion_exportar_clips(video: Dict, state_manager):
     # Pregunto por aspect ratio
     console.print("[bold]Export Settings:[/bold]\n")
 
-    aspect_options = Table(show_header=False, box=None, padding=(0, 2))
-    aspect_options.add_column(style="cyan")
-    aspect_options.add_column(style="white")
-    aspect_options.add_column(style="dim")
-
-    aspect_options.add_row("1", "Original", "Mantener relación original (usualmente 16:9)")
-    aspect_options.add_row("2", "Vertical (9:16)", "Para TikTok, Reels, Shorts")
-    aspect_options.add_row("3", "Cuadrado (1:1)", "Para posts de Instagram")
-    aspect_options.add_row("4", "Volver al menú anterior", "")
-
-    console.print(aspect_options)
+    console.print(_ASPECT_OPTIONS_TABLE)
     console.print()
 
-    aspect_choice = Prompt.ask(
+    aspect_choice = _preguntar(
+        Prompt,
         "[cyan]Relación de aspecto[/cyan]",
         choices=["1", "2", "3", "4"],
         default="2"  # Default: vertical para redes sociales
@@ -1620,14 +2421,7 @@ def opcion_exportar_clips(video: Dict, state_manager):
     if aspect_choice == "4":
         return
 
-    # Mapeo de aspect ratios
-    aspect_map = {
-        "1": None,      # Original
-        "2": "9:16",    # Vertical
-        "3": "1:1"      # Square
-    }
-
-    aspect_ratio = aspect_map[aspect_choice]
+    aspect_ratio = ASPECT_MAP[aspect_choice]
 
     # PASO 3: Face tracking configuration
     enable_face_tracking = False
@@ -1636,7 +2430,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
     if aspect_ratio == "9:16":  # Solo relevante para videos verticales
         console.print()
-        enable_face_tracking = Confirm.ask(
+        enable_face_tracking = _preguntar(
+            Confirm,
             "[cyan]Enable intelligent face tracking for dynamic reframing?[/cyan]",
             default=False
         )
@@ -1647,7 +2442,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
             console.print("  [cyan]2.[/cyan] centered - Always center on face (can be jittery)")
             console.print("  [cyan]3.[/cyan] Volver al menú anterior")
 
-            style_choice = Prompt.ask(
+            style_choice = _preguntar(
+                Prompt,
                 "\n[cyan]Choice[/cyan]",
                 choices=["1", "2", "3"],
                 default="1"
@@ -1661,21 +2457,18 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
             # Advanced settings (opcional)
             console.print()
-            advanced = Confirm.ask(
+            advanced = _preguntar(
+                Confirm,
                 "[dim]Configure advanced settings (frame sampling)?[/dim]",
                 default=False
             )
 
             if advanced:
-                sample_rate_input = Prompt.ask(
+                face_tracking_sample_rate = _preguntar(
+                    IntPrompt,
                     "Frame sample rate (process every N frames)",
-                    default="3"
+                    default=3
                 )
-                try:
-                    face_tracking_sample_rate = int(sample_rate_input)
-                except ValueError:
-                    console.print("[yellow]Invalid input, using default: 3[/yellow]")
-                    face_tracking_sample_rate = 3
 
             # Visual confirmation
             console.print()
@@ -1685,7 +2478,7 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
     # --- Branding (Logo Only) ---
     console.print()
-    add_logo = Confirm.ask("[cyan]Add logo overlay to clips?[/cyan]", default=False)
+    add_logo = _preguntar(Confirm, "[cyan]Add logo overlay to clips?[/cyan]", default=False)
 
     logo_path = "assets/logo.png"
     logo_position = "top-left"  # Changed default from top-right to top-left
@@ -1694,7 +2487,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
     if add_logo:
         console.print(f"[green]✓[/green] Logo overlay enabled.")
 
-        advanced_branding = Confirm.ask(
+        advanced_branding = _preguntar(
+            Confirm,
             "\n[dim]Configure logo selection, position & size?[/dim]",
             default=False
         )
@@ -1720,7 +2514,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
                 console.print(logo_table)
                 console.print()
 
-                logo_choice = Prompt.ask(
+                logo_choice = _preguntar(
+                    Prompt,
                     "[cyan]Select logo[/cyan]",
                     choices=[str(i) for i in range(1, len(available_logos) + 2)],
                     default="1"
@@ -1732,21 +2527,11 @@ def opcion_exportar_clips(video: Dict, state_manager):
                 console.print("[yellow]⚠ No PNG logos found in assets folder[/yellow]")
 
             console.print("\n[bold]Logo Position:[/bold]\n")
-            position_table = Table(show_header=False, box=None, padding=(0, 2))
-            position_table.add_column(style="cyan")
-            position_table.add_column(style="white")
-            position_table.add_column(style="dim")
-
-            position_table.add_row("1", "Top Left (default)", "Adjusted for TikTok")
-            position_table.add_row("2", "Top Right", "Classic corner")
-            position_table.add_row("3", "Bottom Left", "Footer position")
-            position_table.add_row("4", "Bottom Right", "Footer corner")
-            position_table.add_row("5", "Volver al menú anterior", "")
-
-            console.print(position_table)
+            console.print(_LOGO_POSITION_TABLE)
             console.print()
 
-            position_choice = Prompt.ask(
+            position_choice = _preguntar(
+                Prompt,
                 "[cyan]Logo position[/cyan]",
                 choices=["1", "2", "3", "4", "5"],
                 default="1"
@@ -1755,42 +2540,26 @@ def opcion_exportar_clips(video: Dict, state_manager):
             if position_choice == "5":
                 logo_position = "top-left"  # Reset to default if cancelled
             else:
-                position_map = {
-                    "1": "top-left",
-                    "2": "top-right",
-                    "3": "bottom-left",
-                    "4": "bottom-right"
-                }
-                logo_position = position_map[position_choice]
+                logo_position = LOGO_POSITION_MAP[position_choice]
 
             # Logo size selection (predefined options)
             console.print("\n[bold]Logo Size:[/bold]\n")
-            size_table = Table(show_header=False, box=None, padding=(0, 2))
-            size_table.add_column(style="cyan")
-            size_table.add_column(style="white")
-            size_table.add_column(style="dim")
-
-            size_table.add_row("1", "Medium", "7% of frame height (default)")
-            size_table.add_row("2", "Large", "10% of frame height")
-
-            console.print(size_table)
+            console.print(_LOGO_SIZE_TABLE)
             console.print()
 
-            size_choice = Prompt.ask(
+            size_choice = _preguntar(
+                Prompt,
                 "[cyan]Logo size[/cyan]",
                 choices=["1", "2"],
                 default="1"
             )
 
-            size_map = {
-                "1": 0.07,
-                "2": 0.10
-            }
-            logo_scale = size_map[size_choice]
+            logo_scale = LOGO_SCALE_MAP[size_choice]
 
     # Pregunto si quiere subtítulos
     console.print()
-    add_subtitles = Confirm.ask(
+    add_subtitles = _preguntar(
+        Confirm,
         "[cyan]Add burned-in subtitles?[/cyan]",
         default=True
     )
@@ -1800,20 +2569,11 @@ def opcion_exportar_clips(video: Dict, state_manager):
         console.print()
         console.print("[bold]Subtitle Position (8px yellow):[/bold]\n")
 
-        style_options = Table(show_header=False, box=None, padding=(0, 2))
-        style_options.add_column(style="cyan")
-        style_options.add_column(style="white")
-        style_options.add_column(style="dim")
-
-        style_options.add_row("1", "Bottom", "Waist level (default)")
-        style_options.add_row("2", "Middle", "Center of frame")
-        style_options.add_row("3", "Very High", "Top of frame")
-        style_options.add_row("4", "Volver al menú anterior", "")
-
-        console.print(style_options)
+        console.print(_STYLE_OPTIONS_TABLE)
         console.print()
 
-        style_choice = Prompt.ask(
+        style_choice = _preguntar(
+            Prompt,
             "[cyan]Subtitle position[/cyan]",
             choices=["1", "2", "3", "4"],
             default="1"
@@ -1823,17 +2583,12 @@ def opcion_exportar_clips(video: Dict, state_manager):
         if style_choice == "4":
             return
 
-        style_map = {
-            "1": "bottom",
-            "2": "middle",
-            "3": "very_high"
-        }
-
-        subtitle_style = style_map[style_choice]
+        subtitle_style = SUBTITLE_STYLE_MAP[style_choice]
 
         # Pregunto por palabras clave para enfatizar en magenta
         console.print()
-        emphasis_input = Prompt.ask(
+        emphasis_input = _preguntar(
+            Prompt,
             "[cyan]Keywords to highlight? (comma-separated, e.g. #AICDMX,inteligencia) [Press ENTER for auto-detect][/cyan]",
             default=""
         )
@@ -1844,13 +2599,12 @@ def opcion_exportar_clips(video: Dict, state_manager):
             console.print(f"[green]✓ Will highlight: {', '.join(subtitle_emphasis_keywords)}[/green]")
         else:
             # Auto-detect long words (>8 chars) from transcript
-            from src.subtitle_generator import SubtitleGenerator
             subtitle_gen = SubtitleGenerator()
 
             # Load transcript to extract long words
             try:
-                with open(transcript_path, 'r', encoding='utf-8') as f:
-                    transcript_data = json.load(f)
+                with open(transcript_path, 'rb') as f:
+                    transcript_data = orjson.loads(f.read())
 
                 auto_keywords = subtitle_gen.extract_long_words(transcript_data, min_length=8)
 
@@ -1871,7 +2625,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
     # Pregunto si quiere organizar por estilo (si hay clasificaciones)
     if clip_styles:
         console.print()
-        organize_by_style = Confirm.ask(
+        organize_by_style = _preguntar(
+            Confirm,
             "[cyan]Organize clips by style in separate folders? (viral/educational/storytelling)[/cyan]",
             default=True
         )
@@ -1883,7 +2638,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
     # Pregunto si quiere exportar todos o solo algunos
     console.print()
-    export_all = Confirm.ask(
+    export_all = _preguntar(
+        Confirm,
         f"[cyan]Export all {len(clips)} clips?[/cyan]",
         default=True
     )
@@ -1892,20 +2648,17 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
     if not export_all:
         console.print()
-        max_clips = Prompt.ask(
+        max_clips = _preguntar(
+            IntPrompt,
             "[cyan]How many clips to export (from the beginning)?[/cyan]",
-            default="10"
+            default=10
         )
-        try:
-            clips_to_export = clips[:int(max_clips)]
-        except ValueError:
-            clips_to_export = clips[:10]
+        clips_to_export = clips[:max_clips]
 
     # === REVIEW CONFIGURACIÓN ANTES DE EXPORTAR ===
     aspect_ratio_display = {None: "Original", "9:16": "Vertical (9:16)", "1:1": "Cuadrado (1:1)"}
 
     while True:
-        console.clear()
         mostrar_banner()
 
         console.print(Panel(
@@ -1942,7 +2695,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
         console.print("  [cyan][N][/cyan] Proceder al export")
         console.print("  [cyan][C][/cyan] Cancelar y volver al menú anterior\n")
 
-        action = Prompt.ask(
+        action = _preguntar(
+            Prompt,
             "[cyan]Opción[/cyan]",
             choices=["y", "n", "c"],
             default="n"
@@ -1951,7 +2705,7 @@ def opcion_exportar_clips(video: Dict, state_manager):
         if action == "c":
             # Cancelar sin guardar - volver al menú anterior
             console.print("[yellow]Export cancelled - volviendo al menú anterior[/yellow]")
-            Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
+            _esperar_enter("\n[dim]Press ENTER to return[/dim]")
             return
 
         elif action == "n":
@@ -1961,9 +2715,9 @@ def opcion_exportar_clips(video: Dict, state_manager):
             console.print(f"[dim]This may take a few minutes depending on video length[/dim]")
             console.print()
 
-            if not Confirm.ask("[cyan]Continue with export?[/cyan]", default=True):
+            if not _preguntar(Confirm, "[cyan]Continue with export?[/cyan]", default=True):
                 console.print("[yellow]Export cancelled[/yellow]")
-                Prompt.ask("\n[dim]Press ENTER to return[/dim]", default="")
+                _esperar_enter("\n[dim]Press ENTER to return[/dim]")
                 return
 
             break  # Salir del loop de review y proceder a exportar
@@ -2008,21 +2762,11 @@ def opcion_exportar_clips(video: Dict, state_manager):
         # Procesar ediciones
         if edit_choice == "1":
             # Editar aspect ratio
-            console.clear()
             mostrar_banner()
-            console.print(f"\n[bold]Procesando: {video['filename']}[/bold]\n")
+            console.print(f"\n[bold]Procesando: {video.filename}[/bold]\n")
             console.print("[bold]Cambiar Aspect Ratio:[/bold]\n")
 
-            aspect_options_edit = Table(show_header=False, box=None, padding=(0, 2))
-            aspect_options_edit.add_column(style="cyan")
-            aspect_options_edit.add_column(style="white")
-            aspect_options_edit.add_column(style="dim")
-
-            aspect_options_edit.add_row("1", "Original", "16:9 o según fuente")
-            aspect_options_edit.add_row("2", "Vertical", "9:16 (TikTok, Reels, Shorts)")
-            aspect_options_edit.add_row("3", "Cuadrado", "1:1 (Instagram)")
-
-            console.print(aspect_options_edit)
+            console.print(_ASPECT_EDIT_TABLE)
             console.print()
 
             new_aspect = Prompt.ask(
@@ -2031,8 +2775,7 @@ def opcion_exportar_clips(video: Dict, state_manager):
                 default="2" if aspect_ratio == "9:16" else ("1" if aspect_ratio is None else "3")
             )
 
-            aspect_map_edit = {"1": None, "2": "9:16", "3": "1:1"}
-            aspect_ratio = aspect_map_edit[new_aspect]
+            aspect_ratio = ASPECT_MAP[new_aspect]
 
             # Reset face tracking si cambió a no-vertical
             if aspect_ratio != "9:16":
@@ -2040,9 +2783,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
         elif edit_choice == "2" and aspect_ratio == "9:16":
             # Editar face tracking
-            console.clear()
             mostrar_banner()
-            console.print(f"\n[bold]Procesando: {video['filename']}[/bold]\n")
+            console.print(f"\n[bold]Procesando: {video.filename}[/bold]\n")
             console.print("[bold]Face Tracking Settings:[/bold]\n")
             console.print("  [cyan]1.[/cyan] Habilitar (keep_in_frame)")
             console.print("  [cyan]2.[/cyan] Habilitar (centered)")
@@ -2065,9 +2807,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
         elif (edit_choice == "2" and aspect_ratio != "9:16") or (edit_choice == "3" and aspect_ratio == "9:16"):
             # Editar logo
-            console.clear()
             mostrar_banner()
-            console.print(f"\n[bold]Procesando: {video['filename']}[/bold]\n")
+            console.print(f"\n[bold]Procesando: {video.filename}[/bold]\n")
             console.print("[bold]Logo Settings:[/bold]\n")
 
             add_logo = Confirm.ask("[cyan]Add logo overlay?[/cyan]", default=add_logo)
@@ -2102,16 +2843,7 @@ def opcion_exportar_clips(video: Dict, state_manager):
                         logo_path = str(available_logos[int(logo_choice_edit) - 1])
 
                 console.print("\n[bold]Logo Position:[/bold]\n")
-                logo_pos_table = Table(show_header=False, box=None, padding=(0, 2))
-                logo_pos_table.add_column(style="cyan")
-                logo_pos_table.add_column(style="white")
-
-                logo_pos_table.add_row("1", "Top Left (default, TikTok adjusted)")
-                logo_pos_table.add_row("2", "Top Right")
-                logo_pos_table.add_row("3", "Bottom Left")
-                logo_pos_table.add_row("4", "Bottom Right")
-
-                console.print(logo_pos_table)
+                console.print(_LOGO_POSITION_EDIT_TABLE)
                 console.print()
 
                 pos_choice = Prompt.ask(
@@ -2120,18 +2852,10 @@ def opcion_exportar_clips(video: Dict, state_manager):
                     default="1"
                 )
 
-                logo_map = {"1": "top-left", "2": "top-right", "3": "bottom-left", "4": "bottom-right"}
-                logo_position = logo_map[pos_choice]
+                logo_position = LOGO_POSITION_MAP[pos_choice]
 
                 console.print("\n[bold]Logo Size:[/bold]\n")
-                logo_size_table = Table(show_header=False, box=None, padding=(0, 2))
-                logo_size_table.add_column(style="cyan")
-                logo_size_table.add_column(style="white")
-
-                logo_size_table.add_row("1", "Medium (7%)")
-                logo_size_table.add_row("2", "Large (10%)")
-
-                console.print(logo_size_table)
+                console.print(_LOGO_SIZE_EDIT_TABLE)
                 console.print()
 
                 size_choice = Prompt.ask(
@@ -2140,31 +2864,19 @@ def opcion_exportar_clips(video: Dict, state_manager):
                     default="1"
                 )
 
-                logo_scale_map = {"1": 0.07, "2": 0.10}
-                logo_scale = logo_scale_map[size_choice]
+                logo_scale = LOGO_SCALE_MAP[size_choice]
 
         elif (edit_choice == "3" and aspect_ratio != "9:16") or (edit_choice == "4" and aspect_ratio == "9:16"):
             # Editar subtítulos
-            console.clear()
             mostrar_banner()
-            console.print(f"\n[bold]Procesando: {video['filename']}[/bold]\n")
+            console.print(f"\n[bold]Procesando: {video.filename}[/bold]\n")
             console.print("[bold]Subtitle Settings:[/bold]\n")
 
             add_subtitles = Confirm.ask("[cyan]Add subtitles?[/cyan]", default=add_subtitles)
 
             if add_subtitles:
                 console.print()
-                style_options_edit = Table(show_header=False, box=None, padding=(0, 2))
-                style_options_edit.add_column(style="cyan")
-                style_options_edit.add_column(style="white")
-
-                styles = [("Bottom", "8px yellow, waist level"),
-                         ("Middle", "8px yellow, center frame"),
-                         ("Very High", "8px yellow, top frame")]
-                for i, (name, desc) in enumerate(styles, 1):
-                    style_options_edit.add_row(str(i), f"{name} - {desc}")
-
-                console.print(style_options_edit)
+                console.print(_STYLE_EDIT_TABLE)
                 console.print()
 
                 style_choice_edit = Prompt.ask(
@@ -2173,10 +2885,7 @@ def opcion_exportar_clips(video: Dict, state_manager):
                     default="1"
                 )
 
-                style_map_edit = {
-                    "1": "bottom", "2": "middle", "3": "very_high"
-                }
-                subtitle_style = style_map_edit[style_choice_edit]
+                subtitle_style = SUBTITLE_STYLE_MAP[style_choice_edit]
 
                 # Pregunto por palabras clave para enfatizar
                 console.print()
@@ -2190,12 +2899,11 @@ def opcion_exportar_clips(video: Dict, state_manager):
                     console.print(f"[green]✓ Will highlight: {', '.join(subtitle_emphasis_keywords)}[/green]")
                 else:
                     # Auto-detect long words
-                    from src.subtitle_generator import SubtitleGenerator
                     subtitle_gen = SubtitleGenerator()
 
                     try:
-                        with open(transcript_path, 'r', encoding='utf-8') as f:
-                            transcript_data = json.load(f)
+                        with open(transcript_path, 'rb') as f:
+                            transcript_data = orjson.loads(f.read())
 
                         auto_keywords = subtitle_gen.extract_long_words(transcript_data, min_length=8)
 
@@ -2214,7 +2922,8 @@ def opcion_exportar_clips(video: Dict, state_manager):
     try:
         console.print()
 
-        # Creo el exporter
+        # Creo el exporter (import diferido: arrastra OpenCV/MediaPipe)
+        from src.video_exporter import VideoExporter, MAX_EXPORT_WORKERS, can_stream_copy
         exporter = VideoExporter(output_dir="output")
 
         # Obtengo el path de la transcripción para los subtítulos
@@ -2222,11 +2931,15 @@ def opcion_exportar_clips(video: Dict, state_manager):
 
         # Progress tracker para export
         progress = OperationProgress("Exporting clips to video files", total_steps=100)
-        progress.add_log(f"Video: {video['filename']}", "INFO")
+        progress.add_log(f"Video: {video.filename}", "INFO")
         progress.add_log(f"Clips to export: {len(clips_to_export)}", "INFO")
         progress.add_log(f"Aspect ratio: {aspect_ratio if aspect_ratio else 'Original'}", "INFO")
         progress.add_log(f"Face tracking: {'Enabled' if enable_face_tracking else 'Disabled'}", "INFO")
         progress.add_log(f"Subtitles: {'Enabled' if add_subtitles else 'Disabled'}", "INFO")
+
+        # Export en paralelo: un job ffmpeg por clip, acotado a pocos workers
+        export_workers = min(os.cpu_count() or 1, MAX_EXPORT_WORKERS)
+        progress.add_log(f"Parallel workers: {export_workers}", "INFO")
         progress.update(5, "Initializing exporter...")
 
         # Mensaje informativo sobre el proceso de export
@@ -2240,6 +2953,15 @@ def opcion_exportar_clips(video: Dict, state_manager):
         progress.add_log("Starting clip export...", "PROGRESS")
         progress.update(15, "Exporting clips...")
 
+        # Sin aspect ratio, subtítulos ni logo no hay nada que re-encodear:
+        # el exporter corta con -c copy (solo I/O)
+        stream_copy = can_stream_copy(aspect_ratio, add_subtitles, add_logo)
+        if stream_copy:
+            progress.add_log("No video filters: using stream copy (no re-encode)", "INFO")
+
+        # Mientras ffmpeg exporta, precargo los archivos del video siguiente
+        _prefetch_siguiente_video(video_id, state_manager)
+
         # Exporto los clips
         exported_paths = exporter.export_clips(
             video_path=video_path,
@@ -2260,15 +2982,18 @@ def opcion_exportar_clips(video: Dict, state_manager):
             add_logo=add_logo,
             logo_path=logo_path,
             logo_position=logo_position,
-            logo_scale=logo_scale
+            logo_scale=logo_scale,
+            max_workers=export_workers,
+            stream_copy=stream_copy
         )
 
         if exported_paths:
             progress.add_log(f"All {len(exported_paths)} clips exported successfully", "SUCCESS")
             progress.update(85, "Updating state...")
 
-            # Obtengo la carpeta donde se guardaron (todos están en la misma)
-            output_folder = Path(exported_paths[0]).parent
+            # Carpeta del video según el exporter: con organize_by_style cada clip
+            # queda en una subcarpeta por estilo, así que no la deduzco del primer path
+            output_folder = exporter.last_output_dir
 
             progress.add_log(f"Location: {output_folder}", "INFO")
             progress.update(90, "Finalizing...")
@@ -2287,25 +3012,26 @@ def opcion_exportar_clips(video: Dict, state_manager):
             progress.update(100, "Complete! ✓")
             progress.show()
 
-            console.print()
-            console.print(Panel(
-                f"[green]✓ Export completed![/green]\n\n"
-                f"Clips exported: {len(exported_paths)}\n"
-                f"Location: {output_folder}/\n"
-                f"Aspect ratio: {aspect_ratio if aspect_ratio else 'Original'}",
-                title="[bold green]Success[/bold green]",
-                border_style="green"
-            ))
-
-            # Muestro algunos nombres de archivo
-            console.print()
-            console.print("[dim]Sample clips:[/dim]")
-            for path in exported_paths[:5]:
-                filename = Path(path).name
-                console.print(f"[dim]  • {filename}[/dim]")
-
+            # Resumen + algunos nombres de archivo en un solo print
+            # Text plano (sin markup): nombres con "[...]" se muestran tal cual
+            sample_lines = ["Sample clips:"]
+            sample_lines.extend(f"  • {os.path.basename(path)}" for path in islice(exported_paths, 5))
             if len(exported_paths) > 5:
-                console.print(f"[dim]  ... and {len(exported_paths) - 5} more[/dim]")
+                sample_lines.append(f"  ... and {len(exported_paths) - 5} more")
+
+            console.print(Group(
+                Text(),
+                Panel(
+                    f"[green]✓ Export completed![/green]\n\n"
+                    f"Clips exported: {len(exported_paths)}\n"
+                    f"Location: {output_folder}/\n"
+                    f"Aspect ratio: {aspect_ratio if aspect_ratio else 'Original'}",
+                    title="[bold green]Success[/bold green]",
+                    border_style="green"
+                ),
+                Text(),
+                Text("\n".join(sample_lines), style="dim")
+            ))
 
         else:
             progress.add_log("Export failed - no clips exported", "ERROR")
@@ -2332,7 +3058,83 @@ def opcion_exportar_clips(video: Dict, state_manager):
         console.print("[dim]Check the logs for more details[/dim]")
 
     console.print()
-    Prompt.ask("[dim]Press ENTER to return to menu[/dim]", default="")
+    _esperar_enter()
+
+
+# Acciones de opcion_procesar_video según la etapa del video
+# (opción, descripción, handler) - la última siempre es "Volver" (sin handler)
+# DECISIÓN: tablas fijas + dispatch por dict en vez del if/elif que volvía a
+# chequear transcribed/clips_generated al despachar
+_ACCIONES_SIN_TRANSCRIBIR = (
+    ("1", "Transcribir video", opcion_transcribir_video),
+    ("2", "Volver al menú anterior", None),
+)
+
+_ACCIONES_TRANSCRITO = (
+    ("1", "Re-transcribir video", opcion_transcribir_video),
+    ("2", "Generar/Regenerar clips", opcion_generar_clips),
+    ("3", "Volver al menú anterior", None),
+)
+
+# Si ya tengo clips, ofrezco más opciones
+_ACCIONES_CON_CLIPS = (
+    ("1", "Re-transcribir video", opcion_transcribir_video),
+    ("2", "Generar/Regenerar clips", opcion_generar_clips),
+    ("3", "Generar copys IA (clasificación + subtítulos)", opcion_generar_copies),
+    ("4", "Exportar clips a archivos de video", opcion_exportar_clips),
+    ("5", "Volver al menú anterior", None),
+)
+
+_DISPATCH_ACCIONES = {
+    actions: {option: handler for option, _, handler in actions}
+    for actions in (_ACCIONES_SIN_TRANSCRIBIR, _ACCIONES_TRANSCRITO, _ACCIONES_CON_CLIPS)
+}
+
+
+def _tabla_acciones(actions) -> Table:
+    """Armo el menú de acciones de un video (opción, descripción)"""
+    actions_table = Table(show_header=False, box=box.ROUNDED, border_style="cyan", padding=(0, 2))
+    actions_table.add_column("Opción", style="bold cyan", width=8)
+    actions_table.add_column("Descripción", style="white")
+
+    for option, desc, _ in actions:
+        actions_table.add_row(option, desc)
+
+    return actions_table
+
+
+# Las tres tablas de acciones son estáticas: las armo una vez
+_TABLAS_ACCIONES = {actions: _tabla_acciones(actions) for actions in _DISPATCH_ACCIONES}
+
+# Opciones válidas de cada tabla (para Prompt.ask)
+_OPCIONES_ACCIONES = {
+    actions: [option for option, _, _ in actions]
+    for actions in _DISPATCH_ACCIONES
+}
+
+
+def _crear_panel_limpieza() -> Panel:
+    """Armo el panel con las opciones de limpieza (estático: una vez al cargar)"""
+    menu_table = Table(show_header=False, box=box.ROUNDED, border_style="cyan", padding=(0, 2))
+    menu_table.add_column("Opción", style="bold cyan", width=8)
+    menu_table.add_column("Descripción", style="white")
+
+    menu_table.add_row("1", "Mantener descargas & transcripciones (re-procesar)")
+    menu_table.add_row("   ", "  └─ Elimina: metadata clips, outputs, logs, caché")
+    menu_table.add_row("2", "Inicio limpio (eliminar todo)")
+    menu_table.add_row("   ", "  └─ Elimina: TODOS los artifacts")
+    menu_table.add_row("3", "Volver al menú anterior")
+
+    return Panel(menu_table, title="[bold]Opciones de Limpieza[/bold]", border_style="cyan")
+
+
+_CLEANUP_OPTIONS_PANEL = _crear_panel_limpieza()
+
+_GRANULAR_CLEANUP_TABLE = _tabla_opciones((
+    ("1", "All artifacts"),
+    ("2", "Select specific artifacts"),
+    ("3", "Cancel"),
+))
 
 
 def opcion_cleanup_project():
@@ -2344,7 +3146,6 @@ def opcion_cleanup_project():
     - Opción 2: Fresh start (eliminar TODO)
     RAZÓN: Operación destructiva - prevenir eliminaciones accidentales
     """
-    console.clear()
     mostrar_banner()
 
     console.print(Panel(
@@ -2370,17 +3171,7 @@ def opcion_cleanup_project():
     console.print()
 
     # Opciones de cleanup simplificadas
-    menu_table = Table(show_header=False, box=box.ROUNDED, border_style="cyan", padding=(0, 2))
-    menu_table.add_column("Opción", style="bold cyan", width=8)
-    menu_table.add_column("Descripción", style="white")
-
-    menu_table.add_row("1", "Mantener descargas & transcripciones (re-procesar)")
-    menu_table.add_row("   ", "  └─ Elimina: metadata clips, outputs, logs, caché")
-    menu_table.add_row("2", "Inicio limpio (eliminar todo)")
-    menu_table.add_row("   ", "  └─ Elimina: TODOS los artifacts")
-    menu_table.add_row("3", "Volver al menú anterior")
-
-    console.print(Panel(menu_table, title="[bold]Opciones de Limpieza[/bold]", border_style="cyan"))
+    console.print(_CLEANUP_OPTIONS_PANEL)
     console.print()
 
     choice = Prompt.ask(
@@ -2440,19 +3231,20 @@ def cleanup_keep_downloads_and_transcripts(cleanup_manager: CleanupManager, stat
             return f"{size_bytes / 1024:.1f} KB"
         return f"{mb:.1f} MB"
 
-    console.print("[bold yellow]⚠️  Modo Re-procesar: Mantener Descargas & Transcripciones[/bold yellow]\n")
-
-    console.print("[bold]Se MANTIENE:[/bold]")
-    console.print(f"  ✓ Videos descargados: {format_size(totals['total_downloads'])}")
-    console.print(f"  ✓ Transcripciones: {format_size(totals['total_transcripts'])}")
-    console.print(f"  ✓ Total: {format_size(will_keep)}\n")
-
-    console.print("[bold red]Se ELIMINA:[/bold red]")
-    console.print(f"  ✗ Metadata clips: {format_size(totals['total_clips_metadata'])}")
-    console.print(f"  ✗ Clips exportados: {format_size(totals['total_output'])}")
-    console.print(f"  ✗ Logs antiguos (> 7 días)")
-    console.print(f"  ✗ Cache y residuales")
-    console.print(f"  ✗ Total a eliminar: {format_size(will_delete)}\n")
+    # Todo el resumen en un solo print (un parseo de markup en vez de uno por línea)
+    console.print(
+        "[bold yellow]⚠️  Modo Re-procesar: Mantener Descargas & Transcripciones[/bold yellow]\n\n"
+        "[bold]Se MANTIENE:[/bold]\n"
+        f"  ✓ Videos descargados: {format_size(totals['total_downloads'])}\n"
+        f"  ✓ Transcripciones: {format_size(totals['total_transcripts'])}\n"
+        f"  ✓ Total: {format_size(will_keep)}\n\n"
+        "[bold red]Se ELIMINA:[/bold red]\n"
+        f"  ✗ Metadata clips: {format_size(totals['total_clips_metadata'])}\n"
+        f"  ✗ Clips exportados: {format_size(totals['total_output'])}\n"
+        "  ✗ Logs antiguos (> 7 días)\n"
+        "  ✗ Cache y residuales\n"
+        f"  ✗ Total a eliminar: {format_size(will_delete)}\n"
+    )
 
     if not Confirm.ask("¿Continuar con limpieza de re-procesamiento?", default=False):
         console.print("[yellow]Limpieza cancelada[/yellow]")
@@ -2462,17 +3254,20 @@ def cleanup_keep_downloads_and_transcripts(cleanup_manager: CleanupManager, stat
     results = cleanup_manager.delete_all_except_downloads_and_transcripts()
 
     success_count = sum(1 for r in results.values() if r)
-    console.print(f"\n[green]✓ Limpieza de re-procesamiento completada[/green]")
-    console.print(f"[green]Espacio liberado: {format_size(will_delete)}[/green]")
-    console.print(f"[dim]Ahora puedes re-procesar clips con diferentes configuraciones[/dim]")
+    console.print(
+        "\n[green]✓ Limpieza de re-procesamiento completada[/green]\n"
+        f"[green]Espacio liberado: {format_size(will_delete)}[/green]\n"
+        "[dim]Ahora puedes re-procesar clips con diferentes configuraciones[/dim]"
+    )
 
 
 def cleanup_specific_video(cleanup_manager: CleanupManager, state: dict):
     """Cleanup de un video específico con selección granular"""
     console.print()
 
-    # Listar videos disponibles
-    video_keys = list(state.keys())
+    # Listar videos disponibles (tupla: un solo recorrido del state)
+    video_keys = tuple(state)
+    cancel_option = str(len(video_keys) + 1)
 
     console.print("[bold]Available videos:[/bold]\n")
 
@@ -2485,7 +3280,7 @@ def cleanup_specific_video(cleanup_manager: CleanupManager, state: dict):
         video_name = video_key[:50] + "..." if len(video_key) > 50 else video_key
         videos_table.add_row(str(idx), video_name)
 
-    videos_table.add_row(str(len(video_keys) + 1), "[dim]Cancel[/dim]")
+    videos_table.add_row(cancel_option, "[dim]Cancel[/dim]")
 
     console.print(videos_table)
     console.print()
@@ -2493,10 +3288,10 @@ def cleanup_specific_video(cleanup_manager: CleanupManager, state: dict):
     video_idx = Prompt.ask(
         "[cyan]Select video to clean[/cyan]",
         choices=[str(i) for i in range(1, len(video_keys) + 2)],
-        default=str(len(video_keys) + 1)
+        default=cancel_option
     )
 
-    if int(video_idx) == len(video_keys) + 1:
+    if video_idx == cancel_option:
         console.print("[yellow]Cleanup cancelled[/yellow]")
         return
 
@@ -2505,14 +3300,18 @@ def cleanup_specific_video(cleanup_manager: CleanupManager, state: dict):
     # Mostrar artifacts de ese video
     artifacts = cleanup_manager.get_video_artifacts(selected_video_key)
 
-    console.print(f"\n[bold]Artifacts for '{selected_video_key[:50]}':[/bold]\n")
+    artifact_options = [
+        artifact_type
+        for artifact_type, info in artifacts.items()
+        if info['exists']
+    ]
 
-    artifact_options = []
-    for artifact_type, info in artifacts.items():
-        if info['exists']:
-            size_mb = info['size'] / 1024 / 1024
-            console.print(f"  - {artifact_type}: {size_mb:.2f} MB")
-            artifact_options.append(artifact_type)
+    # Encabezado + listado en un solo print (antes: un print por artifact)
+    artifact_lines = [
+        f"  - {artifact_type}: {artifacts[artifact_type]['size'] / 1024 / 1024:.2f} MB"
+        for artifact_type in artifact_options
+    ]
+    console.print("\n".join([f"\n[bold]Artifacts for '{selected_video_key[:50]}':[/bold]\n", *artifact_lines]))
 
     if not artifact_options:
         console.print("[yellow]No artifacts to clean for this video[/yellow]")
@@ -2520,15 +3319,7 @@ def cleanup_specific_video(cleanup_manager: CleanupManager, state: dict):
 
     # Selección granular
     console.print()
-    menu_table = Table(show_header=False, box=None, padding=(0, 2))
-    menu_table.add_column(style="cyan", width=6)
-    menu_table.add_column(style="white")
-
-    menu_table.add_row("1", "All artifacts")
-    menu_table.add_row("2", "Select specific artifacts")
-    menu_table.add_row("3", "Cancel")
-
-    console.print(menu_table)
+    console.print(_GRANULAR_CLEANUP_TABLE)
     console.print()
 
     granular_choice = Prompt.ask(
@@ -2565,10 +3356,11 @@ def cleanup_specific_video(cleanup_manager: CleanupManager, state: dict):
     total_mb = total_size / 1024 / 1024
 
     # CONFIRMACIÓN FINAL
-    console.print(f"\n[bold red]This will DELETE {len(to_delete)} items ({total_mb:.2f} MB)[/bold red]")
-    for t in to_delete:
-        console.print(f"  - {t}")
-    console.print()
+    console.print("\n".join([
+        f"\n[bold red]This will DELETE {len(to_delete)} items ({total_mb:.2f} MB)[/bold red]",
+        *(f"  - {t}" for t in to_delete),
+        ""
+    ]))
 
     if not Confirm.ask("Continue?", default=False):
         console.print("[yellow]Cleanup cancelled[/yellow]")
@@ -2576,7 +3368,10 @@ def cleanup_specific_video(cleanup_manager: CleanupManager, state: dict):
 
     # Ejecutar cleanup
     console.print("\n[bold]Cleaning...[/bold]")
-    results = cleanup_manager.delete_video_artifacts(selected_video_key, to_delete)
+    # Reuso los artifacts que ya mostré: no vuelvo a recorrer el disco
+    results = cleanup_manager.delete_video_artifacts(
+        selected_video_key, to_delete, artifacts=artifacts
+    )
 
     # Mostrar resultados
     success_count = sum(1 for r in results.values() if r)
@@ -2587,17 +3382,18 @@ def cleanup_outputs_only(cleanup_manager: CleanupManager, state: dict):
     """Elimina SOLO los outputs exportados (conserva transcripts)"""
     console.print()
 
-    # Calcular total de outputs
-    total_output_size = 0
-    total_clips = 0
-
-    for video_key in state.keys():
-        artifacts = cleanup_manager.get_video_artifacts(video_key)
-        output_info = artifacts.get('output', {})
+    # Escaneo los outputs de cada video una sola vez: el mismo dict sirve para
+    # los totales y para saber a qué videos pedirles el borrado
+    outputs = {}
+    for video_key in state:
+        output_info = cleanup_manager.get_video_artifacts(video_key).get('output')
+        if output_info is not None:
+            outputs[video_key] = output_info
 
-        if output_info.get('exists'):
-            total_output_size += output_info.get('size', 0)
-            total_clips += output_info.get('clip_count', 0)
+    # Calcular total de outputs (solo los que siguen en disco)
+    existing = {video_key: info for video_key, info in outputs.items() if info['exists']}
+    total_output_size = sum(info['size'] for info in existing.values())
+    total_clips = sum(info.get('clip_count', 0) for info in existing.values())
 
     if total_output_size == 0:
         console.print("[yellow]No exported clips to clean[/yellow]")
@@ -2605,11 +3401,13 @@ def cleanup_outputs_only(cleanup_manager: CleanupManager, state: dict):
 
     size_mb = total_output_size / 1024 / 1024
 
-    console.print("[bold]This will delete ALL exported clips:[/bold]")
-    console.print(f"  - Videos: {len(state)} videos")
-    console.print(f"  - Clips: {total_clips} clips")
-    console.print(f"  - Size: {size_mb:.2f} MB")
-    console.print("\n[dim]Transcripts and source videos will be preserved[/dim]\n")
+    console.print(
+        "[bold]This will delete ALL exported clips:[/bold]\n"
+        f"  - Videos: {len(existing)} videos\n"
+        f"  - Clips: {total_clips} clips\n"
+        f"  - Size: {size_mb:.2f} MB\n"
+        "\n[dim]Transcripts and source videos will be preserved[/dim]\n"
+    )
 
     if not Confirm.ask("Continue?", default=False):
         console.print("[yellow]Cleanup cancelled[/yellow]")
@@ -2617,11 +3415,17 @@ def cleanup_outputs_only(cleanup_manager: CleanupManager, state: dict):
 
     # Eliminar outputs de cada video
     console.print("\n[bold]Cleaning outputs...[/bold]")
+    # Solo los videos con output en disco: los demás no tienen nada que borrar
+    # (y no cuentan como borrados en el resumen)
+    # batch(): el state se guarda una sola vez al terminar, no una vez por video
     deleted_count = 0
-    for video_key in state.keys():
-        results = cleanup_manager.delete_video_artifacts(video_key, ['output'])
-        if results.get('output'):
-            deleted_count += 1
+    with cleanup_manager.state_manager.batch():
+        for video_key, output_info in existing.items():
+            results = cleanup_manager.delete_video_artifacts(
+                video_key, ['output'], artifacts={'output': output_info}
+            )
+            if results.get('output'):
+                deleted_count += 1
 
     console.print(f"\n[green]Deleted outputs from {deleted_count} videos ({size_mb:.2f} MB freed)[/green]")
 
@@ -2645,17 +3449,25 @@ def cleanup_entire_project(cleanup_manager: CleanupManager):
             return f"{size_bytes / 1024:.1f} KB"
         return f"{mb:.1f} MB"
 
-    console.print("[bold red]🔥 INICIO LIMPIO: Eliminar Todo[/bold red]\n")
-
-    console.print("[bold red]Esto eliminará TODOS los datos del proyecto:[/bold red]")
-    console.print(f"  ✗ Videos descargados: {format_size(totals['total_downloads'])}")
-    console.print(f"  ✗ Transcripciones: {format_size(totals['total_transcripts'])}")
-    console.print(f"  ✗ Metadata de clips: {format_size(totals['total_clips_metadata'])}")
-    console.print(f"  ✗ Clips exportados: {format_size(totals['total_output'])}")
-    console.print(f"  ✗ Estado del proyecto (json)")
-    console.print(f"  ✗ Cache y logs\n")
+    # Lista de lo que se elimina armada una vez y mostrada en un solo print
+    warning_lines = [
+        f"  ✗ {label}: {format_size(totals[key])}"
+        for label, key in (
+            ("Videos descargados", 'total_downloads'),
+            ("Transcripciones", 'total_transcripts'),
+            ("Metadata de clips", 'total_clips_metadata'),
+            ("Clips exportados", 'total_output'),
+        )
+    ]
+    warning_lines += ["  ✗ Estado del proyecto (json)", "  ✗ Cache y logs"]
 
-    console.print(f"[bold red]Espacio a liberar: {format_size(totals['total_all'])}[/bold red]\n")
+    console.print("\n".join([
+        "[bold red]🔥 INICIO LIMPIO: Eliminar Todo[/bold red]\n",
+        "[bold red]Esto eliminará TODOS los datos del proyecto:[/bold red]",
+        *warning_lines,
+        "",
+        f"[bold red]Espacio a liberar: {format_size(totals['total_all'])}[/bold red]\n"
+    ]))
 
     # Confirmación simple - Y/N con default N
     if not Confirm.ask("[bold red]¿Estás seguro?[/bold red]", default=False):
@@ -2667,23 +3479,25 @@ def cleanup_entire_project(cleanup_manager: CleanupManager):
     results = cleanup_manager.delete_all_project_data()
 
     if all(results.values()):
-        console.print("\n[green]✓ Proyecto limpiado exitosamente[/green]")
-        console.print(f"[green]Espacio liberado: {format_size(totals['total_all'])}[/green]")
-        console.print("[dim]Inicio limpio. Ejecuta CLIPER para comenzar.[/dim]")
+        console.print(
+            "\n[green]✓ Proyecto limpiado exitosamente[/green]\n"
+            f"[green]Espacio liberado: {format_size(totals['total_all'])}[/green]\n"
+            "[dim]Inicio limpio. Ejecuta CLIPER para comenzar.[/dim]"
+        )
     else:
-        console.print("\n[yellow]Algunos elementos no pudieron eliminarse[/yellow]")
-        for item, success in results.items():
-            status = "✓" if success else "✗"
-            console.print(f"  {status} {item}")
+        console.print("\n".join([
+            "\n[yellow]Algunos elementos no pudieron eliminarse[/yellow]",
+            *(f"  {'✓' if success else '✗'} {item}" for item, success in results.items())
+        ]))
 
 
 def main():
     """
     Función principal - loop del programa
     """
-    global logger
-    import logging
-    import warnings
+    global logger, _ACEPTAR_DEFAULTS
+
+    _ACEPTAR_DEFAULTS = _parsear_argumentos().yes
 
     mostrar_banner()
 
@@ -2699,79 +3513,79 @@ def main():
     # Inicializo componentes
     console.print("[cyan]Initializing CLIPER...[/cyan]\n")
 
-    try:
-        downloader = YoutubeDownloader()
-        state_manager = get_state_manager()
-        logger.info("System initialized successfully")
-        logger.info("Downloader ready")
-        console.print("[green]✓ System ready[/green]\n")
-    except Exception as e:
-        console.print(Panel(
-            f"[red]Initialization error: {e}[/red]",
-            border_style="red"
-        ))
-        sys.exit(1)
+    # DECISIÓN: El escaneo de downloads/ no depende del state, así que lo lanzo
+    # en un thread mientras cargo project_state.json: las dos lecturas de disco
+    # (listado del directorio, lento en discos de red, y parseo del JSON) se solapan
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scan_future = executor.submit(escanear_videos)
 
-    # Escaneo videos existentes
-    console.print("[cyan]Scanning downloads/ folder...[/cyan]")
-    videos = escanear_videos()
+        try:
+            state_manager = get_state_manager()
+            logger.info("System initialized successfully")
+            console.print("[green]✓ System ready[/green]\n")
+        except Exception as e:
+            console.print(Panel(
+                f"[red]Initialization error: {e}[/red]",
+                border_style="red"
+            ))
+            sys.exit(1)
+
+        # Escaneo videos existentes
+        console.print("[cyan]Scanning downloads/ folder...[/cyan]")
+        videos = scan_future.result()
 
     # Registro videos que no están en el state
-    for video in videos:
-        if not state_manager.get_video_state(video['video_id']):
-            state_manager.register_video(video['video_id'], video['filename'])
+    known_ids = state_manager.get_known_ids()
+    with state_manager.batch():
+        for video in videos:
+            if video.video_id not in known_ids:
+                state_manager.register_video(video.video_id, video.filename)
 
     if videos:
         console.print(f"[green]Found {len(videos)} video(s)[/green]\n")
     else:
         console.print("[yellow]No videos found[/yellow]\n")
 
+    # Acciones del menú principal
+    # Cada handler retorna True si hay que reescanear downloads/
+    def _procesar():
+        opcion_procesar_video(videos, state_manager)
+
+    def _agregar():
+        opcion_agregar_video(state_manager)
+        return True  # escanear_videos usa el cache si no se agregó nada
+
+    def _limpiar():
+        opcion_cleanup_project()
+        _invalidar_escaneo()  # Pueden haberse eliminado videos
+        return True
+
+    def _pipeline():
+        console.print("\n[yellow]Full Pipeline coming soon![/yellow]")
+        Prompt.ask("\n[dim]Press ENTER to continue[/dim]", default="")
+
+    # Mapeo de opciones (depende de si hay videos)
+    # La opción que no está en el dict es "Salir" (la última del menú)
+    acciones_con_videos = {"1": _procesar, "2": _agregar, "3": _limpiar, "4": _pipeline}
+    acciones_sin_videos = {"1": _agregar, "2": _limpiar}
+
     # Loop principal
     while True:
         opcion = menu_principal(videos, state_manager)
 
-        # Mapeo de opciones (depende de si hay videos)
-        if videos:
-            if opcion == "1":
-                opcion_procesar_video(videos, state_manager)
-            elif opcion == "2":
-                opcion_agregar_video(downloader, state_manager)
-                videos = escanear_videos()  # Reescaneo
-            elif opcion == "3":
-                opcion_cleanup_project()
-                videos = escanear_videos()  # Reescaneo (pueden haberse eliminado)
-            elif opcion == "4":
-                console.print("\n[yellow]Full Pipeline coming soon![/yellow]")
-                Prompt.ask("\n[dim]Press ENTER to continue[/dim]", default="")
-            elif opcion == "5":
-                break
-        else:
-            if opcion == "1":
-                opcion_agregar_video(downloader, state_manager)
-                videos = escanear_videos()  # Reescaneo
-            elif opcion == "2":
-                opcion_cleanup_project()
-                videos = escanear_videos()  # Reescaneo
-            elif opcion == "3":
-                break
-
-        console.clear()
+        accion = (acciones_con_videos if videos else acciones_sin_videos).get(opcion)
+        if accion is None:
+            break
+
+        if accion():
+            videos = escanear_videos()
+
         mostrar_banner()
 
     # Despedida
-    console.clear()
     mostrar_banner()
 
-    goodbye = Text()
-    goodbye.append("\nThank you for using CLIPER!\n", style="bold green")
-    goodbye.append("Keep creating amazing content\n", style="dim")
-    goodbye.justify = "center"
-
-    console.print(Panel(
-        goodbye,
-        title="[bold]Goodbye![/bold]",
-        border_style="cyan"
-    ))
+    console.print(GOODBYE_PANEL)
     console.print()
 
 
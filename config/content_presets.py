@@ -6,11 +6,16 @@ Cada tipo de video tiene características únicas que requieren
 diferentes configuraciones para transcripción y generación de clips.
 """
 
-from typing import Dict, Any
+import copy
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 
 # Definición de presets por tipo de contenido
-CONTENT_PRESETS = {
+# MappingProxyType: de solo lectura, nadie agrega/pisa un preset por accidente
+# Los presets internos quedan como dict: se guardan en project_state.json
+# (orjson no serializa mappingproxy), por eso get_preset() entrega una copia
+CONTENT_PRESETS = MappingProxyType({
     "podcast": {
         "name": "Podcast/Interview",
         "description": "Multiple speakers, natural topic changes",
@@ -119,7 +124,17 @@ CONTENT_PRESETS = {
 
         "use_case": "Optimized for TikTok, Reels, Shorts"
     },
-}
+})
+
+# CONTENT_PRESETS es estático: armo los listados una sola vez al importar
+_PRESET_NAMES = MappingProxyType({
+    key: f"{preset['icon']} {preset['name']}"
+    for key, preset in CONTENT_PRESETS.items()
+})
+_PRESET_DESCRIPTIONS = MappingProxyType({
+    key: preset.get("description", "No description available")
+    for key, preset in CONTENT_PRESETS.items()
+})
 
 
 def get_preset(content_type: str) -> Dict[str, Any]:
@@ -130,27 +145,34 @@ def get_preset(content_type: str) -> Dict[str, Any]:
         content_type: Tipo de contenido (podcast, tutorial, livestream, etc.)
 
     Returns:
-        Dict con configuración completa
+        Dict con configuración completa (copia: el caller la puede modificar
+        o guardar en el state sin tocar CONTENT_PRESETS)
     """
-    return CONTENT_PRESETS.get(content_type, CONTENT_PRESETS["tutorial"])
+    return copy.deepcopy(CONTENT_PRESETS.get(content_type, CONTENT_PRESETS["tutorial"]))
 
 
-def list_presets() -> Dict[str, str]:
+def list_presets() -> Mapping[str, str]:
     """
     Lista todos los presets disponibles
 
     Returns:
-        Dict con {key: "icon + name"}
+        Mapping de solo lectura con {key: "icon + name"} (precalculado)
     """
-    return {
-        key: f"{preset['icon']} {preset['name']}"
-        for key, preset in CONTENT_PRESETS.items()
-    }
+    return _PRESET_NAMES
 
 
 def get_preset_description(content_type: str) -> str:
     """
     Obtiene la descripción de un preset
     """
-    preset = CONTENT_PRESETS.get(content_type, {})
-    return preset.get("description", "No description available")
+    return _PRESET_DESCRIPTIONS.get(content_type, "No description available")
+
+
+def get_preset_descriptions() -> Mapping[str, str]:
+    """
+    Descripciones de todos los presets en un solo mapping {key: description}
+
+    Para armar la tabla de selección sin una llamada por fila
+    (de solo lectura, precalculado)
+    """
+    return _PRESET_DESCRIPTIONS
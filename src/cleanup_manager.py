@@ -14,8 +14,11 @@ Responsabilidades:
 - Dry run mode para simular sin eliminar
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import shutil
 from rich.console import Console
 from rich.table import Table
@@ -25,6 +28,105 @@ from src.utils.state_manager import StateManager
 
 logger = get_logger(__name__)
 
+# Nombres de archivos residuales, definidos una sola vez
+# DECISIÓN: startswith/endswith sobre el nombre en vez de un glob por patrón
+# - Un solo listado del directorio clasifica todos los patrones
+# - temp_ cubre temp_*.mp4 y temp_reframed_*.mp4
+_TEMP_VIDEO_PREFIX = 'temp_'
+_TEMP_VIDEO_SUFFIX = '_temp.mp4'  # Face tracking (*_temp.mp4)
+_LOCK_SUFFIX = '.lock'            # *.lock y .lock
+_LOG_PREFIX = 'cliper_'
+_LOG_SUFFIX = '.log'
+
+# Clasificación de residuales de output/ con UN solo match por archivo
+# (lastgroup dice qué tipo es; el orden importa: temp antes que mp4)
+_OUTPUT_RESIDUAL_RE = re.compile(
+    rf'(?P<temp>{re.escape(_TEMP_VIDEO_PREFIX)}.*\.mp4|.*{re.escape(_TEMP_VIDEO_SUFFIX)})'
+    r'|(?P<mp4>.*\.mp4)'
+    r'|(?P<srt>.*\.srt)'
+    r'|(?P<ds_store>\.DS_Store)',
+    re.DOTALL
+)
+
+# Artifacts registrados en el state: si se borran todos, el video sale del state
+_STATE_ARTIFACT_TYPES = frozenset({'download', 'transcript', 'clips_metadata', 'output'})
+
+# Columnas de tamaño de display_cleanable_artifacts (sin temp_files)
+_TABLE_ARTIFACTS = ('download', 'transcript', 'clips_metadata', 'output')
+
+# Máximo de threads para escanear artifacts de varios videos a la vez
+_SCAN_WORKERS = 16
+
+_KB = 1024
+_MB = 1024 * 1024
+
+
+def _format_size(size_bytes: int) -> str:
+    """Tamaño legible para la tabla: "-" si es 0, KB por debajo de 0.1 MB, si no MB"""
+    if size_bytes == 0:
+        return "-"
+    mb = size_bytes / _MB
+    if mb < 0.1:
+        return f"{size_bytes / _KB:.1f} KB"
+    return f"{mb:.1f} MB"
+
+
+def _file_size(path) -> Optional[int]:
+    """
+    Tamaño de un archivo con un solo stat, o None si no existe
+
+    DECISIÓN: os.path.getsize + excepción en vez de exists() + stat()
+    - Un syscall por archivo en lugar de dos
+    - Sin carrera si el archivo desaparece entre el exists() y el stat()
+    - NotADirectoryError: un tramo de la ruta es un archivo → tampoco existe
+      (exists() también daba False en ese caso)
+    """
+    try:
+        return os.path.getsize(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _iter_files(root) -> Iterator[os.DirEntry]:
+    """
+    Recorro root recursivamente con os.scandir y devuelvo cada archivo (DirEntry)
+
+    DECISIÓN: os.scandir en vez de Path.rglob
+    - DirEntry trae el tipo de archivo del propio listado (sin stat extra
+      para is_dir/is_file) y no construye un Path por entrada
+    - No sigue symlinks a directorios (igual que un borrado con rmtree)
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except FileNotFoundError:
+            continue  # Directorio borrado mientras lo recorría
+
+
+def _empty_directory(root) -> int:
+    """
+    Borro todo el contenido de root (root queda) y devuelvo los bytes liberados
+
+    Se corta en el primer error (igual que rmtree): la excepción sube al caller
+    """
+    freed = 0
+    with os.scandir(root) as listing:
+        entries = list(listing)  # Listo antes de borrar dentro del mismo directorio
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            freed += _empty_directory(entry.path)
+            os.rmdir(entry.path)
+        else:
+            freed += entry.stat(follow_symlinks=False).st_size
+            os.unlink(entry.path)
+    return freed
+
 
 class CleanupManager:
     """
@@ -60,9 +162,17 @@ class CleanupManager:
         self.temp_dir = Path(temp_dir)
         self.output_dir = Path(output_dir)
 
+        # Las mismas rutas como str: en el escaneo por video armo rutas con
+        # os.path.join (sin un Path por artifact) y solo el dict final lleva Path
+        self._downloads_str = os.fspath(self.downloads_dir)
+        self._output_str = os.fspath(self.output_dir)
+
         self.state_manager = StateManager()
         self.console = Console()
 
+        # Artifacts ya escaneados por video (ver get_video_artifacts)
+        self._artifacts_cache: Dict[str, Dict[str, Dict]] = {}
+
         logger.debug(
             f"CleanupManager initialized: "
             f"downloads={self.downloads_dir}, "
@@ -89,87 +199,135 @@ class CleanupManager:
                 'clips_metadata': {...},
                 'output': {...}
             }
+
+        DECISIÓN: Cache por video durante la vida del manager
+        - El menú de cleanup muestra el resumen de espacio, la tabla por video
+          y después los totales: sin cache eran 3 escaneos completos de output/
+        - Cada método que borra invalida el cache (lo que borró o todo)
+        - El state del manager ya es una foto tomada al crearlo
         """
+        cached = self._artifacts_cache.get(video_key)
+        if cached is not None:
+            return cached
+
+        artifacts = self._scan_video_artifacts(video_key)
+        self._artifacts_cache[video_key] = artifacts
+        return artifacts
+
+    def _get_artifacts_many(self, video_keys: List[str]) -> List[Dict[str, Dict]]:
+        """
+        get_video_artifacts para varios videos (mismo orden que video_keys)
+
+        DECISIÓN: Los videos que no están en cache se escanean en paralelo
+        - Cada escaneo es puro I/O (stats + scandir de output/<video>) e independiente
+        - En un disco lento o de red el total pasa de la suma al escaneo más lento
+        """
+        missing = [key for key in video_keys if key not in self._artifacts_cache]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(missing))) as executor:
+                self._artifacts_cache.update(
+                    zip(missing, executor.map(self._scan_video_artifacts, missing))
+                )
+        return [self.get_video_artifacts(key) for key in video_keys]
+
+    def _scan_video_artifacts(self, video_key: str) -> Dict[str, Dict]:
+        """Escaneo el filesystem para los artifacts de un video (sin cache)"""
         artifacts = {}
 
-        # Obtener info del state
-        state = self.state_manager.get_all_videos()
-        video_state = state.get(video_key, {})
+        # Obtener info del state (lookup directo, sin pasar por el dict completo)
+        video_state = self.state_manager.get_video_state(video_key)
 
         if not video_state:
             logger.warning(f"Video {video_key} not found in state")
             return artifacts
 
+        # Campos del state en locales, leídos una sola vez al inicio
+        get = video_state.get
+        filename = get('filename')
+        transcript_path = get('transcript_path')
+        clips_path_str = get('clips_metadata_path')
+        has_output = bool(get('exported_clips')) or get('clips_generated', False)
+
         # 1. Downloaded video
-        filename = video_state.get('filename')
         if filename:
-            download_path = self.downloads_dir / filename
+            download_path = os.path.join(self._downloads_str, filename)
+            size = _file_size(download_path)
             artifacts['download'] = {
-                'path': download_path,
-                'exists': download_path.exists(),
-                'size': download_path.stat().st_size if download_path.exists() else 0,
+                'path': Path(download_path),
+                'exists': size is not None,
+                'size': size or 0,
                 'type': 'video'
             }
 
         # 2. Transcript
-        transcript_path = video_state.get('transcript_path')
         if transcript_path:
-            transcript_path = Path(transcript_path)
+            size = _file_size(transcript_path)
             artifacts['transcript'] = {
-                'path': transcript_path,
-                'exists': transcript_path.exists(),
-                'size': transcript_path.stat().st_size if transcript_path.exists() else 0,
+                'path': Path(transcript_path),
+                'exists': size is not None,
+                'size': size or 0,
                 'type': 'json'
             }
 
         # 3. Clips metadata
-        clips_path_str = video_state.get('clips_metadata_path')
         if clips_path_str:
-            clips_path = Path(clips_path_str)
+            size = _file_size(clips_path_str)
             artifacts['clips_metadata'] = {
-                'path': clips_path,
-                'exists': clips_path.exists(),
-                'size': clips_path.stat().st_size if clips_path.exists() else 0,
+                'path': Path(clips_path_str),
+                'exists': size is not None,
+                'size': size or 0,
                 'type': 'json'
             }
 
-        # 4. Exported clips (directorio completo)
-        output_clips = video_state.get('exported_clips', [])
-        if output_clips or video_state.get('clips_generated'):
-            # Calcular tamaño total del directorio de outputs
-            output_video_dir = self.output_dir / video_key
-            total_size = 0
-            clip_count = 0
+        # 4 y 5. Exported clips + temporales huérfanos en UNA sola pasada
+        # DECISIÓN: Detectar archivos temporales huérfanos para cleanup
+        # - Estos archivos (*_temp.mp4) se generan durante face tracking
+        # - Normalmente se eliminan automáticamente, pero pueden quedar si hay interrupciones
+        # - Pueden acumular espacio significativo (17MB c/u)
+        # Antes eran dos recorridos (rglob de clips + glob de temporales); ahora
+        # clasifico cada .mp4 en el mismo walk. Los temporales cuentan también
+        # en el tamaño del output (el directorio completo se borra junto)
+        top_level = os.path.join(self._output_str, video_key)
+        output_exists = os.path.exists(top_level)
+        total_size = 0
+        clip_count = 0
+        temp_files = []
+        temp_total_size = 0
+
+        if output_exists:
+            if has_output:
+                entries = _iter_files(top_level)
+            else:
+                # Sin clips generados/exportados no reporto 'output': solo busco
+                # temporales, que viven en el nivel superior → no recorro subcarpetas
+                try:
+                    with os.scandir(top_level) as listing:
+                        entries = [entry for entry in listing if entry.is_file()]
+                except FileNotFoundError:
+                    entries = []
+
+            for entry in entries:
+                if not entry.name.endswith('.mp4'):
+                    continue
 
-            if output_video_dir.exists():
-                for clip_file in output_video_dir.rglob('*.mp4'):
-                    if clip_file.exists():
-                        total_size += clip_file.stat().st_size
-                        clip_count += 1
+                size = entry.stat().st_size
+                total_size += size
+                clip_count += 1
 
+                # Temporales: solo los del nivel superior (donde los deja el exporter)
+                if entry.name.endswith(_TEMP_VIDEO_SUFFIX) and os.path.dirname(entry.path) == top_level:
+                    temp_files.append(Path(entry.path))
+                    temp_total_size += size
+
+        if has_output:
             artifacts['output'] = {
-                'path': output_video_dir,
-                'exists': output_video_dir.exists(),
+                'path': Path(top_level),
+                'exists': output_exists,
                 'size': total_size,
                 'type': 'directory',
                 'clip_count': clip_count
             }
 
-        # 5. Temporary files (orphaned *_temp.mp4 files from interrupted exports)
-        # DECISIÓN: Detectar archivos temporales huérfanos para cleanup
-        # - Estos archivos se generan durante face tracking
-        # - Normalmente se eliminan automáticamente, pero pueden quedar si hay interrupciones
-        # - Pueden acumular espacio significativo (17MB c/u)
-        temp_files = []
-        temp_total_size = 0
-
-        output_video_dir = self.output_dir / video_key
-        if output_video_dir.exists():
-            for temp_file in output_video_dir.glob('*_temp.mp4'):
-                if temp_file.exists():
-                    temp_files.append(temp_file)
-                    temp_total_size += temp_file.stat().st_size
-
         if temp_files:
             artifacts['temp_files'] = {
                 'path': temp_files,  # Lista de paths
@@ -185,7 +343,8 @@ class CleanupManager:
         self,
         video_key: str,
         artifact_types: Optional[List[str]] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        artifacts: Optional[Dict] = None
     ) -> Dict[str, bool]:
         """
         Elimina artifacts específicos de un video
@@ -200,6 +359,8 @@ class CleanupManager:
             artifact_types: Lista de tipos a eliminar: ['download', 'transcript', 'clips_metadata', 'output', 'temp_files']
                            Si None, elimina TODO
             dry_run: Si True, solo simula (no elimina nada)
+            artifacts: Artifacts ya escaneados (los que se le mostraron al usuario).
+                       Si None, escaneo de nuevo el disco
 
         Returns:
             Dict con resultado de cada eliminación: {'download': True, 'transcript': False, ...}
@@ -207,7 +368,10 @@ class CleanupManager:
         if artifact_types is None:
             artifact_types = ['download', 'transcript', 'clips_metadata', 'output', 'temp_files']
 
-        artifacts = self.get_video_artifacts(video_key)
+        # Si el caller ya escaneó (para mostrar tamaños) reuso ese dict;
+        # si no, escaneo fresco (sin cache): borro según lo que hay ahora en disco
+        if artifacts is None:
+            artifacts = self._scan_video_artifacts(video_key)
         results = {}
 
         for artifact_type in artifact_types:
@@ -246,6 +410,10 @@ class CleanupManager:
 
                 results[artifact_type] = True
 
+            except FileNotFoundError:
+                # Con artifacts reusados puede haber desaparecido desde el escaneo
+                logger.warning(f"{artifact_type} path doesn't exist: {artifact_path}")
+                results[artifact_type] = True  # Ya no existe = éxito
             except PermissionError as e:
                 logger.error(f"Permission denied deleting {artifact_path}: {e}")
                 results[artifact_type] = False
@@ -254,8 +422,10 @@ class CleanupManager:
                 results[artifact_type] = False
 
         # Actualizar state si no es dry run
-        if not dry_run and any(results.values()):
-            self._update_state_after_cleanup(video_key, artifact_types, results)
+        if not dry_run:
+            self._artifacts_cache.pop(video_key, None)
+            if any(results.values()):
+                self._update_state_after_cleanup(video_key, artifact_types, results)
 
         return results
 
@@ -280,35 +450,36 @@ class CleanupManager:
 
         video_state = self.state_manager.state[video_key]
 
+        # Tipos pedidos Y eliminados con éxito, en un set: cada chequeo es O(1)
+        deleted = {t for t in deleted_types if results.get(t)}
+
         # Marcar como no completado según lo eliminado
-        if 'download' in deleted_types and results.get('download'):
+        if 'download' in deleted:
             video_state['downloaded'] = False
             video_state['filename'] = None
             logger.debug(f"Marked {video_key} as not downloaded in state")
 
-        if 'transcript' in deleted_types and results.get('transcript'):
+        if 'transcript' in deleted:
             video_state['transcribed'] = False
             video_state['transcript_path'] = None
             video_state['transcription_path'] = None  # Legacy field
             logger.debug(f"Marked {video_key} as not transcribed in state")
 
-        if 'clips_metadata' in deleted_types and results.get('clips_metadata'):
+        if 'clips_metadata' in deleted:
             video_state['clips_generated'] = False
             video_state['clips'] = []
             video_state['clips_metadata_path'] = None
             logger.debug(f"Marked {video_key} clips as not generated in state")
 
-        if 'output' in deleted_types and results.get('output'):
+        if 'output' in deleted:
             video_state['exported_clips'] = []
             logger.debug(f"Cleared exported clips for {video_key} in state")
 
         # Si eliminamos TODO, remover video del state completamente
-        all_types = ['download', 'transcript', 'clips_metadata', 'output']
-        if all(t in deleted_types for t in all_types):
+        # (si algo falló, el video queda: el state refleja lo que sigue en disco)
+        if deleted.issuperset(_STATE_ARTIFACT_TYPES):
             del self.state_manager.state[video_key]
             logger.info(f"Removed {video_key} from state (all artifacts deleted)")
-        else:
-            self.state_manager.state[video_key] = video_state
 
         # Persistir cambios
         self.state_manager._save_state()
@@ -331,14 +502,16 @@ class CleanupManager:
         results = {}
 
         # 1. Eliminar clips metadata y outputs de TODOS los videos
-        for video_key in state.keys():
-            del_results = self.delete_video_artifacts(
-                video_key,
-                ['clips_metadata', 'output'],
-                dry_run=dry_run
-            )
-            results[f"{video_key}_clips_meta"] = del_results.get('clips_metadata', False)
-            results[f"{video_key}_output"] = del_results.get('output', False)
+        # batch(): un solo guardado del state al final, no uno por video
+        with self.state_manager.batch():
+            for video_key in state.keys():
+                del_results = self.delete_video_artifacts(
+                    video_key,
+                    ['clips_metadata', 'output'],
+                    dry_run=dry_run
+                )
+                results[f"{video_key}_clips_meta"] = del_results.get('clips_metadata', False)
+                results[f"{video_key}_output"] = del_results.get('output', False)
 
         # 2. Limpiar caché y residuales
         if not dry_run:
@@ -356,7 +529,7 @@ class CleanupManager:
 
         DECISIÓN: Operación nuclear con confirmación externa
         - Esta función NO pide confirmación (responsabilidad del caller)
-        - Elimina directorios completos y los recrea vacíos
+        - Vacía los directorios completos (las carpetas quedan, sin contenido)
         - Reset total de state
         - ESPECÍFICO: Limpia archivos temporales de caché, FFmpeg, etc.
 
@@ -368,47 +541,24 @@ class CleanupManager:
         """
         results = {}
 
+        if not dry_run:
+            self._artifacts_cache.clear()
+
         directories = {
             'downloads': self.downloads_dir,
             'temp': self.temp_dir,
             'output': self.output_dir
         }
 
-        for dir_name, dir_path in directories.items():
-            if not dir_path.exists():
-                logger.info(f"{dir_name}/ doesn't exist (already clean)")
-                results[dir_name] = True
-                continue
-
-            # Calcular tamaño antes de eliminar
-            total_size = 0
-            try:
-                total_size = sum(
-                    f.stat().st_size
-                    for f in dir_path.rglob('*')
-                    if f.is_file()
-                )
-            except Exception as e:
-                logger.warning(f"Could not calculate size of {dir_name}/: {e}")
-
-            size_mb = total_size / 1024 / 1024
-
-            if dry_run:
-                logger.info(f"[DRY RUN] Would delete {dir_name}/ ({size_mb:.2f} MB)")
-                results[dir_name] = True
-                continue
-
-            try:
-                shutil.rmtree(dir_path)
-                dir_path.mkdir(parents=True, exist_ok=True)  # Recrear vacío
-                logger.info(f"Cleaned {dir_name}/ ({size_mb:.2f} MB freed)")
-                results[dir_name] = True
-            except PermissionError as e:
-                logger.error(f"Permission denied cleaning {dir_name}/: {e}")
-                results[dir_name] = False
-            except Exception as e:
-                logger.error(f"Failed to clean {dir_name}/: {e}")
-                results[dir_name] = False
+        # DECISIÓN: Las 3 carpetas son independientes y el trabajo es puro I/O
+        # (stat + rmtree) → las proceso en paralelo, una por thread
+        # map() conserva el orden de directories en results
+        with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+            outcomes = executor.map(
+                lambda item: self._clean_directory(*item, dry_run=dry_run),
+                directories.items()
+            )
+            results.update(zip(directories, outcomes))
 
         # Limpiar caché y archivos temporales residuales
         if not dry_run:
@@ -433,6 +583,42 @@ class CleanupManager:
 
         return results
 
+    def _clean_directory(self, dir_name: str, dir_path: Path, dry_run: bool = False) -> bool:
+        """
+        Vacía una carpeta del proyecto (la carpeta en sí queda)
+
+        Returns:
+            True si quedó limpia (o ya no existía), False si falló
+        """
+        if not dir_path.exists():
+            logger.info(f"{dir_name}/ doesn't exist (already clean)")
+            return True
+
+        if dry_run:
+            # Solo en dry run recorro para medir: no hay borrado que lo haga
+            total_size = 0
+            try:
+                total_size = sum(entry.stat().st_size for entry in _iter_files(dir_path))
+            except Exception as e:
+                logger.warning(f"Could not calculate size of {dir_name}/: {e}")
+            logger.info(f"[DRY RUN] Would delete {dir_name}/ ({total_size / 1024 / 1024:.2f} MB)")
+            return True
+
+        # DECISIÓN: Vacío la carpeta en vez de rmtree + mkdir
+        # - No necesito que desaparezca, solo que quede vacía (conserva permisos)
+        # - Los bytes liberados se suman mientras borro: un solo recorrido
+        #   en lugar de medir primero y borrar después
+        try:
+            freed = _empty_directory(dir_path)
+            logger.info(f"Cleaned {dir_name}/ ({freed / 1024 / 1024:.2f} MB freed)")
+            return True
+        except PermissionError as e:
+            logger.error(f"Permission denied cleaning {dir_name}/: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to clean {dir_name}/: {e}")
+            return False
+
     def _clean_cache_and_residuals(self) -> bool:
         """
         Limpia caché y archivos temporales residuales que pueden interferir
@@ -448,6 +634,9 @@ class CleanupManager:
         Returns:
             bool: True si limpió exitosamente
         """
+        # Borra temporales dentro de output/: los tamaños cacheados dejan de valer
+        self._artifacts_cache.clear()
+
         try:
             from datetime import datetime, timedelta
             import time
@@ -455,47 +644,91 @@ class CleanupManager:
             cleaned_count = 0
             cleaned_size = 0
 
-            # 1. Limpiar archivos lock en temp/
-            lock_patterns = ['*.lock', '.lock']
-            for pattern in lock_patterns:
-                for lock_file in self.temp_dir.glob(pattern):
-                    try:
-                        size = lock_file.stat().st_size
-                        lock_file.unlink()
-                        cleaned_count += 1
-                        cleaned_size += size
-                        logger.debug(f"Removed lock file: {lock_file.name}")
-                    except Exception as e:
-                        logger.warning(f"Could not remove lock file {lock_file}: {e}")
-
-            # 2. Limpiar archivos temporales de FFmpeg/video_exporter
-            # (Estos NO deberían estar acá si todo limpió bien, pero por si acaso)
-            temp_patterns = ['temp_*.mp4', 'temp_reframed_*.mp4', '*_temp.mp4']
-            for pattern in temp_patterns:
-                for temp_file in self.output_dir.rglob(pattern):
-                    try:
-                        size = temp_file.stat().st_size
-                        temp_file.unlink()
-                        cleaned_count += 1
-                        cleaned_size += size
-                        logger.debug(f"Removed residual temp file: {temp_file.name}")
-                    except Exception as e:
-                        logger.warning(f"Could not remove temp file {temp_file}: {e}")
+            # DECISIÓN: os.scandir/DirEntry en vez de glob/rglob + Path.stat()
+            # - El tipo de cada entrada viene del listado del directorio
+            # - Un stat por archivo para el tamaño y os.unlink directo sobre entry.path
 
-            # 3. Limpiar SRTs huérfanos (clips sin .mp4 correspondiente)
-            for srt_file in self.output_dir.rglob('*.srt'):
+            # 1. Limpiar archivos lock en temp/ (*.lock y .lock)
+            try:
+                with os.scandir(self.temp_dir) as entries:
+                    lock_files = [
+                        entry for entry in entries
+                        if entry.name.endswith(_LOCK_SUFFIX) and entry.is_file()
+                    ]
+            except FileNotFoundError:
+                lock_files = []
+
+            for lock_file in lock_files:
                 try:
-                    mp4_file = srt_file.with_suffix('.mp4')
-                    if not mp4_file.exists():
-                        size = srt_file.stat().st_size
-                        srt_file.unlink()
-                        cleaned_count += 1
-                        cleaned_size += size
-                        logger.debug(f"Removed orphaned SRT: {srt_file.name}")
+                    size = lock_file.stat().st_size
+                    os.unlink(lock_file.path)
+                    cleaned_count += 1
+                    cleaned_size += size
+                    logger.debug(f"Removed lock file: {lock_file.name}")
                 except Exception as e:
-                    logger.warning(f"Could not process SRT file {srt_file}: {e}")
+                    logger.warning(f"Could not remove lock file {lock_file.path}: {e}")
+
+            # 2. Residuales de output/ en UN solo recorrido:
+            # - Temporales de FFmpeg/video_exporter: temp_*.mp4 (incluye
+            #   temp_reframed_*.mp4) y *_temp.mp4. NO deberían estar acá si todo
+            #   limpió bien, pero por si acaso
+            # - SRTs huérfanos (clips sin .mp4 correspondiente)
+            # - .DS_Store (residuales de macOS, solo donde puede quedar basura de Finder)
+            # Los .mp4 que quedan se indexan por carpeta: cada SRT se chequea
+            # contra ese set en memoria en vez de un exists() por SRT
+            temp_videos = []
+            srt_files = []
+            ds_stores = []
+            mp4_by_dir: Dict[str, set] = {}
+            for entry in _iter_files(self.output_dir):
+                match = _OUTPUT_RESIDUAL_RE.fullmatch(entry.name)
+                if match is None:
+                    continue
+                kind = match.lastgroup
+                if kind == 'temp':
+                    temp_videos.append(entry)
+                elif kind == 'mp4':
+                    mp4_by_dir.setdefault(os.path.dirname(entry.path), set()).add(entry.name[:-4])
+                elif kind == 'srt':
+                    srt_files.append(entry)
+                else:
+                    ds_stores.append(entry)
 
-            # 4. Limpiar __pycache__ solo en src/ y tests/ (caché Python compilado)
+            for temp_file in temp_videos:
+                try:
+                    size = temp_file.stat().st_size
+                    os.unlink(temp_file.path)
+                    cleaned_count += 1
+                    cleaned_size += size
+                    logger.debug(f"Removed residual temp file: {temp_file.name}")
+                except Exception as e:
+                    # Sigue en disco: cuenta como .mp4 para sus SRTs
+                    mp4_by_dir.setdefault(os.path.dirname(temp_file.path), set()).add(temp_file.name[:-4])
+                    logger.warning(f"Could not remove temp file {temp_file.path}: {e}")
+
+            for srt_file in srt_files:
+                if srt_file.name[:-4] in mp4_by_dir.get(os.path.dirname(srt_file.path), ()):
+                    continue
+                try:
+                    size = srt_file.stat().st_size
+                    os.unlink(srt_file.path)
+                    cleaned_count += 1
+                    cleaned_size += size
+                    logger.debug(f"Removed orphaned SRT: {srt_file.name}")
+                except Exception as e:
+                    logger.warning(f"Could not process SRT file {srt_file.path}: {e}")
+
+            for ds_store in ds_stores:
+                try:
+                    size = ds_store.stat().st_size
+                    os.unlink(ds_store.path)
+                    cleaned_count += 1
+                    cleaned_size += size
+                    logger.debug(f"Removed macOS cache: {ds_store.path}")
+                except Exception as e:
+                    logger.warning(f"Could not remove .DS_Store: {e}")
+
+            # 3. Limpiar __pycache__ solo en src/ y tests/ (caché Python compilado)
             # ESPECÍFICO: Solo en directorios conocidos donde realmente se genera
             source_dirs = [
                 self.downloads_dir.parent / 'src',
@@ -512,34 +745,31 @@ class CleanupManager:
                         except Exception as e:
                             logger.warning(f"Could not remove __pycache__: {e}")
 
-            # 5. Limpiar .DS_Store solo en output/ (residuales de macOS)
-            # ESPECÍFICO: Solo donde puede quedar basura de Finder
-            for ds_store in self.output_dir.rglob('.DS_Store'):
+            # 4. Limpiar logs viejos (> 7 días)
+            # ESPECÍFICO: Solo en logs/ para evitar acumulación indefinida
+            # Mismo criterio que arriba: DirEntry + un solo stat para mtime y tamaño
+            logs_dir = os.path.join(os.path.dirname(self.downloads_dir), 'logs')
+            cutoff_time = time.time() - (7 * 24 * 60 * 60)  # 7 días atrás
+            try:
+                with os.scandir(logs_dir) as entries:
+                    log_files = [
+                        entry for entry in entries
+                        if entry.name.startswith(_LOG_PREFIX) and entry.name.endswith(_LOG_SUFFIX)
+                    ]
+            except FileNotFoundError:
+                log_files = []
+
+            for log_file in log_files:
                 try:
-                    size = ds_store.stat().st_size
-                    ds_store.unlink()
-                    cleaned_count += 1
-                    cleaned_size += size
-                    logger.debug(f"Removed macOS cache: {ds_store.name}")
+                    log_stat = log_file.stat()
+                    if log_stat.st_mtime < cutoff_time:
+                        size = log_stat.st_size
+                        os.unlink(log_file.path)
+                        cleaned_count += 1
+                        cleaned_size += size
+                        logger.debug(f"Removed old log file: {log_file.name}")
                 except Exception as e:
-                    logger.warning(f"Could not remove .DS_Store: {e}")
-
-            # 6. Limpiar logs viejos (> 7 días)
-            # ESPECÍFICO: Solo en logs/ para evitar acumulación indefinida
-            logs_dir = self.downloads_dir.parent / 'logs'
-            if logs_dir.exists():
-                cutoff_time = time.time() - (7 * 24 * 60 * 60)  # 7 días atrás
-                for log_file in logs_dir.glob('cliper_*.log'):
-                    try:
-                        file_mtime = log_file.stat().st_mtime
-                        if file_mtime < cutoff_time:
-                            size = log_file.stat().st_size
-                            log_file.unlink()
-                            cleaned_count += 1
-                            cleaned_size += size
-                            logger.debug(f"Removed old log file: {log_file.name}")
-                    except Exception as e:
-                        logger.warning(f"Could not remove log file {log_file}: {e}")
+                    logger.warning(f"Could not remove log file {log_file.path}: {e}")
 
             cleaned_size_mb = cleaned_size / 1024 / 1024
             if cleaned_count > 0:
@@ -566,7 +796,6 @@ class CleanupManager:
                 'total_all': int
             }
         """
-        state = self.state_manager.get_all_videos()
         totals = {
             'total_downloads': 0,
             'total_transcripts': 0,
@@ -574,8 +803,7 @@ class CleanupManager:
             'total_output': 0,
         }
 
-        for video_key in state.keys():
-            artifacts = self.get_video_artifacts(video_key)
+        for artifacts in self._get_artifacts_many(list(self.state_manager.get_all_videos())):
             totals['total_downloads'] += artifacts.get('download', {}).get('size', 0)
             totals['total_transcripts'] += artifacts.get('transcript', {}).get('size', 0)
             totals['total_clips_metadata'] += artifacts.get('clips_metadata', {}).get('size', 0)
@@ -653,34 +881,18 @@ class CleanupManager:
         table.add_column("Output", justify="right")
         table.add_column("Total", justify="right", style="bold")
 
-        for vkey in video_keys:
-            artifacts = self.get_video_artifacts(vkey)
+        for vkey, artifacts in zip(video_keys, self._get_artifacts_many(video_keys)):
 
-            def format_size(size_bytes):
-                if size_bytes == 0:
-                    return "-"
-                mb = size_bytes / 1024 / 1024
-                if mb < 0.1:
-                    return f"{size_bytes / 1024:.1f} KB"
-                return f"{mb:.1f} MB"
-
-            download_size = artifacts.get('download', {}).get('size', 0)
-            transcript_size = artifacts.get('transcript', {}).get('size', 0)
-            clips_size = artifacts.get('clips_metadata', {}).get('size', 0)
-            output_size = artifacts.get('output', {}).get('size', 0)
-
-            total_size = download_size + transcript_size + clips_size + output_size
+            # Un tamaño por columna (en el orden de _TABLE_ARTIFACTS) + el total
+            sizes = [
+                artifacts[artifact_type]['size'] if artifact_type in artifacts else 0
+                for artifact_type in _TABLE_ARTIFACTS
+            ]
+            sizes.append(sum(sizes))
 
             # Nombre corto del video (primeras 40 chars)
             video_name = vkey[:40] + "..." if len(vkey) > 40 else vkey
 
-            table.add_row(
-                video_name,
-                format_size(download_size),
-                format_size(transcript_size),
-                format_size(clips_size),
-                format_size(output_size),
-                format_size(total_size)
-            )
+            table.add_row(video_name, *map(_format_size, sizes))
 
         self.console.print(table)
@@ -6,13 +6,19 @@ ClipsAI analiza la transcripción y detecta cambios de tema usando
 algoritmo TextTiling con BERT embeddings para marcar puntos de corte.
 """
 
-import json
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
+
+import orjson
 from clipsai import ClipFinder, Transcription
 
 from .utils.logger import setup_logger
 
+# WhisperX no hace diarization por defecto: todo el texto es de un solo speaker
+DEFAULT_SPEAKER = "SPEAKER_00"
+
 
 class ClipsGenerator:
     """
@@ -85,8 +91,9 @@ class ClipsGenerator:
                 self.logger.error(f"Transcripción no encontrada: {transcript_path}")
                 return None
 
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # orjson: varias veces más rápido que json con los words anidados de WhisperX
+            with open(transcript_file, 'rb') as f:
+                data = orjson.loads(f.read())
 
             self.logger.info(f"Transcripción cargada: {len(data.get('segments', []))} segmentos")
 
@@ -120,36 +127,34 @@ class ClipsGenerator:
         try:
             # Construyo char_info a partir de los segmentos
             # char_info es una lista de caracteres con timestamps
+            # DECISIÓN: Una comprehension por segmento en vez de un append por char
+            # - Los timestamps se leen una vez por word/segmento, no por carácter
+            # - En videos de 1h+ son cientos de miles de entradas
+            # Cada entrada queda como dict literal: Transcription de ClipsAI lee
+            # char_info por clave (no acepta namedtuple/slots) y copiar un dict
+            # plantilla ocupa lo mismo (184 bytes por entrada) sin ganancia real
             char_info = []
+            extend = char_info.extend
 
             for seg in segments:
-                words = seg.get("words", [])
+                words = seg.get("words")
 
-                if not words:
-                    # Si no hay words, uso el segmento completo
-                    text = seg.get("text", "").strip()
-                    if text:
-                        for char in text:
-                            char_info.append({
-                                "char": char,
-                                "start_time": seg.get("start", 0.0),
-                                "end_time": seg.get("end", 0.0),
-                                "speaker": "SPEAKER_00"  # Default speaker
-                            })
-                else:
+                if words:
                     # Si hay words, uso esas para mayor precisión
-                    for word_obj in words:
-                        word_text = word_obj.get("word", "")
-                        word_start = word_obj.get("start", 0.0)
-                        word_end = word_obj.get("end", 0.0)
-
-                        for char in word_text:
-                            char_info.append({
-                                "char": char,
-                                "start_time": word_start,
-                                "end_time": word_end,
-                                "speaker": "SPEAKER_00"  # Default speaker
-                            })
+                    extend([
+                        {"char": char, "start_time": start, "end_time": end, "speaker": DEFAULT_SPEAKER}
+                        for word_obj in words
+                        for start, end in ((word_obj.get("start", 0.0), word_obj.get("end", 0.0)),)
+                        for char in word_obj.get("word", "")
+                    ])
+                else:
+                    # Si no hay words, uso el segmento completo
+                    start = seg.get("start", 0.0)
+                    end = seg.get("end", 0.0)
+                    extend([
+                        {"char": char, "start_time": start, "end_time": end, "speaker": DEFAULT_SPEAKER}
+                        for char in seg.get("text", "").strip()
+                    ])
 
             # Construyo el dict con el formato que ClipsAI espera
             clipsai_dict = {
@@ -215,6 +220,9 @@ class ClipsGenerator:
         current_time = 0.0
         clip_id = 1
 
+        # Índice de segmentos armado una sola vez para todos los clips
+        segment_index = self._build_segment_index(whisperx_data)
+
         while current_time < total_duration and clip_id <= max_clips:
             start_time = current_time
             end_time = min(current_time + clip_duration, total_duration)
@@ -226,7 +234,8 @@ class ClipsGenerator:
                 clip_text = self._get_text_for_timerange(
                     whisperx_data,
                     start_time,
-                    end_time
+                    end_time,
+                    segment_index
                 )
 
                 # Preview
@@ -238,9 +247,9 @@ class ClipsGenerator:
 
                 formatted_clips.append({
                     "clip_id": clip_id,
-                    "start_time": round(start_time, 2),
-                    "end_time": round(end_time, 2),
-                    "duration": round(duration, 2),
+                    "start_time": float(round(start_time, 2)),
+                    "end_time": float(round(end_time, 2)),
+                    "duration": float(round(duration, 2)),
                     "text_preview": text_preview,
                     "full_text": clip_text,
                     "method": "fixed_time"  # Marco que fue generado por tiempo fijo
@@ -339,8 +348,13 @@ class ClipsGenerator:
             # PASO 4: Formateo los clips para guardarlos
             formatted_clips = []
 
+            # Índice de segmentos armado una sola vez para todos los clips
+            segment_index = self._build_segment_index(whisperx_data)
+
             for idx, clip in enumerate(clips_found[:max_clips], 1):
                 # Extraigo timestamps
+                # float(): ClipsAI puede devolver numpy floats (round() los deja
+                # como numpy) y estos dicts también se guardan en el state
                 start = clip.start_time
                 end = clip.end_time
                 duration = end - start
@@ -349,7 +363,8 @@ class ClipsGenerator:
                 clip_text = self._get_text_for_timerange(
                     whisperx_data,
                     start,
-                    end
+                    end,
+                    segment_index
                 )
 
                 # Preview: primeras 100 caracteres para mostrar en UI
@@ -361,9 +376,9 @@ class ClipsGenerator:
 
                 formatted_clips.append({
                     "clip_id": idx,
-                    "start_time": round(start, 2),
-                    "end_time": round(end, 2),
-                    "duration": round(duration, 2),
+                    "start_time": float(round(start, 2)),
+                    "end_time": float(round(end, 2)),
+                    "duration": float(round(duration, 2)),
                     "text_preview": text_preview,
                     "full_text": clip_text,
                     "method": "clipsai"  # Generado por ClipsAI (cambio de tema detectado)
@@ -398,7 +413,8 @@ class ClipsGenerator:
         self,
         transcript_data: Dict,
         start_time: float,
-        end_time: float
+        end_time: float,
+        segment_index: Optional[Tuple] = None
     ) -> str:
         """
         Extraigo el texto de la transcripción en un rango de tiempo específico
@@ -407,7 +423,28 @@ class ClipsGenerator:
         - Mostrar preview del contenido del clip
         - Generar títulos automáticos (futuro)
         - Análisis de contenido
+
+        DECISIÓN: bisect sobre el índice de segmentos en vez de recorrerlos todos
+        - Se llama una vez por clip: antes era O(clips × segmentos)
+        - Ahora cada rango cuesta O(log N) + los segmentos que realmente caen adentro
+        - El caller que pide varios rangos arma el índice una vez y lo pasa
+          (segment_index); si no viene, lo armo acá
         """
+        if segment_index is None:
+            segment_index = self._build_segment_index(transcript_data)
+
+        if segment_index is not None:
+            starts, ends, reach, texts = segment_index
+            # Antes de lo: todos terminan <= start_time (reach no decrece)
+            # Desde hi: todos empiezan >= end_time (starts ordenados)
+            lo = bisect_right(reach, start_time)
+            hi = bisect_left(starts, end_time)
+            return " ".join(
+                texts[i] for i in range(lo, hi)
+                if ends[i] > start_time and texts[i]
+            )
+
+        # Segmentos desordenados (no pasa con WhisperX): recorrido lineal
         segments = transcript_data.get("segments", [])
 
         clip_text_parts = []
@@ -426,14 +463,41 @@ class ClipsGenerator:
         return " ".join(clip_text_parts)
 
 
+    def _build_segment_index(
+        self,
+        transcript_data: Dict
+    ) -> Optional[Tuple[List[float], List[float], List[float], List[str]]]:
+        """
+        Armo las listas para buscar rangos de la transcripción con bisect
+
+        No lo guardo en self: vive lo que dura la generación de clips y después
+        la transcripción (que puede ser grande) se libera
+
+        Returns:
+            (starts, ends, reach, texts) por segmento, donde reach[i] es el mayor
+            end entre los segmentos 0..i (ordenado aunque algún segmento termine
+            antes que el anterior). None si los starts no están ordenados.
+        """
+        segments = transcript_data.get("segments", [])
+        starts = [seg.get("start", 0.0) for seg in segments]
+
+        index = None
+        if all(a <= b for a, b in zip(starts, starts[1:])):
+            ends = [seg.get("end", 0.0) for seg in segments]
+            texts = [seg.get("text", "").strip() for seg in segments]
+            index = (starts, ends, list(accumulate(ends, max)), texts)
+
+        return index
+
+
     def _format_time(self, seconds: float) -> str:
         """
         Formateo segundos a MM:SS para logs legibles
 
         Ejemplo: 125.5 → "02:05"
         """
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+        # Una sola conversión a int y un divmod entero (en vez de // y % en float)
+        mins, secs = divmod(int(seconds), 60)
         return f"{mins:02d}:{secs:02d}"
 
 
@@ -474,8 +538,9 @@ class ClipsGenerator:
         }
 
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            # OPT_SERIALIZE_NUMPY: por si ClipsAI devuelve tiempos como numpy floats
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
             self.logger.info(f"📝 Metadata guardada: {output_file}")
 
@@ -496,8 +561,8 @@ class ClipsGenerator:
         - Editar clips manualmente y recargarlos
         """
         try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(metadata_path, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             self.logger.error(f"Error cargando metadata: {e}")
             return None
@@ -29,6 +29,7 @@ from pathlib import Path
 from typing import TypedDict, List, Dict, Literal, Annotated
 from datetime import datetime
 import operator
+from concurrent.futures import ThreadPoolExecutor
 
 from langgraph.graph import StateGraph, END
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -49,6 +50,11 @@ from src.utils.prompt_injector import inject_channel_config
 from src.subtitle_generator import SubtitleGenerator
 
 
+# Batches de copies que mando a la vez al LLM (ver _generate_copies_for_style)
+# Bajo a propósito: más requests simultáneos disparan 429 en Gemini
+MAX_CONCURRENT_LLM_BATCHES = 3
+
+
 # ============================================================================
 # STATE DEFINITION
 # ============================================================================
@@ -651,82 +657,102 @@ Responde SOLO con JSON válido (sin markdown):"""
 
         # Procesar en batches de 5 clips para evitar timeouts
         BATCH_SIZE = 5
-        all_copies = []
-
-        for i in range(0, len(clips), BATCH_SIZE):
-            batch = clips[i:i + BATCH_SIZE]
-
-            # Preparar clips del batch para el prompt
-            clips_input = []
-            for clip in batch:
-                clip_input = {
-                    "clip_id": clip['clip_id'],
-                    "transcript": clip['transcript'],
-                    "duration": clip['duration']
-                }
+        batches = [clips[i:i + BATCH_SIZE] for i in range(0, len(clips), BATCH_SIZE)]
+
+        # DECISIÓN: Los batches son independientes y el tiempo se va en esperar
+        # la red, así que los mando en paralelo (acotado) en vez de uno por uno
+        # - llm.invoke es bloqueante: threads, no asyncio
+        # - map() conserva el orden de los batches
+        max_workers = min(MAX_CONCURRENT_LLM_BATCHES, len(batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda args: self._generate_copies_batch(*args, full_prompt=full_prompt, style=style),
+                enumerate(batches, 1)
+            )
+            all_copies = [copy for batch_copies in results for copy in batch_copies]
 
-                # Agregar opening_words si existen (crucial para autenticidad)
-                if clip.get('opening_words'):
-                    clip_input['opening_words'] = clip['opening_words']
+        return all_copies
 
-                # Agregar speaker_hashtags si existen
-                if clip.get('speaker_hashtags_provided'):
-                    clip_input['speaker_hashtags'] = clip['speaker_hashtags_provided']
 
-                clips_input.append(clip_input)
+    def _generate_copies_batch(
+        self,
+        batch_num: int,
+        batch: List[Dict],
+        full_prompt: str,
+        style: str
+    ) -> List[ClipCopy]:
+        """
+        Genero los copies de un batch de clips (con micro-reintentos)
 
-            # User message para este batch
-            user_message = f"""Genera copies para estos {len(clips_input)} clips en estilo {style}:
+        Returns:
+            Lista de ClipCopy del batch (vacía si fallaron los 3 intentos)
+        """
+        # Preparar clips del batch para el prompt
+        clips_input = []
+        for clip in batch:
+            clip_input = {
+                "clip_id": clip['clip_id'],
+                "transcript": clip['transcript'],
+                "duration": clip['duration']
+            }
+
+            # Agregar opening_words si existen (crucial para autenticidad)
+            if clip.get('opening_words'):
+                clip_input['opening_words'] = clip['opening_words']
+
+            # Agregar speaker_hashtags si existen
+            if clip.get('speaker_hashtags_provided'):
+                clip_input['speaker_hashtags'] = clip['speaker_hashtags_provided']
+
+            clips_input.append(clip_input)
+
+        # User message para este batch
+        user_message = f"""Genera copies para estos {len(clips_input)} clips en estilo {style}:
 
 {json.dumps(clips_input, indent=2, ensure_ascii=False)}
 
 Responde SOLO con JSON válido (sin markdown):"""
 
-            messages = [
-                {"role": "system", "content": full_prompt},
-                {"role": "user", "content": user_message}
-            ]
+        messages = [
+            {"role": "system", "content": full_prompt},
+            {"role": "user", "content": user_message}
+        ]
 
-            # --- Micro-retry loop for each batch ---
-            for attempt in range(3):
-                try:
-                    response = self.llm.invoke(messages)
-                    response_text = response.content
+        # --- Micro-retry loop for each batch ---
+        for attempt in range(3):
+            try:
+                response = self.llm.invoke(messages)
+                response_text = response.content
 
-                    # Limpiar respuesta
-                    if "```json" in response_text:
-                        response_text = response_text.split("```json")[1].split("```")[0]
-                    response_text = response_text.strip()
+                # Limpiar respuesta
+                if "```json" in response_text:
+                    response_text = response_text.split("```json")[1].split("```")[0]
+                response_text = response_text.strip()
 
-                    # Parsear y validar con Pydantic
-                    copies_data = json.loads(response_text)
-                    if 'clips' not in copies_data:
-                        raise ValueError("La respuesta JSON no contiene la clave 'clips'")
-                    
-                    copies_output = CopysOutput(**copies_data)
-                    
-                    # Si todo va bien, añadir y salir del loop de reintentos
-                    all_copies.extend(copies_output.clips)
-                    print(f"   ✓ Batch {i//BATCH_SIZE + 1} successful on attempt {attempt + 1}")
-                    break
-
-                except (ValidationError, json.JSONDecodeError, ValueError) as e:
-                    print(f"   ❌ Attempt {attempt + 1}/3 FAILED for batch {i//BATCH_SIZE + 1}:")
-                    if isinstance(e, json.JSONDecodeError):
-                        print(f"      Error: Invalid JSON response from LLM - {e}")
-                    else:
-                        print(f"      Error: Validation failed - {e}")
+                # Parsear y validar con Pydantic
+                copies_data = json.loads(response_text)
+                if 'clips' not in copies_data:
+                    raise ValueError("La respuesta JSON no contiene la clave 'clips'")
 
-                    if attempt < 2:
-                        print(f"      Retrying in 2 seconds...")
-                        time.sleep(2)
-                    else:
-                        print(f"   ⚠️  Max retries reached. Skipping this batch.")
-            # El `else` en un `for` loop se ejecuta si el loop termina sin `break`
-            else:
-                continue
-        
-        return all_copies
+                copies_output = CopysOutput(**copies_data)
+
+                print(f"   ✓ Batch {batch_num} successful on attempt {attempt + 1}")
+                return copies_output.clips
+
+            except (ValidationError, json.JSONDecodeError, ValueError) as e:
+                print(f"   ❌ Attempt {attempt + 1}/3 FAILED for batch {batch_num}:")
+                if isinstance(e, json.JSONDecodeError):
+                    print(f"      Error: Invalid JSON response from LLM - {e}")
+                else:
+                    print(f"      Error: Validation failed - {e}")
+
+                if attempt < 2:
+                    print(f"      Retrying in 2 seconds...")
+                    time.sleep(2)
+                else:
+                    print(f"   ⚠️  Max retries reached. Skipping this batch.")
+
+        return []
 
 
     def generate_viral_node(self, state: CopysGeneratorState) -> Dict:
@@ -5,8 +5,9 @@ Downloader de YouTube usando yt-dlp
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from urllib.parse import urlparse, parse_qs
 
 import yt_dlp
@@ -14,6 +15,11 @@ import yt_dlp
 from .utils.logger import setup_logger
 
 
+# Descargas simultáneas por defecto
+# Suficiente para saturar el ancho de banda sin abusar del rate-limit de YouTube
+MAX_CONCURRENT_DOWNLOADS = 3
+
+
 class YoutubeDownloader:
     """
     Mi clase principal para descargar videos de YouTube
@@ -258,6 +264,37 @@ class YoutubeDownloader:
             return None
 
 
+    def download_many(
+        self,
+        urls: List[str],
+        quality: str = "best",
+        max_workers: int = MAX_CONCURRENT_DOWNLOADS
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Descargo varias URLs en paralelo (máximo max_workers a la vez)
+
+        Cada descarga es independiente y limitada por red, así que corro
+        download() en un pool de threads acotado.
+
+        Yields:
+            (url, path) a medida que cada descarga termina (path=None si falló)
+        """
+        if not urls:
+            return
+
+        max_workers = max(1, min(max_workers, len(urls)))
+        self.logger.info(f"📦 Descargando {len(urls)} videos ({max_workers} en paralelo)")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.download, url, quality): url
+                for url in urls
+            }
+
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+
     def download_audio_only(self, url: str) -> Optional[str]:
         """
         Descargo solo el audio en MP3
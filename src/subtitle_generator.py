@@ -7,7 +7,9 @@ Los subtítulos pueden quemarse en el video (hard-coded) o agregarse como pista
 """
 
 import json
+import os
 import re
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from rich.console import Console
@@ -32,6 +34,33 @@ class SubtitleGenerator:
         self.console = Console()
         self.logger = logger
 
+        # Cache de segments por transcripción: {path: (mtime_ns, segments)}
+        # El exporter genera un .ass por clip (en paralelo) desde la misma
+        # transcripción; así el JSON se parsea una vez y no una vez por clip
+        self._segments_cache: Dict[str, Tuple[int, List[Dict]]] = {}
+        self._segments_lock = threading.Lock()
+
+
+    def _load_segments(self, transcript_path: str) -> List[Dict]:
+        """
+        Cargo los segments de una transcripción (cacheados por mtime)
+
+        Los segments cacheados son de solo lectura: los que los usan
+        trabajan sobre copias (segment.copy()).
+        """
+        mtime = os.stat(transcript_path).st_mtime_ns
+
+        with self._segments_lock:
+            cached = self._segments_cache.get(transcript_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            with open(transcript_path, 'r', encoding='utf-8') as f:
+                segments = json.load(f).get('segments', [])
+
+            self._segments_cache[transcript_path] = (mtime, segments)
+            return segments
+
 
     def generate_srt_from_transcript(
         self,
@@ -111,11 +140,8 @@ class SubtitleGenerator:
             Ruta al archivo SRT generado, o None si falla
         """
         try:
-            # Cargo la transcripción
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                transcript_data = json.load(f)
-
-            segments = transcript_data.get('segments', [])
+            # Cargo la transcripción (parseada una vez para todos los clips)
+            segments = self._load_segments(transcript_path)
 
             # Filtro solo los segmentos que están dentro del clip
             clip_segments = []
@@ -604,11 +630,8 @@ class SubtitleGenerator:
             Path to generated ASS file, or None if failed
         """
         try:
-            # Load transcript
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                transcript_data = json.load(f)
-
-            segments = transcript_data.get('segments', [])
+            # Load transcript (parsed once and shared by every clip)
+            segments = self._load_segments(transcript_path)
 
             # Filter segments for this clip
             clip_segments = []
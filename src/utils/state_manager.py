@@ -9,11 +9,14 @@ Este módulo me permite:
 - Continuar donde me quedé si cierro el programa
 """
 
-import json
+import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 
+import orjson
+
 
 class StateManager:
     """
@@ -43,6 +46,10 @@ class StateManager:
         # Cargo el estado actual (o creo uno vacío)
         self.state = self._load_state()
 
+        # Escrituras diferidas dentro de batch() (ver abajo)
+        self._batch_depth = 0
+        self._pending_save = False
+
 
     def _load_state(self) -> Dict:
         """
@@ -51,9 +58,9 @@ class StateManager:
         """
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                with open(self.state_file, 'rb') as f:
+                    return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
                 # Si el JSON está corrupto, empiezo de cero
                 return {}
         else:
@@ -64,9 +71,49 @@ class StateManager:
     def _save_state(self):
         """
         Guardo el estado actual al archivo JSON
+
+        DECISIÓN: Escritura atómica (archivo .tmp + os.replace)
+        - Si el programa se corta a mitad de escritura, el state anterior queda intacto
+        - Dentro de batch() solo marco el cambio y escribo una vez al salir
+        - orjson serializa directo a bytes UTF-8 (mismo formato indent=2 que json)
+        - OPT_SERIALIZE_NUMPY: los clips de ClipsAI pueden traer numpy floats
+          (igual que en save_clips_metadata)
+        - Serializo ANTES de abrir el .tmp: si falla no queda un .tmp vacío
         """
-        with open(self.state_file, 'w', encoding='utf-8') as f:
-            json.dump(self.state, f, indent=2, ensure_ascii=False)
+        if self._batch_depth:
+            self._pending_save = True
+            return
+
+        data = orjson.dumps(self.state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+        tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
+
+
+    @contextmanager
+    def batch(self):
+        """
+        Agrupo varias actualizaciones en una sola escritura a disco
+
+        Uso:
+            with state_manager.batch():
+                for video in videos:
+                    state_manager.register_video(...)
+
+        Se puede anidar; escribo cuando sale el batch más externo
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_save:
+                self._pending_save = False
+                self._save_state()
 
 
     def register_video(
@@ -102,14 +149,24 @@ class StateManager:
             self._save_state()
 
 
-    def mark_transcribed(self, video_id: str, transcription_path: str) -> None:
+    def mark_transcribed(
+        self,
+        video_id: str,
+        transcription_path: str,
+        duration: Optional[float] = None
+    ) -> None:
         """
         Marco un video como transcrito y guardo la ruta del archivo de transcripción
+
+        duration (fin del último segmento, en segundos) queda guardada para que
+        la UI no tenga que volver a leer el JSON de la transcripción.
+        None = desconocida (se pisa el valor de una transcripción anterior)
         """
         if video_id in self.state:
             self.state[video_id]['transcribed'] = True
             self.state[video_id]['transcription_path'] = transcription_path
             self.state[video_id]['transcript_path'] = transcription_path  # Alias
+            self.state[video_id]['transcript_duration'] = duration
             self.state[video_id]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             self._save_state()
 
@@ -166,6 +223,30 @@ class StateManager:
         return self.state.get(video_id)
 
 
+    def get_states(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Obtengo el estado de varios videos en una sola llamada
+
+        Útil para renders de tablas: un solo acceso al state en lugar de
+        una llamada por video. Los videos no registrados no aparecen.
+        """
+        return {
+            video_id: self.state[video_id]
+            for video_id in video_ids
+            if video_id in self.state
+        }
+
+
+    def get_known_ids(self) -> Set[str]:
+        """
+        Obtengo los IDs de todos los videos registrados
+
+        Para filtrar videos nuevos con un solo set en lugar de llamar
+        get_video_state por cada video
+        """
+        return set(self.state)
+
+
     def get_all_videos(self) -> Dict:
         """
         Obtengo todos los videos registrados
@@ -7,7 +7,12 @@ Usa ffmpeg para cortar con precisión y opcionalmente cambiar aspect ratio.
 """
 
 import json
+import os
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 from rich.console import Console
@@ -19,6 +24,213 @@ from src.reframer import FaceReframer
 
 logger = get_logger(__name__)
 
+# Tope de procesos ffmpeg simultáneos: cada ffmpeg ya usa varios threads,
+# más de 4 en paralelo satura disco/encoder sin ganar throughput
+MAX_EXPORT_WORKERS = 4
+
+# Tope de threads por proceso ffmpeg: con varios ffmpeg en paralelo, dejar
+# que cada uno use todos los cores sobre-suscribe la CPU
+MAX_FFMPEG_THREADS = 4
+
+# Máximo de clips por invocación de ffmpeg en modo stream copy
+# (cada clip es un input abierto en el mismo proceso)
+MAX_COPY_BATCH_SIZE = 16
+
+# Prefijo de todos los ffmpeg de export
+# Sin banner ni estadísticas de progreso: stderr solo trae errores, así los
+# workers no pasan la mitad del tiempo drenando el pipe de logs
+FFMPEG_CMD = ["ffmpeg", "-hide_banner", "-nostats", "-loglevel", "error"]
+
+# Encoder H.264 por software (default, funciona en cualquier máquina)
+SOFTWARE_ENCODER_ARGS = ("-c:v", "libx264", "-preset", "fast", "-crf", "23")
+
+# Encoders H.264 por hardware en orden de preferencia, con sus args de calidad
+# Los filtros (crop, subtítulos, logo) siguen corriendo en CPU: solo cambia el encode
+HW_ENCODERS = (
+    ("h264_videotoolbox", ("-c:v", "h264_videotoolbox", "-b:v", "8M")),  # macOS / Apple Silicon
+    ("h264_nvenc", ("-c:v", "h264_nvenc", "-preset", "p4", "-cq", "23")),  # NVIDIA
+)
+
+
+# Salida por pipe (EXPORT_BUFFERED_OUTPUT=1): ffmpeg escribe a stdout y un
+# thread de I/O vuelca a disco, así un disco lento no frena al encoder
+PIPE_READ_SIZE = 1024 * 1024  # Lecturas de 1 MB desde el pipe
+PIPE_MIN_WRITE = 64 * 1024  # Junto al menos 64 KB por write
+PIPE_BUFFER_LIMIT = 256 * 1024 * 1024  # Tope en RAM antes de frenar a ffmpeg
+
+# Un pipe no es seekable: +faststart (mover el moov al inicio) no es posible,
+# así que la salida por pipe es MP4 fragmentado
+PIPE_MP4_ARGS = ("-f", "mp4", "-movflags", "frag_keyframe+empty_moov+default_base_moof")
+
+
+def buffered_output_enabled() -> bool:
+    """True si EXPORT_BUFFERED_OUTPUT pide escribir los clips vía pipe"""
+    return os.getenv("EXPORT_BUFFERED_OUTPUT", "0").strip().lower() in ("1", "true", "yes")
+
+
+def run_ffmpeg_buffered(cmd: List[str], output_path: Path) -> subprocess.CompletedProcess:
+    """
+    Corro un comando que escribe a stdout y vuelco su salida a output_path
+
+    - Un thread lee el pipe en bloques de 1 MB a un buffer en memoria (deque)
+    - El thread que llama drena el buffer a disco en writes de >= 64 KB
+    - Si el buffer pasa PIPE_BUFFER_LIMIT, el lector espera: ffmpeg se frena
+      en vez de crecer en RAM sin límite
+
+    Escribo a un .part y lo renombro solo si ffmpeg terminó bien Y toda su
+    salida llegó a disco; en cualquier otro caso el .part se borra.
+
+    Returns:
+        CompletedProcess con returncode y stderr (texto), como subprocess.run
+    """
+    buffer = deque()
+    buffered_bytes = 0
+    reader_done = False
+    aborted = False
+    cond = threading.Condition()
+
+    part_path = output_path.with_name(output_path.name + ".part")
+    fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError:
+        os.close(fd)
+        part_path.unlink()
+        raise
+
+    def read_stdout():
+        nonlocal buffered_bytes, reader_done
+        try:
+            while True:
+                chunk = process.stdout.read(PIPE_READ_SIZE)
+                if not chunk:
+                    break
+                with cond:
+                    while buffered_bytes >= PIPE_BUFFER_LIMIT and not aborted:
+                        cond.wait()
+                    if aborted:
+                        continue
+                    buffer.append(chunk)
+                    buffered_bytes += len(chunk)
+                    cond.notify_all()
+        finally:
+            with cond:
+                reader_done = True
+                cond.notify_all()
+
+    stderr_chunks = []
+    reader = threading.Thread(target=read_stdout, daemon=True)
+    # stderr también se drena en paralelo: si su pipe se llena, ffmpeg se bloquea
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()),
+        daemon=True
+    )
+    reader.start()
+    stderr_reader.start()
+
+    # Solo True si el drenado terminó sin errores: un write fallido (ej. disco
+    # lleno) con ffmpeg ya terminado en 0 no debe promover un .part truncado
+    completed = False
+    try:
+        while True:
+            with cond:
+                while not reader_done and (not buffer or buffered_bytes < PIPE_MIN_WRITE):
+                    cond.wait()
+                if not buffer:
+                    break
+                pending = list(buffer)
+                buffer.clear()
+                buffered_bytes = 0
+                cond.notify_all()
+            data = b"".join(pending)
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        completed = True
+    except BaseException:
+        # Error de escritura (ej. disco lleno): corto ffmpeg y libero al lector
+        process.kill()
+        with cond:
+            aborted = True
+            buffer.clear()
+            cond.notify_all()
+        raise
+    finally:
+        os.close(fd)
+        reader.join()
+        stderr_reader.join()
+        returncode = process.wait()
+        if completed and returncode == 0:
+            os.replace(part_path, output_path)
+        elif part_path.exists():
+            part_path.unlink()
+
+    stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    return subprocess.CompletedProcess(cmd, returncode, stdout=None, stderr=stderr)
+
+
+def _encoder_works(encoder: str) -> bool:
+    """
+    Pruebo un encoder codificando un frame sintético
+
+    Que ffmpeg liste el encoder no alcanza: un build con NVENC en una
+    máquina sin GPU NVIDIA lo lista igual y falla al usarlo
+    """
+    probe = [
+        *FFMPEG_CMD,
+        "-f", "lavfi", "-i", "color=size=256x256:rate=30",
+        "-frames:v", "1",
+        "-c:v", encoder,
+        "-f", "null", "-"
+    ]
+    try:
+        result = subprocess.run(probe, capture_output=True, timeout=15, check=False)
+        return result.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+@lru_cache(maxsize=1)
+def detect_video_encoder_args() -> tuple:
+    """
+    Elijo el encoder de video una sola vez por proceso
+
+    VIDEO_ENCODER (env) permite forzarlo:
+    - "auto" (default): primer encoder por hardware que funcione, si no libx264
+    - "libx264": siempre software
+    - "h264_videotoolbox" / "h264_nvenc": ese encoder si funciona, si no libx264
+
+    Returns:
+        Args de ffmpeg para el encoder ("-c:v", ...)
+    """
+    requested = os.getenv("VIDEO_ENCODER", "auto").strip().lower()
+
+    if requested != "libx264":
+        for encoder, args in HW_ENCODERS:
+            if requested not in ("auto", encoder):
+                continue
+            if _encoder_works(encoder):
+                logger.info(f"Usando encoder por hardware: {encoder}")
+                return args
+
+    logger.info("Usando encoder por software: libx264")
+    return SOFTWARE_ENCODER_ARGS
+
+
+def can_stream_copy(
+    aspect_ratio: Optional[str],
+    add_subtitles: bool,
+    add_logo: bool
+) -> bool:
+    """
+    True si el export es solo un corte (se puede hacer con -c copy)
+
+    Cualquier filtro de video (aspect ratio/face tracking, subtítulos
+    quemados, logo) obliga a re-encodear.
+    """
+    return not (aspect_ratio or add_subtitles or add_logo)
+
 
 class VideoExporter:
     """
@@ -44,6 +256,15 @@ class VideoExporter:
                 "Instala con: brew install ffmpeg (macOS) o apt install ffmpeg (Linux)"
             )
 
+        # Encoder de video (hardware si hay, cacheado por proceso)
+        self.video_codec_args = detect_video_encoder_args()
+
+        # Salida final de cada clip vía pipe + thread de I/O (opcional)
+        self.buffered_output = buffered_output_enabled()
+
+        # Carpeta del video en el último export_clips (sin subcarpetas por estilo)
+        self.last_output_dir: Optional[Path] = None
+
 
     def _check_ffmpeg(self) -> bool:
         """
@@ -81,11 +302,17 @@ class VideoExporter:
         add_logo: bool = False,
         logo_path: Optional[str] = "assets/logo.png",
         logo_position: str = "top-right",
-        logo_scale: float = 0.1
+        logo_scale: float = 0.1,
+        max_workers: Optional[int] = None,
+        stream_copy: bool = False
     ) -> List[str]:
         """
         Exporto todos los clips de un video
 
+        Cada clip es un job ffmpeg independiente, así que los lanzo en paralelo
+        con un pool acotado de threads (ffmpeg corre como subproceso, el GIL no
+        estorba). El resultado conserva el orden original de los clips.
+
         Args:
             video_path: Ruta al video original
             clips: Lista de dicts con {clip_id, start_time, end_time, text_preview}
@@ -103,6 +330,11 @@ class VideoExporter:
             logo_path: Ruta al archivo del logo (ej. "assets/logo.png").
             logo_position: Posición del logo ("top-right", "top-left", "bottom-right", "bottom-left").
             logo_scale: Escala del logo relativa al ancho del video (0.1 = 10%).
+            max_workers: Número de clips exportados en paralelo
+                         (default: min(cpu_count, MAX_EXPORT_WORKERS))
+            stream_copy: Si True, corta sin re-encodear (-c copy). Solo aplica
+                         cuando no hay filtros de video (aspect ratio, subtítulos,
+                         logo); si hay alguno, se ignora y se re-encodea.
 
         Returns:
             Lista de rutas a los clips exportados
@@ -119,10 +351,44 @@ class VideoExporter:
         # Creo una subcarpeta específica para este video
         video_output_dir = self.output_dir / video_name
         video_output_dir.mkdir(parents=True, exist_ok=True)
+        self.last_output_dir = video_output_dir
 
         logger.info(f"Exportando clips a: {video_output_dir}")
 
-        exported_clips = []
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, MAX_EXPORT_WORKERS)
+        max_workers = max(1, min(max_workers, len(clips) or 1))
+
+        # Reparto los cores entre los ffmpeg simultáneos (-threads por proceso)
+        ffmpeg_threads = max(1, min(MAX_FFMPEG_THREADS, (os.cpu_count() or 1) // max_workers))
+
+        # Resuelvo la carpeta de cada clip en el thread principal
+        # (evita carreras de mkdir entre workers)
+        clip_output_dirs = []
+        for clip in clips:
+            clip_output_dir = video_output_dir
+
+            if organize_by_style and clip_styles:
+                style = clip_styles.get(clip['clip_id'], 'unclassified')
+
+                # Crear subcarpeta por estilo
+                clip_output_dir = video_output_dir / style
+                clip_output_dir.mkdir(parents=True, exist_ok=True)
+
+            clip_output_dirs.append(clip_output_dir)
+
+        logger.info(
+            f"Exportando {len(clips)} clips con {max_workers} worker(s) en paralelo "
+            f"({ffmpeg_threads} thread(s) de ffmpeg c/u)"
+        )
+
+        # Sin filtros de video los clips son solo cortes: en vez de un ffmpeg
+        # por clip, agrupo los clips en lotes y cada lote es UNA invocación
+        # (un lote por worker, ver _copy_clips_batch)
+        use_stream_copy = stream_copy and can_stream_copy(aspect_ratio, add_subtitles, add_logo)
+        batch_size = max(1, min(MAX_COPY_BATCH_SIZE, -(-len(clips) // max_workers))) if use_stream_copy else 1
+
+        exported_by_index: Dict[int, str] = {}
 
         # Progress bar
         with Progress() as progress:
@@ -131,41 +397,60 @@ class VideoExporter:
                 total=len(clips)
             )
 
-            for clip in clips:
-                # Determinar carpeta de salida según estilo (si aplica)
-                clip_output_dir = video_output_dir
-
-                if organize_by_style and clip_styles:
-                    clip_id = clip['clip_id']
-                    style = clip_styles.get(clip_id, 'unclassified')
-
-                    # Crear subcarpeta por estilo
-                    clip_output_dir = video_output_dir / style
-                    clip_output_dir.mkdir(parents=True, exist_ok=True)
-
-                clip_path = self._export_single_clip(
-                    video_path=video_path,
-                    clip=clip,
-                    video_name=video_name,
-                    output_dir=clip_output_dir,
-                    aspect_ratio=aspect_ratio,
-                    add_subtitles=add_subtitles,
-                    transcript_path=transcript_path,
-                    subtitle_style=subtitle_style,
-                    subtitle_emphasis_keywords=subtitle_emphasis_keywords,
-                    enable_face_tracking=enable_face_tracking,
-                    face_tracking_strategy=face_tracking_strategy,
-                    face_tracking_sample_rate=face_tracking_sample_rate,
-                    add_logo=add_logo,
-                    logo_path=logo_path,
-                    logo_position=logo_position,
-                    logo_scale=logo_scale
-                )
-
-                if clip_path:
-                    exported_clips.append(str(clip_path))
-
-                progress.update(task, advance=1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                if use_stream_copy:
+                    futures = {}
+                    for start in range(0, len(clips), batch_size):
+                        indices = list(range(start, min(start + batch_size, len(clips))))
+                        future = executor.submit(
+                            self._copy_clips_batch,
+                            video_path,
+                            [(clips[idx], clip_output_dirs[idx]) for idx in indices]
+                        )
+                        futures[future] = indices
+                else:
+                    futures = {
+                        executor.submit(
+                            self._export_single_clip,
+                            video_path=video_path,
+                            clip=clip,
+                            video_name=video_name,
+                            output_dir=clip_output_dir,
+                            aspect_ratio=aspect_ratio,
+                            add_subtitles=add_subtitles,
+                            transcript_path=transcript_path,
+                            subtitle_style=subtitle_style,
+                            subtitle_emphasis_keywords=subtitle_emphasis_keywords,
+                            enable_face_tracking=enable_face_tracking,
+                            face_tracking_strategy=face_tracking_strategy,
+                            face_tracking_sample_rate=face_tracking_sample_rate,
+                            add_logo=add_logo,
+                            logo_path=logo_path,
+                            logo_position=logo_position,
+                            logo_scale=logo_scale,
+                            ffmpeg_threads=ffmpeg_threads
+                        ): [idx]
+                        for idx, (clip, clip_output_dir) in enumerate(zip(clips, clip_output_dirs))
+                    }
+
+                for future in as_completed(futures):
+                    indices = futures[future]
+                    try:
+                        result = future.result()
+                        clip_paths = result if use_stream_copy else [result]
+                    except Exception as e:
+                        clip_ids = ", ".join(str(clips[idx]['clip_id']) for idx in indices)
+                        logger.error(f"Error exportando clip(s) {clip_ids}: {e}")
+                        clip_paths = [None] * len(indices)
+
+                    for idx, clip_path in zip(indices, clip_paths):
+                        if clip_path:
+                            exported_by_index[idx] = str(clip_path)
+
+                    progress.update(task, advance=len(indices))
+
+        # Mantengo el orden original de los clips
+        exported_clips = [exported_by_index[idx] for idx in sorted(exported_by_index)]
 
         return exported_clips
 
@@ -187,7 +472,8 @@ class VideoExporter:
         add_logo: bool = False,
         logo_path: Optional[str] = "assets/logo.png",
         logo_position: str = "top-right",
-        logo_scale: float = 0.1
+        logo_scale: float = 0.1,
+        ffmpeg_threads: Optional[int] = None
     ) -> Optional[Path]:
         clip_id = clip['clip_id']
         start_time = clip['start_time']
@@ -196,6 +482,10 @@ class VideoExporter:
 
         output_filename = f"{clip_id}.mp4"
         output_path = output_dir / output_filename
+
+        # Opción de salida -threads (vacía = ffmpeg decide)
+        threads_args = ["-threads", str(ffmpeg_threads)] if ffmpeg_threads else []
+
         
         # Define paths for temporary files
         temp_path_step1 = output_dir / f"{clip_id}_step1_temp.mp4"
@@ -273,7 +563,7 @@ class VideoExporter:
                  subtitle_filter = self._get_subtitle_filter(subtitle_path_escaped, subtitle_style)
                  simple_filters.append(subtitle_filter)
 
-            cmd = ["ffmpeg"] + inputs
+            cmd = FFMPEG_CMD + inputs
             
             # If a logo is present, we must use filter_complex
             if logo_input_idx != -1:
@@ -309,9 +599,10 @@ class VideoExporter:
             if needs_two_steps:
                 cmd.extend(["-sn"])  # Discard subtitle streams
 
-            cmd.extend(["-map", f"{audio_input_idx}:a?", "-c:v", "libx264", "-c:a", "aac", "-preset", "fast", "-crf", "23", "-y", str(first_step_output)])
+            cmd.extend(["-map", f"{audio_input_idx}:a?", *self.video_codec_args, "-c:a", "aac", *threads_args])
 
-            result1 = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            # El intermedio del paso 1 es un temporal local: solo la salida final va por pipe
+            result1 = self._run_ffmpeg(cmd, first_step_output, buffered=not needs_two_steps)
             if result1.returncode != 0:
                 logger.error(f"Error in video processing (Step 1) for clip {clip_id}: {result1.stderr}")
                 return None
@@ -321,9 +612,9 @@ class VideoExporter:
                 logger.info("Applying subtitles in a second step to avoid duplication bug.")
                 subtitle_path_escaped = str(subtitle_file).replace('\\', '\\\\').replace(':', '\\:')
                 subtitle_filter = self._get_subtitle_filter(subtitle_path_escaped, subtitle_style)
-                cmd2 = ["ffmpeg", "-i", str(first_step_output), "-vf", subtitle_filter, "-c:a", "copy", "-y", str(output_path)]
+                cmd2 = [*FFMPEG_CMD, "-i", str(first_step_output), "-vf", subtitle_filter, *self.video_codec_args, "-c:a", "copy", *threads_args]
                 
-                result2 = subprocess.run(cmd2, capture_output=True, text=True, check=False)
+                result2 = self._run_ffmpeg(cmd2, output_path)
                 if result2.returncode != 0:
                     logger.error(f"Error adding subtitles (Step 2) for clip {clip_id}: {result2.stderr}")
                     first_step_output.rename(output_path) # Fallback to the version without subtitles
@@ -338,6 +629,117 @@ class VideoExporter:
             if temp_reframed_path and temp_reframed_path.exists(): temp_reframed_path.unlink()
 
 
+    def _run_ffmpeg(
+        self,
+        cmd: List[str],
+        output_path: Path,
+        buffered: bool = True
+    ) -> subprocess.CompletedProcess:
+        """
+        Corro un ffmpeg de re-encode agregando la salida al final del comando
+
+        Con self.buffered_output la salida va por pipe:1 (MP4 fragmentado) y
+        run_ffmpeg_buffered la escribe a disco; si no, ffmpeg escribe directo.
+        """
+        if self.buffered_output and buffered:
+            return run_ffmpeg_buffered([*cmd, *PIPE_MP4_ARGS, "pipe:1"], output_path)
+
+        return subprocess.run([*cmd, "-y", str(output_path)], capture_output=True, text=True, check=False)
+
+
+    def _copy_clips_batch(
+        self,
+        video_path: Path,
+        jobs: List[tuple]
+    ) -> List[Optional[Path]]:
+        """
+        Corto varios clips con una sola invocación de ffmpeg (stream copy)
+
+        Cada clip es un input con su propio -ss/-t (seek por keyframe, sin
+        decodificar) mapeado a su propio output: un solo proceso, un solo
+        arranque de ffmpeg para todo el lote.
+
+        Args:
+            video_path: Video original
+            jobs: Lista de (clip, output_dir)
+
+        Returns:
+            Rutas exportadas en el mismo orden que jobs (None si ese clip falló)
+        """
+        output_paths = [output_dir / f"{clip['clip_id']}.mp4" for clip, output_dir in jobs]
+
+        cmd = [*FFMPEG_CMD, "-y"]
+        for clip, _ in jobs:
+            duration = clip['end_time'] - clip['start_time']
+            cmd.extend(["-ss", str(clip['start_time']), "-t", str(duration), "-i", str(video_path)])
+
+        for input_idx, output_path in enumerate(output_paths):
+            cmd.extend([
+                "-map", f"{input_idx}:v",
+                "-map", f"{input_idx}:a?",
+                "-c", "copy",
+                "-avoid_negative_ts", "make_zero",
+                str(output_path)
+            ])
+
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        if result.returncode == 0:
+            for (clip, _), output_path in zip(jobs, output_paths):
+                logger.info(f"✓ Exported clip {clip['clip_id']} (stream copy): {output_path.name}")
+            return output_paths
+
+        # Si el lote falla, reintento clip por clip para no perder los que sí funcionan
+        logger.warning(f"Batch stream copy failed, retrying clip by clip: {result.stderr[-500:]}")
+        return [
+            self._copy_clip_streams(
+                video_path,
+                clip['clip_id'],
+                clip['start_time'],
+                clip['end_time'] - clip['start_time'],
+                output_path
+            )
+            for (clip, _), output_path in zip(jobs, output_paths)
+        ]
+
+
+    def _copy_clip_streams(
+        self,
+        video_path: Path,
+        clip_id: int,
+        start_time: float,
+        duration: float,
+        output_path: Path
+    ) -> Optional[Path]:
+        """
+        Corto un clip copiando los streams tal cual (sin re-encodear)
+
+        DECISIÓN: -c copy cuando no hay aspect ratio, subtítulos ni logo
+        - El corte pasa de encode x264 (CPU) a copiar bytes (I/O): 10-50x más rápido
+        - -ss antes de -i busca por keyframe: el clip arranca en el keyframe
+          anterior a start_time (puede empezar hasta un GOP antes)
+        - -avoid_negative_ts make_zero normaliza los timestamps del clip a 0
+        """
+        cmd = [
+            *FFMPEG_CMD,
+            "-ss", str(start_time),
+            "-i", str(video_path),
+            "-t", str(duration),
+            "-map", "0:v",
+            "-map", "0:a?",
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
+            "-y", str(output_path)
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            logger.error(f"Error copying streams for clip {clip_id}: {result.stderr}")
+            return None
+
+        logger.info(f"✓ Exported clip {clip_id} (stream copy): {output_path.name}")
+        return output_path
+
+
     def _get_logo_overlay_filter(
         self,
         position: str = "top-right",
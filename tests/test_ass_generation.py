@@ -188,6 +188,33 @@ class TestASSGeneration:
 
         print("✓ Dialogue event format is correct")
 
+    def test_transcript_parsed_once_per_clip_batch(self):
+        """Test that several clips from one transcript share a single parse."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            transcript_path = Path(tmpdir) / "transcript.json"
+
+            with open(transcript_path, 'w') as f:
+                json.dump(self.create_mock_transcript(), f)
+
+            generator = SubtitleGenerator()
+
+            for idx, (start, end) in enumerate([(0.0, 2.5), (2.5, 5.0)]):
+                result = generator.generate_ass_for_clip(
+                    transcript_path=str(transcript_path),
+                    clip_start=start,
+                    clip_end=end,
+                    output_path=str(Path(tmpdir) / f"clip_{idx}.ass")
+                )
+                assert result is not None
+
+            # Same cached list, and clip-relative offsets never leak into it
+            segments = generator._load_segments(str(transcript_path))
+            assert segments is generator._segments_cache[str(transcript_path)][1]
+            assert segments[1]["start"] == 2.5
+            assert segments[1]["words"][0]["start"] == 2.5
+
+            print("✓ Transcript parsed once and left unmodified")
+
 
 if __name__ == "__main__":
     test = TestASSGeneration()
@@ -199,6 +226,7 @@ if __name__ == "__main__":
     test.test_keyword_highlighting()
     test.test_ass_time_format()
     test.test_dialogue_event_format()
+    test.test_transcript_parsed_once_per_clip_batch()
 
     print("\n" + "=" * 50)
     print("✅ All ASS generation tests passed!")
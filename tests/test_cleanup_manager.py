@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""Tests para CleanupManager (listado y eliminación de artifacts por video)"""
+
+import os
+
+from src.cleanup_manager import CleanupManager, _iter_files
+
+
+def _make_manager(tmp_path, monkeypatch):
+    # CleanupManager abre el StateManager en temp/project_state.json (relativo al cwd)
+    monkeypatch.chdir(tmp_path)
+    return CleanupManager()
+
+
+def _write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_get_video_artifacts_reports_sizes(tmp_path, monkeypatch):
+    """Test: Cada artifact trae exists/size correctos (incluye clips y temporales)"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    _write(tmp_path / "downloads" / "video_a.mp4", 100)
+    _write(tmp_path / "temp" / "video_a_transcript.json", 10)
+    _write(tmp_path / "output" / "video_a" / "1.mp4", 20)
+    _write(tmp_path / "output" / "video_a" / "viral" / "2.mp4", 30)
+    _write(tmp_path / "output" / "video_a" / "3_temp.mp4", 5)
+
+    manager.state_manager.register_video("video_a", "video_a.mp4")
+    manager.state_manager.mark_transcribed("video_a", "temp/video_a_transcript.json")
+    manager.state_manager.mark_clips_generated("video_a", [], "temp/video_a_clips.json")
+
+    artifacts = manager.get_video_artifacts("video_a")
+
+    assert artifacts['download']['exists'] and artifacts['download']['size'] == 100
+    assert artifacts['transcript']['size'] == 10
+    assert not artifacts['clips_metadata']['exists']
+    assert artifacts['clips_metadata']['size'] == 0
+    assert artifacts['output']['clip_count'] == 3
+    assert artifacts['output']['size'] == 55
+    assert artifacts['temp_files']['file_count'] == 1
+    assert artifacts['temp_files']['size'] == 5
+
+
+def test_get_video_artifacts_unknown_video(tmp_path, monkeypatch):
+    """Test: Un video que no está en el state no tiene artifacts"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    assert manager.get_video_artifacts("missing") == {}
+
+
+def test_iter_files_walks_nested_dirs_without_following_symlinks(tmp_path):
+    """Test: _iter_files recorre subcarpetas pero no entra a symlinks de directorios"""
+    _write(tmp_path / "root" / "a.mp4", 1)
+    _write(tmp_path / "root" / "sub" / "deep" / "b.srt", 1)
+    _write(tmp_path / "elsewhere" / "c.mp4", 1)
+    os.symlink(tmp_path / "elsewhere", tmp_path / "root" / "link")
+
+    names = sorted(entry.name for entry in _iter_files(tmp_path / "root"))
+
+    assert names == ["a.mp4", "b.srt"]
+
+
+def test_temp_files_only_from_top_level_of_output(tmp_path, monkeypatch):
+    """Test: Solo los *_temp.mp4 del nivel superior cuentan como temporales"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    _write(tmp_path / "output" / "video_a" / "1_temp.mp4", 4)
+    _write(tmp_path / "output" / "video_a" / "viral" / "2_temp.mp4", 6)
+
+    manager.state_manager.register_video("video_a", "video_a.mp4")
+
+    artifacts = manager.get_video_artifacts("video_a")
+
+    # Sin clips generados no hay artifact 'output', pero sí temporales
+    assert 'output' not in artifacts
+    assert [p.name for p in artifacts['temp_files']['path']] == ["1_temp.mp4"]
+    assert artifacts['temp_files']['size'] == 4
+
+
+def test_artifacts_cached_until_deleted(tmp_path, monkeypatch):
+    """Test: get_video_artifacts reusa el escaneo hasta que se borra algo del video"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    _write(tmp_path / "output" / "video_a" / "1.mp4", 20)
+    manager.state_manager.register_video("video_a", "video_a.mp4")
+    manager.state_manager.mark_clips_generated("video_a", [])
+
+    first = manager.get_video_artifacts("video_a")
+    assert manager.get_video_artifacts("video_a") is first
+
+    results = manager.delete_video_artifacts("video_a", ['output'])
+
+    assert results == {'output': True}
+    assert not manager.get_video_artifacts("video_a")['output']['exists']
+
+
+def test_clean_cache_removes_residuals_only(tmp_path, monkeypatch):
+    """Test: La limpieza de residuales borra locks/temporales y deja los clips"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    keep = [
+        _write(tmp_path / "output" / "video_a" / "1.mp4", 1),
+        _write(tmp_path / "output" / "video_a" / "1.srt", 1),
+        _write(tmp_path / "temp" / "video_a_transcript.json", 1),
+    ]
+    residuals = [
+        _write(tmp_path / "temp" / "download.lock", 1),
+        _write(tmp_path / "temp" / ".lock", 1),
+        _write(tmp_path / "output" / "video_a" / "2_temp.mp4", 1),
+        _write(tmp_path / "output" / "video_a" / "viral" / "temp_reframed_3.mp4", 1),
+        _write(tmp_path / "output" / "video_a" / ".DS_Store", 1),
+        _write(tmp_path / "output" / "video_a" / "4.srt", 1),  # SRT sin .mp4
+    ]
+
+    assert manager._clean_cache_and_residuals() is True
+
+    assert all(path.exists() for path in keep)
+    assert not any(path.exists() for path in residuals)
+
+
+def test_delete_reuses_given_artifacts(tmp_path, monkeypatch):
+    """Test: Con artifacts ya escaneados no se vuelve a recorrer el disco"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    _write(tmp_path / "output" / "video_a" / "1.mp4", 20)
+    manager.state_manager.register_video("video_a", "video_a.mp4")
+    manager.state_manager.mark_clips_generated("video_a", [])
+    artifacts = manager.get_video_artifacts("video_a")
+
+    def fail_scan(video_key):
+        raise AssertionError("should not rescan")
+
+    monkeypatch.setattr(manager, "_scan_video_artifacts", fail_scan)
+
+    assert manager.delete_video_artifacts("video_a", ['output'], artifacts=artifacts) == {'output': True}
+    assert not (tmp_path / "output" / "video_a").exists()
+
+
+def test_delete_all_project_data_wipes_and_recreates_dirs(tmp_path, monkeypatch):
+    """Test: El fresh start vacía downloads/temp/output, los recrea y resetea el state"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    _write(tmp_path / "downloads" / "video_a.mp4", 10)
+    _write(tmp_path / "temp" / "video_a_transcript.json", 10)
+    _write(tmp_path / "output" / "video_a" / "1.mp4", 10)
+    manager.state_manager.register_video("video_a", "video_a.mp4")
+
+    results = manager.delete_all_project_data()
+
+    assert list(results)[:3] == ['downloads', 'temp', 'output']
+    assert all(results.values())
+    for dir_name in ('downloads', 'output'):
+        assert (tmp_path / dir_name).is_dir()
+        assert not any((tmp_path / dir_name).iterdir())
+    assert not (tmp_path / "temp" / "video_a_transcript.json").exists()
+    assert manager.state_manager.get_all_videos() == {}
+
+
+def test_clean_cache_removes_only_old_logs(tmp_path, monkeypatch):
+    """Test: Solo se borran los logs cliper_*.log de más de 7 días"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    old_log = _write(tmp_path / "logs" / "cliper_old.log", 1)
+    new_log = _write(tmp_path / "logs" / "cliper_new.log", 1)
+    other = _write(tmp_path / "logs" / "other.log", 1)
+    ten_days_ago = old_log.stat().st_mtime - 10 * 24 * 60 * 60
+    for path in (old_log, other):
+        os.utime(path, (ten_days_ago, ten_days_ago))
+
+    assert manager._clean_cache_and_residuals() is True
+
+    assert not old_log.exists()
+    assert new_log.exists() and other.exists()
+
+
+def test_output_not_walked_without_clips(tmp_path, monkeypatch):
+    """Test: Sin clips generados solo se lista el nivel superior del output"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    _write(tmp_path / "output" / "video_a" / "1_temp.mp4", 4)
+    _write(tmp_path / "output" / "video_a" / "viral" / "2.mp4", 6)
+    manager.state_manager.register_video("video_a", "video_a.mp4")
+
+    def fail_walk(root):
+        raise AssertionError("should not walk subfolders")
+
+    monkeypatch.setattr("src.cleanup_manager._iter_files", fail_walk)
+
+    artifacts = manager.get_video_artifacts("video_a")
+
+    assert 'output' not in artifacts
+    assert artifacts['temp_files']['size'] == 4
+
+
+def test_empty_directory_reports_freed_bytes(tmp_path):
+    """Test: _empty_directory borra todo (sin seguir symlinks) y suma lo liberado"""
+    from src.cleanup_manager import _empty_directory
+
+    _write(tmp_path / "root" / "a.mp4", 10)
+    _write(tmp_path / "root" / "sub" / "deep" / "b.srt", 5)
+    target = _write(tmp_path / "elsewhere" / "c.mp4", 100)
+    os.symlink(tmp_path / "elsewhere", tmp_path / "root" / "link")
+
+    freed = _empty_directory(tmp_path / "root")
+
+    assert (tmp_path / "root").is_dir()
+    assert not any((tmp_path / "root").iterdir())
+    assert target.exists()
+    assert freed >= 15
+
+
+def test_get_artifacts_many_keeps_order_and_caches(tmp_path, monkeypatch):
+    """Test: El escaneo de varios videos respeta el orden y llena el cache"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    keys = [f"video_{idx}" for idx in range(5)]
+    for idx, key in enumerate(keys):
+        _write(tmp_path / "downloads" / f"{key}.mp4", idx + 1)
+        manager.state_manager.register_video(key, f"{key}.mp4")
+
+    results = manager._get_artifacts_many(keys)
+
+    assert [artifacts['download']['size'] for artifacts in results] == [1, 2, 3, 4, 5]
+    assert all(manager.get_video_artifacts(key) is artifacts for key, artifacts in zip(keys, results))
+    assert manager.get_total_sizes()['total_downloads'] == 15
+
+
+def test_delete_everything_removes_video_from_state(tmp_path, monkeypatch):
+    """Test: Si se borran todos los artifacts el video sale del state"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    _write(tmp_path / "downloads" / "video_a.mp4", 10)
+    manager.state_manager.register_video("video_a", "video_a.mp4")
+
+    results = manager.delete_video_artifacts("video_a")
+
+    assert all(results.values())
+    assert not (tmp_path / "downloads" / "video_a.mp4").exists()
+    assert manager.state_manager.get_video_state("video_a") is None
+
+
+
+def test_reprocess_cleanup_saves_state_once(tmp_path, monkeypatch):
+    """Test: Limpiar clips de varios videos escribe el state una sola vez"""
+    manager = _make_manager(tmp_path, monkeypatch)
+
+    for key in ("video_a", "video_b", "video_c"):
+        _write(tmp_path / "output" / key / "1.mp4", 1)
+        manager.state_manager.register_video(key, f"{key}.mp4")
+        manager.state_manager.mark_clips_generated(key, [])
+
+    # Cada escritura real del state termina en un os.replace del .tmp
+    replaced = []
+    real_replace = os.replace
+
+    def counting_replace(src, dst):
+        replaced.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr("src.utils.state_manager.os.replace", counting_replace)
+
+    results = manager.delete_all_except_downloads_and_transcripts()
+
+    assert all(results.values())
+    assert not (tmp_path / "output" / "video_a").exists()
+    assert len(replaced) == 1
+
+
+def test_file_size_treats_bad_paths_as_missing(tmp_path):
+    """Test: _file_size devuelve None si la ruta no existe o pasa por un archivo"""
+    from src.cleanup_manager import _file_size
+
+    file_path = _write(tmp_path / "a.json", 7)
+
+    assert _file_size(file_path) == 7
+    assert _file_size(tmp_path / "missing.json") is None
+    assert _file_size(file_path / "child.json") is None
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Tests para la búsqueda de texto por rango de tiempo de ClipsGenerator"""
+
+import random
+
+import pytest
+
+from src.clips_generator import ClipsGenerator
+
+
+def _make_generator():
+    # Los métodos de texto no usan el ClipFinder: evito construirlo
+    return ClipsGenerator.__new__(ClipsGenerator)
+
+
+def _linear_text(transcript_data, start_time, end_time):
+    """Recorrido lineal original: la referencia contra la que comparo el bisect"""
+    parts = []
+    for seg in transcript_data.get("segments", []):
+        if seg.get("start", 0.0) < end_time and seg.get("end", 0.0) > start_time:
+            text = seg.get("text", "").strip()
+            if text:
+                parts.append(text)
+    return " ".join(parts)
+
+
+def _seg(start, end, text):
+    return {"start": start, "end": end, "text": text}
+
+
+OVERLAPPING = {"segments": [
+    _seg(0.0, 20.0, "largo"),    # Segmento largo que tapa a los siguientes
+    _seg(2.0, 4.0, "corto"),     # Termina antes que el anterior (end decrece)
+    _seg(5.0, 6.0, "otro"),
+    _seg(21.0, 25.0, "final"),
+]}
+
+CONTIGUOUS = {"segments": [
+    _seg(0.0, 5.0, "uno"),
+    _seg(5.0, 10.0, " dos "),
+    _seg(10.0, 15.0, ""),
+    _seg(15.0, 20.0, "cuatro"),
+]}
+
+UNSORTED = {"segments": [
+    _seg(10.0, 15.0, "tercero"),
+    _seg(0.0, 5.0, "primero"),
+    _seg(5.0, 10.0, "segundo"),
+]}
+
+
+@pytest.mark.parametrize("data, start, end, expected", [
+    # Rango posterior a "corto": sólo "largo" lo cubre (reach, no ends[i-1])
+    (OVERLAPPING, 10.0, 12.0, "largo"),
+    (OVERLAPPING, 4.5, 5.5, "largo otro"),
+    (OVERLAPPING, 19.0, 22.0, "largo final"),
+    # Bordes exactos: tocar no es solaparse
+    (CONTIGUOUS, 5.0, 10.0, "dos"),
+    (CONTIGUOUS, 10.0, 15.0, ""),
+    (CONTIGUOUS, 4.0, 5.0, "uno"),
+    (CONTIGUOUS, 20.0, 30.0, ""),
+    (CONTIGUOUS, 0.0, 0.0, ""),
+    # Starts desordenados: cae al recorrido lineal y respeta el orden original
+    (UNSORTED, 0.0, 20.0, "tercero primero segundo"),
+    (UNSORTED, 5.0, 12.0, "tercero segundo"),
+])
+def test_text_for_timerange_cases(data, start, end, expected):
+    """Test: Casos borde del bisect coinciden con el recorrido lineal"""
+    generator = _make_generator()
+
+    assert generator._get_text_for_timerange(data, start, end) == expected
+    assert _linear_text(data, start, end) == expected
+
+
+def test_unsorted_segments_have_no_index():
+    """Test: Con starts desordenados no se arma índice (fallback lineal)"""
+    generator = _make_generator()
+
+    assert generator._build_segment_index(UNSORTED) is None
+    assert generator._build_segment_index(OVERLAPPING) is not None
+
+
+def test_text_for_timerange_matches_linear_scan():
+    """Test: Con transcripciones aleatorias el bisect da lo mismo que el recorrido lineal"""
+    generator = _make_generator()
+    rng = random.Random(1)
+
+    for trial in range(200):
+        current = 0.0
+        segments = []
+        for i in range(rng.randint(0, 40)):
+            current += rng.choice([0.0, 0.5, 1.0, 3.0])
+            end = current + rng.choice([0.0, 0.5, 2.0, 10.0])
+            segments.append(_seg(current, end, rng.choice(["", " a ", f"s{i}"])))
+        if trial % 7 == 0:
+            rng.shuffle(segments)
+        data = {"segments": segments}
+        index = generator._build_segment_index(data)
+
+        for _ in range(20):
+            start = rng.uniform(-1.0, current + 2.0)
+            end = start + rng.uniform(0.0, 15.0)
+            expected = _linear_text(data, start, end)
+            assert generator._get_text_for_timerange(data, start, end) == expected
+            assert generator._get_text_for_timerange(data, start, end, index) == expected
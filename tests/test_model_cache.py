@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Tests para el cache de modelos de cliper.py (preload sin bloquear el lock)"""
+
+import threading
+from collections import OrderedDict
+
+import cliper
+
+
+def test_load_runs_outside_lock_and_is_shared():
+    """Test: Mientras un modelo carga el lock queda libre y el segundo pedido espera el mismo"""
+    cache, lock = OrderedDict(), threading.Lock()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_factory():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(
+            cliper._cargar_cacheado(cache, lock, "base", slow_factory, max_items=2)
+        ))
+        for _ in range(2)
+    ]
+    threads[0].start()
+    assert started.wait(5)
+
+    # La carga está en curso y aun así el lock se puede tomar al instante
+    assert lock.acquire(timeout=0.5)
+    lock.release()
+
+    threads[1].start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results[0] is results[1]
+
+
+def test_liberar_modelos_skips_models_still_loading(monkeypatch):
+    """Test: Liberar modelos no espera ni descarta cargas en curso"""
+    loading, loaded = cliper.Future(), cliper.Future()
+    loaded.set_result(object())
+    monkeypatch.setattr(cliper, "_TRANSCRIBERS", OrderedDict(small=loading, base=loaded))
+
+    cliper._liberar_modelos()
+
+    assert list(cliper._TRANSCRIBERS) == ["small"]
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Tests para StateManager (persistencia del progreso por video)"""
+
+import pytest
+
+from src.utils.state_manager import StateManager
+
+
+def _make_manager(tmp_path):
+    return StateManager(state_file=str(tmp_path / "project_state.json"))
+
+
+def test_get_states_returns_registered_videos(tmp_path):
+    """Test: get_states retorna el estado de varios videos en una llamada"""
+    manager = _make_manager(tmp_path)
+    manager.register_video("video_a", "a.mp4")
+    manager.register_video("video_b", "b.mp4")
+
+    states = manager.get_states(["video_a", "video_b"])
+
+    assert set(states) == {"video_a", "video_b"}
+    assert states["video_a"]["filename"] == "a.mp4"
+    assert states["video_b"] is manager.get_video_state("video_b")
+
+
+def test_get_states_skips_unknown_videos(tmp_path):
+    """Test: Videos no registrados no aparecen en el resultado"""
+    manager = _make_manager(tmp_path)
+    manager.register_video("video_a", "a.mp4")
+
+    states = manager.get_states(["video_a", "missing"])
+
+    assert list(states) == ["video_a"]
+
+
+def test_mark_transcribed_stores_duration(tmp_path):
+    """Test: La duración de la transcripción queda persistida en el state"""
+    manager = _make_manager(tmp_path)
+    manager.register_video("video_a", "a.mp4")
+
+    manager.mark_transcribed("video_a", "temp/video_a_transcript.json", duration=125.4)
+
+    reloaded = _make_manager(tmp_path)
+    assert reloaded.get_video_state("video_a")["transcript_duration"] == 125.4
+
+
+def test_get_known_ids(tmp_path):
+    """Test: get_known_ids retorna el set de videos registrados"""
+    manager = _make_manager(tmp_path)
+    manager.register_video("video_a", "a.mp4")
+    manager.register_video("video_b", "b.mp4")
+
+    assert manager.get_known_ids() == {"video_a", "video_b"}
+
+
+def test_batch_defers_save_until_exit(tmp_path):
+    """Test: Dentro de batch() el state se escribe una sola vez al salir"""
+    manager = _make_manager(tmp_path)
+
+    with manager.batch():
+        manager.register_video("video_a", "a.mp4")
+        manager.register_video("video_b", "b.mp4")
+        assert not manager.state_file.exists()
+
+    reloaded = _make_manager(tmp_path)
+    assert reloaded.get_known_ids() == {"video_a", "video_b"}
+    assert not (tmp_path / "project_state.json.tmp").exists()
+
+
+def test_state_file_keeps_utf8_and_recovers_from_corruption(tmp_path):
+    """Test: El state se guarda en UTF-8 legible y un JSON corrupto no rompe la carga"""
+    manager = _make_manager(tmp_path)
+    manager.register_video("video_ñ", "Canción en vivo.mp4")
+
+    content = manager.state_file.read_text(encoding="utf-8")
+    assert "Canción en vivo.mp4" in content
+    assert _make_manager(tmp_path).get_video_state("video_ñ")["filename"] == "Canción en vivo.mp4"
+
+    manager.state_file.write_text("{ corrupto", encoding="utf-8")
+    assert _make_manager(tmp_path).get_all_videos() == {}
+
+
+def test_failed_save_leaves_previous_state_and_no_tmp(tmp_path):
+    """Test: Si el state no se puede serializar, no queda un .tmp vacío ni se pisa el archivo"""
+    manager = _make_manager(tmp_path)
+    manager.register_video("video_a", "a.mp4")
+
+    class OddFloat(float):
+        pass
+
+    manager.state["video_a"]["clips"] = [{"start_time": OddFloat(1.5)}]
+
+    with pytest.raises(TypeError):
+        manager._save_state()
+
+    assert not (tmp_path / "project_state.json.tmp").exists()
+    assert _make_manager(tmp_path).get_video_state("video_a")["clips"] == []
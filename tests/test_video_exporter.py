@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Tests para VideoExporter y helpers de ffmpeg (sin correr ffmpeg real)"""
+
+import errno
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from src import video_exporter
+from src.video_exporter import VideoExporter, run_ffmpeg_buffered
+
+
+def test_buffered_output_promotes_part_on_success(tmp_path):
+    """Test: Si el comando termina bien, el .part se renombra a la salida final"""
+    output_path = tmp_path / "out.mp4"
+
+    result = run_ffmpeg_buffered(["head", "-c", "10", "/dev/zero"], output_path)
+
+    assert result.returncode == 0
+    assert output_path.read_bytes() == b"\0" * 10
+    assert not (tmp_path / "out.mp4.part").exists()
+
+
+def test_buffered_output_discards_part_when_write_fails(tmp_path, monkeypatch):
+    """Test: Un write fallido no promueve el .part aunque el proceso haya salido con 0"""
+    output_path = tmp_path / "out.mp4"
+
+    def failing_write(fd, data):
+        time.sleep(0.2)  # Dejo que el proceso termine (returncode 0) antes de fallar
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(video_exporter.os, "write", failing_write)
+
+    with pytest.raises(OSError):
+        run_ffmpeg_buffered(["head", "-c", "10", "/dev/zero"], output_path)
+
+    assert not output_path.exists()
+    assert not (tmp_path / "out.mp4.part").exists()
+
+
+@pytest.fixture
+def fresh_encoder_cache():
+    """detect_video_encoder_args está cacheado por proceso: lo limpio antes y después"""
+    video_exporter.detect_video_encoder_args.cache_clear()
+    yield
+    video_exporter.detect_video_encoder_args.cache_clear()
+
+
+def _ok(cmd, *args, **kwargs):
+    return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+
+def _make_exporter(tmp_path, monkeypatch):
+    # Sin ffmpeg real: _check_ffmpeg y el encoder salen del subprocess.run mockeado
+    monkeypatch.setenv("VIDEO_ENCODER", "libx264")
+    monkeypatch.setattr(video_exporter.subprocess, "run", _ok)
+    return VideoExporter(output_dir=str(tmp_path / "output"))
+
+
+def test_libx264_skips_hardware_probes(monkeypatch, fresh_encoder_cache):
+    """Test: VIDEO_ENCODER=libx264 no prueba ningún encoder por hardware"""
+    monkeypatch.setenv("VIDEO_ENCODER", "libx264")
+
+    def no_probe(encoder):
+        raise AssertionError(f"probed {encoder}")
+
+    monkeypatch.setattr(video_exporter, "_encoder_works", no_probe)
+
+    assert video_exporter.detect_video_encoder_args() == video_exporter.SOFTWARE_ENCODER_ARGS
+
+
+def test_auto_uses_first_working_hardware_encoder(monkeypatch, fresh_encoder_cache):
+    """Test: En modo auto se usa el primer encoder por hardware que funciona"""
+    monkeypatch.setenv("VIDEO_ENCODER", "auto")
+    monkeypatch.setattr(video_exporter, "_encoder_works", lambda encoder: encoder == "h264_nvenc")
+
+    assert video_exporter.detect_video_encoder_args() == dict(video_exporter.HW_ENCODERS)["h264_nvenc"]
+
+
+def test_export_keeps_clip_order_when_finishing_out_of_order(tmp_path, monkeypatch, fresh_encoder_cache):
+    """Test: Los clips exportados vuelven en el orden original aunque terminen desordenados"""
+    exporter = _make_exporter(tmp_path, monkeypatch)
+    video_path = tmp_path / "video.mp4"
+    video_path.write_bytes(b"x")
+    clips = [{"clip_id": clip_id, "start_time": 0.0, "end_time": 1.0} for clip_id in (1, 2, 3)]
+
+    def fake_export(clip, output_dir, **kwargs):
+        # El primer clip termina último, el último termina primero
+        time.sleep(0.05 * (4 - clip["clip_id"]))
+        return output_dir / f"{clip['clip_id']}.mp4"
+
+    monkeypatch.setattr(exporter, "_export_single_clip", fake_export)
+
+    exported = exporter.export_clips(str(video_path), clips, video_name="video", max_workers=3)
+
+    assert [Path(path).name for path in exported] == ["1.mp4", "2.mp4", "3.mp4"]
+
+
+def test_failed_copy_batch_falls_back_to_per_clip_copies(tmp_path, monkeypatch, fresh_encoder_cache):
+    """Test: Si el lote de stream copy falla se reintenta clip por clip"""
+    exporter = _make_exporter(tmp_path, monkeypatch)
+    commands = []
+
+    def fake_run(cmd, *args, **kwargs):
+        commands.append(cmd)
+        batch = cmd.count("-i") > 1
+        broken_clip = "-ss" in cmd and cmd[cmd.index("-ss") + 1] == "20.0" and not batch
+        return subprocess.CompletedProcess(cmd, 1 if batch or broken_clip else 0, stdout="", stderr="boom")
+
+    monkeypatch.setattr(video_exporter.subprocess, "run", fake_run)
+
+    jobs = [
+        ({"clip_id": 1, "start_time": 0.0, "end_time": 10.0}, tmp_path),
+        ({"clip_id": 2, "start_time": 20.0, "end_time": 30.0}, tmp_path),
+        ({"clip_id": 3, "start_time": 40.0, "end_time": 50.0}, tmp_path),
+    ]
+
+    results = exporter._copy_clips_batch(tmp_path / "video.mp4", jobs)
+
+    assert results == [tmp_path / "1.mp4", None, tmp_path / "3.mp4"]
+    assert commands[0].count("-i") == 3
+    assert len(commands) == 4  # Lote + un reintento por clip